@@ -28,66 +28,123 @@ __email__ = "chenier.felix@uqam.ca"
 __license__ = "Apache 2.0"
 
 
-# Import classes
+import importlib
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+# Import the core classes and modules
+from kineticstoolkit import _repr, config  # noqa: F401 unused-import
 from kineticstoolkit.timeseries import TimeSeries, TimeSeriesEvent  # noqa
-from kineticstoolkit.player import Player as Player  # noqa
-
-# Import functions
-from kineticstoolkit.tools import change_defaults  # noqa
-from kineticstoolkit.files import load, save, read_c3d, write_c3d  # noqa
-from kineticstoolkit import _repr  # noqa
-
-# Import modules
-from kineticstoolkit import filters  # noqa
-from kineticstoolkit import kinematics  # noqa
-from kineticstoolkit import cycles  # noqa
-from kineticstoolkit import doc  # noqa
-from kineticstoolkit import gui  # noqa
-from kineticstoolkit import geometry  # noqa
-from kineticstoolkit import dev  # noqa
-from kineticstoolkit import config  # noqa
-
-
-# Check if a serious warning has been issued for this version.
-try:
-    from requests_cache import CachedSession  # noqa
-    from datetime import timedelta  # noqa
-    import json  # noqa
-    import warnings  # noqa
-
-    session = CachedSession(
-        "kineticstoolkit",
-        backend="filesystem",
-        use_temp=True,
-        expire_after=timedelta(hours=24),
-    )
-    res = session.get(
-        "https://kineticstoolkit.uqam.ca/api/import_check.php",
-        params={"version": config.version},
-    )
-    contents = json.loads(res.content)
-    if res.ok and "warning" in contents:
-        warnings.warn(contents["warning"])
-except Exception:
-    pass
+
+# The other classes, functions and modules are imported on first use, since
+# they depend on slow-to-import packages such as Matplotlib, ezc3d or
+# scipy.signal.
+_LAZY_MODULES = [
+    "filters",
+    "kinematics",
+    "cycles",
+    "doc",
+    "gui",
+    "geometry",
+    "dev",
+    "files",
+    "pipeline",
+    "player",
+    "tools",
+]
+_LAZY_ATTRIBUTES = {
+    "Player": ("kineticstoolkit.player", "Player"),
+    "Pipeline": ("kineticstoolkit.pipeline", "Pipeline"),
+    "change_defaults": ("kineticstoolkit.tools", "change_defaults"),
+    "load": ("kineticstoolkit.files", "load"),
+    "save": ("kineticstoolkit.files", "save"),
+    "read_c3d": ("kineticstoolkit.files", "read_c3d"),
+    "write_c3d": ("kineticstoolkit.files", "write_c3d"),
+}
+
+__all__ = [
+    "TimeSeries",
+    "TimeSeriesEvent",
+    "Player",
+    "Pipeline",
+    "load",
+    "save",
+    "read_c3d",
+    "write_c3d",
+    "filters",
+    "kinematics",
+    "cycles",
+    "doc",
+    "geometry",
+    "change_defaults",
+]
+
+if TYPE_CHECKING:
+    from kineticstoolkit import cycles, doc, filters, geometry, kinematics
+    from kineticstoolkit.files import load, read_c3d, save, write_c3d
+    from kineticstoolkit.pipeline import Pipeline
+    from kineticstoolkit.player import Player
+    from kineticstoolkit.tools import change_defaults
+
+
+def __getattr__(name: str) -> Any:
+    """Import the lazy classes, functions and modules on first use."""
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(f"kineticstoolkit.{name}")
+    elif name in _LAZY_ATTRIBUTES:
+        module_name, attribute_name = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name), attribute_name)
+    else:
+        raise AttributeError(
+            f"module 'kineticstoolkit' has no attribute '{name}'"
+        )
+    globals()[name] = value  # Next accesses do not go through __getattr__
+    return value
+
+
+# Check if a serious warning has been issued for this version. This is done
+# in a background thread so that importing Kinetics Toolkit never waits for
+# the network. Set the KINETICSTOOLKIT_NO_VERSION_CHECK environment variable
+# to disable this check.
+_VERSION_CHECK_TIMEOUT = 3.0  # seconds
+
+
+def _check_version() -> None:
+    """Warn if a serious warning has been issued for this version."""
+    try:
+        import json  # noqa: PLC0415
+        import warnings  # noqa: PLC0415
+        from datetime import timedelta  # noqa: PLC0415
+
+        from requests_cache import CachedSession  # noqa: PLC0415
+
+        session = CachedSession(
+            "kineticstoolkit",
+            backend="filesystem",
+            use_temp=True,
+            expire_after=timedelta(hours=24),
+        )
+        res = session.get(
+            "https://kineticstoolkit.uqam.ca/api/import_check.php",
+            params={"version": config.version},
+            timeout=_VERSION_CHECK_TIMEOUT,
+        )
+        contents = json.loads(res.content)
+        if res.ok and "warning" in contents:
+            warnings.warn(contents["warning"])
+    except Exception:
+        pass
+
+
+if "KINETICSTOOLKIT_NO_VERSION_CHECK" not in os.environ:
+    threading.Thread(
+        target=_check_version, name="ktk-version-check", daemon=True
+    ).start()
 
 
 def __dir__():
-    return [
-        "TimeSeries",
-        "TimeSeriesEvent",
-        "Player",
-        "load",
-        "save",
-        "read_c3d",
-        "write_c3d",
-        "filters",
-        "kinematics",
-        "cycles",
-        "doc",
-        "geometry",
-        "change_defaults",
-    ]
+    return list(__all__)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -36,6 +36,8 @@ def __dir__() -> list[str]:
         "temp_folder",
         "version",
         "interactive_backend_warning",
+        "validation",
+        "rotation_check_samples",
     ]
 
 
@@ -96,6 +98,19 @@ if "SPY_PYTHONPATH" in env and "PYTHONPATH" not in env:
 # Others
 interactive_backend_warning = True
 
+# Extent of the validation of the parameters of every function and method:
+# "full" performs every check, "fast" only checks the parameter types, and
+# "off" performs no check. "fast" and "off" reduce the overhead of functions
+# that are called many times in loops, at the cost of less helpful error
+# messages when a parameter is wrong.
+validation = "full"
+
+# Number of evenly spaced samples of a transform series that are checked for
+# non-orthogonal rotations in ktk.geometry functions. None checks every
+# sample. Read-only transform series that pass a complete check are not
+# checked again.
+rotation_check_samples: int | None = None
+
 
 if __name__ == "__main__":  # pragma: no cover
     import doctest
@@ -208,8 +208,12 @@ def detect_cycles(  # noqa: PLR0915 too-many-statements
         except IndexError:
             time3 = np.inf
 
-        sub_ts1 = ts.get_ts_between_times(time1, time2, inclusive=True)
-        sub_ts2 = ts.get_ts_between_times(time1, time3, inclusive=True)
+        sub_ts1 = ts.get_ts_between_times(
+            time1, time2, inclusive=True, copy=False
+        )
+        sub_ts2 = ts.get_ts_between_times(
+            time1, time3, inclusive=True, copy=False
+        )
 
         if directions[0] == "rising":
             the_peak1 = np.max(sub_ts1.data[data_key])
@@ -235,9 +239,10 @@ def detect_cycles(  # noqa: PLR0915 too-many-statements
                 valid_events.append(TimeSeriesEvent(time3, "_"))
 
     # Form the output timeseries
-    tsout = ts.copy()
-    for event in valid_events:
-        tsout = tsout.add_event(event.time, event.name)
+    tsout = ts.add_events(
+        [event.time for event in valid_events],
+        [event.name for event in valid_events],
+    )
 
     return tsout
 
@@ -332,6 +337,8 @@ def time_normalize(  # noqa: PLR0915, PLR0912 too-many-branches/statements
 
     dest_data = {}  # type: dict[str, list[np.ndarray]]
     dest_data_shape = {}  # type: dict[str, tuple[int, ...]]
+    dest_event_times = []  # type: list[float]
+    dest_event_names = []  # type: list[str]
 
     # Go through all cycles
     i_cycle = 0
@@ -374,7 +381,7 @@ def time_normalize(  # noqa: PLR0915, PLR0912 too-many-branches/statements
 
         # Extract this cycle
         subts = ts.get_ts_between_times(
-            extended_begin_time, extended_end_time, inclusive=True
+            extended_begin_time, extended_end_time, inclusive=True, copy=False
         )
 
         if subts.time.shape[0] == 0:
@@ -393,7 +400,7 @@ def time_normalize(  # noqa: PLR0915, PLR0912 too-many-branches/statements
 
         # Keep only the first points (the last one belongs to the next cycle)
         subts = subts.get_ts_between_indexes(
-            0, span[1] - span[0] - 1, inclusive=True
+            0, span[1] - span[0] - 1, inclusive=True, copy=False
         )
 
         # Keep only the events in the unextended span
@@ -414,12 +421,14 @@ def time_normalize(  # noqa: PLR0915, PLR0912 too-many-branches/statements
 
         # Add event_name1 at the beginning and end (duplicates will be
         # cancelled at the end)
-        dest_ts = dest_ts.add_event(
-            float(-span[0] + i_cycle * (span[1] - span[0])), event_name1
+        dest_event_times.append(
+            float(-span[0] + i_cycle * (span[1] - span[0]))
         )
-        dest_ts = dest_ts.add_event(
-            float(-span[0] + n_points + i_cycle * (span[1] - span[0])), "_"
+        dest_event_names.append(event_name1)
+        dest_event_times.append(
+            float(-span[0] + n_points + i_cycle * (span[1] - span[0]))
         )
+        dest_event_names.append("_")
 
         # Add the other events
         for _i_event, event in enumerate(other_events):
@@ -427,7 +436,8 @@ def time_normalize(  # noqa: PLR0915, PLR0912 too-many-branches/statements
             new_time = (event.time - extended_begin_time) / (
                 extended_end_time - extended_begin_time
             ) * (span[1] - span[0]) + i_cycle * (span[1] - span[0])
-            dest_ts = dest_ts.add_event(new_time, event.name)
+            dest_event_times.append(new_time)
+            dest_event_names.append(event.name)
 
         # Add this cycle to dest_time and dest_data
         for key in subts.data:
@@ -439,7 +449,8 @@ def time_normalize(  # noqa: PLR0915, PLR0912 too-many-branches/statements
         i_cycle += 1
 
     n_cycles = i_cycle
-    # Put back dest_time and dest_data in dest_ts
+    # Put back dest_time, dest_data and the events in dest_ts
+    dest_ts.add_events(dest_event_times, dest_event_names, in_place=True)
     dest_ts.time = 1.0 * np.arange(n_cycles * (span[1] - span[0]))
     for key in ts.data:
         # Stack the data into a [cycle, percent, values] shape
@@ -22,10 +22,15 @@ finds a best fit rigid body transformation between two point sets.
 Correspondence between the points is not assumed. Included is an SVD-based
 least-squared best-fit algorithm for corresponding point sets.
 
+Modified for Kinetics Toolkit: nearest neighbours are found using a
+scipy.spatial.cKDTree that is built once per destination point set, and
+batched versions of best_fit_transform and icp register many frames at
+once.
+
 """
 
 import numpy as np
-from sklearn.neighbors import NearestNeighbors
+from scipy.spatial import cKDTree
 
 
 def best_fit_transform(A, B):
@@ -71,48 +76,107 @@ def best_fit_transform(A, B):
     return T, R, t
 
 
-def nearest_neighbor(src, dst):
+def nearest_neighbor(src, dst, tree=None):
     """
     Find the nearest (Euclidean) neighbor in dst for each point in src
     Input:
         src: Nxm array of points
-        dst: Nxm array of points
+        dst: Pxm array of points
+        tree: optional cKDTree of dst, to reuse it between calls
     Output:
         distances: Euclidean distances of the nearest neighbor
         indices: dst indices of the nearest neighbor
     """
-    assert src.shape == dst.shape
+    assert src.shape[1] == dst.shape[1]
+
+    if tree is None:
+        tree = cKDTree(dst)
+    distances, indices = tree.query(src, k=1)
+    return distances, indices
+
+
+def best_fit_transforms(A, B, valid=None):
+    """
+    Batched version of best_fit_transform, for n frames at once
+    Input:
+      A: nxkxm numpy array of corresponding points
+      B: nxkxm numpy array of corresponding points
+      valid: optional nxk array of bool, False for the points to ignore
+    Returns:
+      T: nx(m+1)x(m+1) homogeneous transformation matrices that map A on to
+         B, or NaN for the frames with less than m valid points
+    """
+    assert A.shape == B.shape
+
+    n, k, m = A.shape
+    if valid is None:
+        valid = np.ones((n, k), dtype=bool)
+    weights = valid[:, :, np.newaxis]
+    n_valid = np.sum(valid, axis=1)
+    is_solvable = n_valid >= m
 
-    neigh = NearestNeighbors(n_neighbors=1)
-    neigh.fit(dst)
-    distances, indices = neigh.kneighbors(src, return_distance=True)
-    return distances.ravel(), indices.ravel()
+    # translate points to their centroids, ignoring the invalid points
+    A = np.where(weights, A, 0.0)
+    B = np.where(weights, B, 0.0)
+    count = np.maximum(n_valid, 1)[:, np.newaxis]
+    centroid_A = np.sum(A, axis=1) / count
+    centroid_B = np.sum(B, axis=1) / count
+    AA = (A - centroid_A[:, np.newaxis]) * weights
+    BB = (B - centroid_B[:, np.newaxis]) * weights
 
+    # rotation matrices
+    H = np.einsum("nki,nkj->nij", AA, BB)
+    U, S, Vt = np.linalg.svd(H)
+    R = np.matmul(np.swapaxes(Vt, 1, 2), np.swapaxes(U, 1, 2))
+
+    # special reflection case
+    reflected = np.linalg.det(R) < 0
+    if np.any(reflected):
+        Vt[reflected, m - 1, :] *= -1
+        R[reflected] = np.matmul(
+            np.swapaxes(Vt[reflected], 1, 2), np.swapaxes(U[reflected], 1, 2)
+        )
+
+    # translation
+    t = centroid_B - np.einsum("nij,nj->ni", R, centroid_A)
 
-def icp(A, B, init_pose=None, max_iterations=20, tolerance=0.001):
+    # homogeneous transformations
+    T = np.zeros((n, m + 1, m + 1))
+    T[:, :m, :m] = R
+    T[:, :m, m] = t
+    T[:, m, m] = 1.0
+    T[~is_solvable] = np.nan
+
+    return T
+
+
+def icp(A, B, init_pose=None, max_iterations=20, tolerance=0.001, tree=None):
     """
     The Iterative Closest Point method: finds best-fit transform that maps points A on to points B
     Input:
         A: Nxm numpy array of source mD points
-        B: Nxm numpy array of destination mD point
+        B: Pxm numpy array of destination mD point
         init_pose: (m+1)x(m+1) homogeneous transformation
         max_iterations: exit algorithm after max_iterations
         tolerance: convergence criteria
+        tree: optional cKDTree of B, to reuse it between calls
     Output:
         T: final homogeneous transformation that maps A on to B
         distances: Euclidean distances (errors) of the nearest neighbor
         i: number of iterations to converge
     """
-    assert A.shape == B.shape
+    assert A.shape[1] == B.shape[1]
 
     # get number of dimensions
     m = A.shape[1]
 
+    # build the search tree of the destination points once
+    if tree is None:
+        tree = cKDTree(B)
+
     # make points homogeneous, copy them to maintain the originals
     src = np.ones((m + 1, A.shape[0]))
-    dst = np.ones((m + 1, B.shape[0]))
     src[:m, :] = np.copy(A.T)
-    dst[:m, :] = np.copy(B.T)
 
     # apply the initial pose estimation
     if init_pose is not None:
@@ -122,10 +186,10 @@ def icp(A, B, init_pose=None, max_iterations=20, tolerance=0.001):
 
     for i in range(max_iterations):
         # find the nearest neighbors between the current source and destination points
-        distances, indices = nearest_neighbor(src[:m, :].T, dst[:m, :].T)
+        distances, indices = nearest_neighbor(src[:m, :].T, B, tree)
 
         # compute the transformation between the current source and nearest destination points
-        T, _, _ = best_fit_transform(src[:m, :].T, dst[:m, indices].T)
+        T, _, _ = best_fit_transform(src[:m, :].T, B[indices])
 
         # update the current source
         src = np.dot(T, src)
@@ -140,3 +204,85 @@ def icp(A, B, init_pose=None, max_iterations=20, tolerance=0.001):
     T, _, _ = best_fit_transform(A, src[:m, :].T)
 
     return T, distances, i
+
+
+def icp_batch(
+    A, B, init_poses=None, max_iterations=20, tolerance=0.001, tree=None
+):
+    """
+    Batched ICP: registers n frames of source points on the same destination points
+    Input:
+        A: nxkxm numpy array of n frames of source mD points. Points that
+           contain NaN are ignored.
+        B: Pxm numpy array of destination mD points (the template)
+        init_poses: (m+1)x(m+1) or nx(m+1)x(m+1) homogeneous transformations
+        max_iterations: exit algorithm after max_iterations
+        tolerance: convergence criteria, for each frame
+        tree: optional cKDTree of B, to reuse it between calls
+    Output:
+        T: nx(m+1)x(m+1) homogeneous transformations that map A on to B,
+           NaN for the frames with less than m valid points
+        distances: nxk Euclidean distances (errors) of the nearest neighbors
+        iterations: n numbers of iterations to converge
+    """
+    assert A.shape[2] == B.shape[1]
+
+    n, k, m = A.shape
+
+    # build the search tree of the destination points once
+    if tree is None:
+        tree = cKDTree(B)
+
+    valid = ~np.any(np.isnan(A), axis=2)
+    n_valid = np.sum(valid, axis=1)
+
+    # apply the initial pose estimations
+    src = np.array(A, dtype=float)
+    if init_poses is not None:
+        init_poses = np.broadcast_to(init_poses, (n, m + 1, m + 1))
+        src = (
+            np.einsum("nij,nkj->nki", init_poses[:, :m, :m], src)
+            + init_poses[:, np.newaxis, :m, m]
+        )
+
+    distances = np.full((n, k), np.nan)
+    iterations = np.zeros(n, dtype=int)
+    prev_error = np.zeros(n)
+    active = n_valid >= m  # the other frames cannot be registered
+
+    for i in range(max_iterations):
+        if not np.any(active):
+            break
+        i_active = np.nonzero(active)[0]
+        active_valid = valid[i_active]
+
+        # find the nearest neighbors of every valid point of every active
+        # frame, in a single query
+        active_distances = np.full((i_active.shape[0], k), np.nan)
+        matches = np.zeros((i_active.shape[0], k, m))
+        (
+            active_distances[active_valid],
+            indices,
+        ) = nearest_neighbor(src[i_active][active_valid], B, tree)
+        matches[active_valid] = B[indices]
+
+        # compute and apply the transformations between the current source
+        # and nearest destination points
+        T = best_fit_transforms(src[i_active], matches, active_valid)
+        src[i_active] = (
+            np.einsum("nij,nkj->nki", T[:, :m, :m], src[i_active])
+            + T[:, np.newaxis, :m, m]
+        )
+
+        # check errors
+        distances[i_active] = active_distances
+        iterations[i_active] = i
+        mean_error = np.nansum(active_distances, axis=1) / n_valid[i_active]
+        converged = np.abs(prev_error[i_active] - mean_error) < tolerance
+        prev_error[i_active] = mean_error
+        active[i_active[converged]] = False
+
+    # calculate final transformations
+    T = best_fit_transforms(A, src, valid)
+
+    return T, distances, iterations
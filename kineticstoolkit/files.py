@@ -26,6 +26,7 @@ __copyright__ = "Copyright (C) 2020-2025 Félix Chénier"
 __email__ = "chenier.felix@uqam.ca"
 __license__ = "Apache 2.0"
 
+import fnmatch
 import getpass
 import json
 import os
@@ -43,11 +44,12 @@ import pandas as pd
 import kineticstoolkit.config
 from kineticstoolkit.dev import kinetics
 from kineticstoolkit.timeseries import TimeSeries
+from kineticstoolkit.timeseries.arrow import _json_default
 from kineticstoolkit.typing_ import check_param
 
 
 def __dir__():  # pragma: no cover
-    return ["save", "load"]
+    return ["save", "load", "SessionStore"]
 
 
 def _ezc3d_to_dict(c3d) -> dict[str, Any]:
@@ -80,6 +82,9 @@ def save(filename: str, variable: Any) -> None:
     - json.zip : save as json but zips the file to save space
     - ktk.zip : a zipped folder containing two files: metadata.json, which
       includes save date, user, etc., and data.json, which includes the data.
+    - parquet : a columnar Parquet file, for TimeSeries only. See
+      ktk.TimeSeries.to_arrow for a description of the format. Requires
+      pyarrow, which is an optional dependency of Kinetics Toolkit.
 
     The following standard classes are supported:
 
@@ -195,6 +200,10 @@ def save(filename: str, variable: Any) -> None:
         "User": getpass.getuser(),
     }
 
+    if filename.lower().endswith(".parquet"):
+        _save_parquet(filename, variable, metadata)
+        return
+
     # Prepare temp folder if needed
     temp_folder = (
         kineticstoolkit.config.temp_folder + "/save" + str(time.time())
@@ -231,12 +240,59 @@ def save(filename: str, variable: Any) -> None:
         shutil.move(temp_folder + ".zip", filename)
     else:
         raise ValueError(
-            "Filename must end with either '.json', '.json.zip' or '.ktk.zip'"
+            "Filename must end with either '.json', '.json.zip', '.ktk.zip' "
+            "or '.parquet'"
         )
 
     shutil.rmtree(temp_folder)
 
 
+def _import_parquet():
+    """Import pyarrow.parquet or raise a ModuleNotFoundError."""
+    try:
+        import pyarrow.parquet  # noqa: PLC0415 import-outside-toplevel
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "The pyarrow module is an optional dependency of Kinetics "
+            "Toolkit. It must be installed to save and load Parquet files."
+        )
+    return pyarrow.parquet
+
+
+def _save_parquet(
+    filename: str, variable: Any, metadata: dict[str, Any]
+) -> None:
+    """Save a TimeSeries to a Parquet file, with the save metadata."""
+    pq = _import_parquet()
+    if not isinstance(variable, TimeSeries):
+        raise ValueError(
+            "Only TimeSeries can be saved to Parquet files. However, the "
+            f"variable to save is of type {type(variable)}."
+        )
+    table = variable.to_arrow()
+    table = table.replace_schema_metadata(
+        {**table.schema.metadata, b"ktk.metadata": json.dumps(metadata)}
+    )
+    pq.write_table(table, filename)
+
+
+def _load_parquet(
+    filename: str, include_metadata: bool, data_keys: list[str] | None
+) -> Any:
+    """Load a TimeSeries from a Parquet file, reading only data_keys."""
+    pq = _import_parquet()
+    table = pq.read_table(
+        filename, columns=None if data_keys is None else ["time", *data_keys]
+    )
+    ts = TimeSeries.from_arrow(table)
+    if include_metadata:
+        # Files written by other tools have no save metadata
+        metadata = (table.schema.metadata or {}).get(b"ktk.metadata")
+        return ts, {} if metadata is None else json.loads(metadata)
+    else:
+        return ts
+
+
 def _load_object_hook(obj):
     if "class__" in obj:
         to_class = obj["class__"]
@@ -258,8 +314,11 @@ def _load_object_hook(obj):
 
             for key in obj["data"]:
                 out.data[key] = np.array(obj["data"][key])
-            for event in obj["events"]:
-                out = out.add_event(event["time"], event["name"])
+            out.add_events(
+                [event["time"] for event in obj["events"]],
+                [event["name"] for event in obj["events"]],
+                in_place=True,
+            )
             return out
 
         elif to_class == "pandas.DataFrame":
@@ -291,9 +350,14 @@ def _load_object_hook(obj):
         return obj
 
 
-def load(filename: str, *, include_metadata: bool = False) -> Any:
+def load(
+    filename: str,
+    *,
+    include_metadata: bool = False,
+    data_keys: str | list[str] | None = None,
+) -> Any:
     """
-    Load a json, json.zip or ktk.zip file.
+    Load a json, json.zip, ktk.zip or parquet file.
 
     Load a data file as saved using the ``ktk.save`` function.
 
@@ -307,9 +371,14 @@ def load(filename: str, *, include_metadata: bool = False) -> Any:
     filename
         The path of the zip file to load.
     include_metadata
-        Optional. If True and the file is in the `ktk.zip` format, the output
-        is a tuple of this form:
-        (data, metadata).
+        Optional. If True and the file is in the `ktk.zip` or `parquet`
+        format, the output is a tuple of this form:
+        (data, metadata). Parquet files that were not written by Kinetics
+        Toolkit have an empty metadata dict.
+    data_keys
+        Optional. For `parquet` files only: the data keys to load. Only the
+        corresponding columns are read from the file. If None (default), all
+        data keys are loaded.
 
     Returns
     -------
@@ -323,8 +392,19 @@ def load(filename: str, *, include_metadata: bool = False) -> Any:
     """
     check_param("filename", filename, str)
     check_param("include_metadata", include_metadata, bool)
+    if isinstance(data_keys, str):
+        data_keys = [data_keys]
+    if data_keys is not None:
+        check_param("data_keys", data_keys, list, contents_type=str)
+        if not filename.lower().endswith(".parquet"):
+            raise ValueError(
+                "The data_keys parameter is only supported for parquet files."
+            )
 
-    if filename.lower().endswith(".json"):
+    if filename.lower().endswith(".parquet"):
+        return _load_parquet(filename, include_metadata, data_keys)
+
+    elif filename.lower().endswith(".json"):
         with open(filename) as fid:
             return json.load(fid, object_hook=_load_object_hook)
 
@@ -354,8 +434,344 @@ def load(filename: str, *, include_metadata: bool = False) -> Any:
 
     else:
         raise ValueError(
-            "Filename must end with '.json', '.json.zip' or '.ktk.zip'"
+            "Filename must end with '.json', '.json.zip', '.ktk.zip' or "
+            "'.parquet'"
+        )
+
+
+def _import_h5py():
+    """Import h5py or raise a ModuleNotFoundError."""
+    try:
+        import h5py  # noqa: PLC0415 import-outside-toplevel
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "The h5py module is an optional dependency of Kinetics Toolkit. "
+            "It must be installed to use a SessionStore."
         )
+    return h5py
+
+
+class SessionStore:
+    """
+    An HDF5 database of TimeSeries, for multi-trial sessions.
+
+    A SessionStore keeps many TimeSeries in a single HDF5 file, under names
+    that may be organized hierarchically using slashes (e.g.,
+    "subject12/trial03"). Each data key is stored as a chunked and
+    compressed dataset, so that a TimeSeries can be read partially (only
+    some data keys, or only a time range) without loading the whole file.
+
+    This class requires h5py, which is an optional dependency of Kinetics
+    Toolkit.
+
+    Parameters
+    ----------
+    filename
+        Name of the HDF5 file (e.g., "session.h5").
+    mode
+        Optional. "r" to open an existing file in read-only mode, "r+" to
+        open an existing file in read-write mode, "a" to open or create a
+        file in read-write mode, or "w" to create a new file, overwriting
+        any existing file. The default is "a".
+    compression
+        Optional. The HDF5 compression filter for new datasets, such as
+        "gzip" or "lzf", or None for no compression. The default is "gzip".
+    chunk_length
+        Optional. Number of samples per chunk for new datasets. Partial
+        reads decompress only the chunks that cover the requested time
+        range. The default is 4096.
+
+    Example
+    -------
+    >>> ts = ktk.TimeSeries(time=np.arange(1000) / 100)
+    >>> ts = ts.add_data("RKneeAngle", np.random.rand(1000))
+    >>> ts = ts.add_data("LKneeAngle", np.random.rand(1000))
+
+    >>> filename = ktk.config.temp_folder + "/session.h5"
+    >>> with ktk.files.SessionStore(filename, "w") as store:
+    ...     store.add("subject12/trial01", ts)
+    ...     store.add("subject12/trial02", ts)
+    ...     store.add("subject13/trial01", ts)
+
+    Read the right knee angle of every trial of subject 12, between 2 and
+    3 seconds:
+
+    >>> with ktk.files.SessionStore(filename, "r") as store:
+    ...     angles = {
+    ...         name: store.get(
+    ...             name, data_keys="RKneeAngle", time_range=(2.0, 3.0)
+    ...         )
+    ...         for name in store.find("subject12/*")
+    ...     }
+    >>> list(angles)
+    ['subject12/trial01', 'subject12/trial02']
+    >>> angles["subject12/trial01"].time[[0, -1]]
+    array([2., 3.])
+
+    >>> import os
+    >>> os.remove(filename)
+
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        *,
+        compression: str | None = "gzip",
+        chunk_length: int = 4096,
+    ):
+        check_param("filename", filename, str)
+        check_param("mode", mode, str, expected_values=["r", "r+", "a", "w"])
+        check_param("compression", compression, (str, None))
+        check_param("chunk_length", chunk_length, int)
+        h5py = _import_h5py()
+        self._filename = filename
+        self._compression = compression
+        self._chunk_length = chunk_length
+        self._file = h5py.File(filename, mode)
+
+    def __repr__(self) -> str:
+        return (
+            f"SessionStore('{self._filename}') with "
+            f"{len(self.find())} TimeSeries"
+        )
+
+    def __enter__(self) -> "SessionStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return (
+            name in self._file
+            and self._file[name].attrs.get("class__") == "ktk.TimeSeries"
+        )
+
+    def close(self) -> None:
+        """Close the HDF5 file."""
+        self._file.close()
+
+    def find(self, pattern: str = "*", *, data_key: str | None = None):
+        """
+        Find the names of the stored TimeSeries.
+
+        Parameters
+        ----------
+        pattern
+            Optional. A Unix shell-style pattern that the names must match,
+            such as "subject12/*". The default is "*", which matches every
+            name.
+        data_key
+            Optional. If specified, only the TimeSeries that contain this
+            data key are returned.
+
+        Returns
+        -------
+        list[str]
+            The names of the matching TimeSeries, in alphabetical order.
+
+        """
+        check_param("pattern", pattern, str)
+        check_param("data_key", data_key, (str, None))
+
+        names = []  # type: list[str]
+
+        def _visit(name, obj):
+            if (
+                obj.attrs.get("class__") == "ktk.TimeSeries"
+                and fnmatch.fnmatchcase(name, pattern)
+                and (data_key is None or data_key in obj["data"])
+            ):
+                names.append(name)
+
+        self._file.visititems(_visit)
+        return sorted(names)
+
+    def add(
+        self, name: str, ts: TimeSeries, *, overwrite: bool = False
+    ) -> None:
+        """
+        Add a TimeSeries to the store.
+
+        Parameters
+        ----------
+        name
+            Name of the TimeSeries in the store. Slashes create a hierarchy,
+            e.g., "subject12/trial03".
+        ts
+            The TimeSeries to add.
+        overwrite
+            Optional. True to replace an existing TimeSeries with the same
+            name. The default is False.
+
+        Raises
+        ------
+        ValueError
+            If a TimeSeries with this name already exists and overwrite is
+            False.
+
+        """
+        check_param("name", name, str)
+        check_param("ts", ts, TimeSeries)
+        check_param("overwrite", overwrite, bool)
+        ts._check_well_shaped()
+        ts._check_increasing_time()
+        h5py = _import_h5py()
+
+        if name in self._file:
+            if not overwrite:
+                raise ValueError(
+                    f"The name '{name}' already exists in the store. Use "
+                    "overwrite=True to replace it."
+                )
+            del self._file[name]
+
+        group = self._file.create_group(name)
+        group.attrs["class__"] = "ktk.TimeSeries"
+        group.attrs["info"] = json.dumps(ts.info, default=_json_default)
+
+        self._create_dataset(group, "time", ts.time)
+        data_group = group.create_group("data")
+        for key, data in ts.data.items():
+            self._create_dataset(data_group, key, data)
+
+        events = np.array(
+            [(event.time, event.name) for event in ts.events],
+            dtype=[("time", float), ("name", h5py.string_dtype())],
+        )
+        group.create_dataset("events", data=events)
+
+    def _create_dataset(self, group, key: str, data: np.ndarray) -> None:
+        """Create a chunked, compressed dataset for a time-indexed array."""
+        h5py = _import_h5py()
+        is_string = data.dtype.kind == "U"
+        if is_string:
+            data = data.astype(h5py.string_dtype())
+
+        if data.shape[0] > 0:
+            dataset = group.create_dataset(
+                key,
+                data=data,
+                chunks=(
+                    min(data.shape[0], self._chunk_length),
+                    *data.shape[1:],
+                ),
+                compression=self._compression,
+                shuffle=self._compression is not None and not is_string,
+            )
+        else:
+            dataset = group.create_dataset(key, data=data)
+        dataset.attrs["is_string"] = is_string
+
+    def get(
+        self,
+        name: str,
+        *,
+        data_keys: str | list[str] | None = None,
+        time_range: tuple[float, float] | None = None,
+    ) -> TimeSeries:
+        """
+        Read a TimeSeries from the store.
+
+        Parameters
+        ----------
+        name
+            Name of the TimeSeries in the store.
+        data_keys
+            Optional. The data keys to read. If None (default), every data
+            key is read.
+        time_range
+            Optional. A tuple (time1, time2): only the samples where
+            time1 <= time <= time2 are read. If None (default), every sample
+            is read. Events are read regardless of their time.
+
+        Returns
+        -------
+        TimeSeries
+            The TimeSeries. Its info contains only the time and the read
+            data keys, plus the info that does not correspond to a data key.
+
+        Raises
+        ------
+        KeyError
+            If the name or a data key is not found in the store.
+
+        """
+        check_param("name", name, str)
+        if isinstance(data_keys, str):
+            data_keys = [data_keys]
+        check_param("data_keys", data_keys, (list, None))
+        if time_range is not None:
+            time_range = tuple(time_range)  # type: ignore
+            check_param(
+                "time_range", time_range, tuple, length=2, contents_type=float
+            )
+
+        if name not in self:
+            raise KeyError(f"The name '{name}' was not found in the store.")
+        group = self._file[name]
+        data_group = group["data"]
+        if data_keys is None:
+            data_keys = list(data_group)
+        for key in data_keys:
+            if key not in data_group:
+                raise KeyError(
+                    f"The data key '{key}' was not found in the "
+                    f"TimeSeries '{name}' of the store."
+                )
+
+        # Find the samples to read
+        times = group["time"][()]
+        if time_range is None:
+            index_slice = slice(None)
+        else:
+            index_slice = slice(
+                int(np.searchsorted(times, time_range[0], side="left")),
+                int(np.searchsorted(times, time_range[1], side="right")),
+            )
+
+        ts = TimeSeries(time=times[index_slice])
+        for key in data_keys:
+            dataset = data_group[key]
+            if dataset.attrs.get("is_string", False):
+                ts.data[key] = dataset.asstr()[index_slice]
+            else:
+                ts.data[key] = dataset[index_slice]
+
+        info = json.loads(group.attrs["info"])
+        for key, value in info.items():
+            if key == "Time" or key in data_keys or key not in data_group:
+                ts.info[key] = value
+
+        events = group["events"][()]
+        ts.add_events(
+            events["time"],
+            [event_name.decode() for event_name in events["name"]],
+            in_place=True,
+        )
+        return ts
+
+    def remove(self, name: str) -> None:
+        """
+        Remove a TimeSeries from the store.
+
+        Parameters
+        ----------
+        name
+            Name of the TimeSeries in the store.
+
+        Raises
+        ------
+        KeyError
+            If the name is not found in the store.
+
+        """
+        check_param("name", name, str)
+        if name not in self:
+            raise KeyError(f"The name '{name}' was not found in the store.")
+        del self._file[name]
 
 
 def read_c3d(  # noqa: PLR0915, PLR0912 too-many-statements too-many-branches
@@ -542,19 +958,12 @@ def read_c3d(  # noqa: PLR0915, PLR0912 too-many-statements too-many-branches
     except KeyError:
         event_contexts = ["" for _ in event_names]
     # Create a list of events to copy in the output TimeSeries
-    temp_ts = TimeSeries()
-    for i_event in range(len(event_names)):
-        event_time = event_times[i_event]
-        if include_event_context:
-            event_name = event_contexts[i_event] + ":" + event_names[i_event]
-        else:
-            event_name = event_names[i_event]
-        temp_ts.add_event(
-            event_time,
-            event_name,
-            in_place=True,
-        )
-    events = temp_ts.events
+    if include_event_context:
+        event_names = [
+            f"{context}:{name}"
+            for context, name in zip(event_contexts, event_names, strict=True)
+        ]
+    events = TimeSeries().add_events(event_times, event_names).events
 
     # -----------------
     # Points
@@ -21,10 +21,13 @@ __email__ = "chenier.felix@uqam.ca"
 __license__ = "Apache 2.0"
 
 
+import inspect
 import warnings
-from typing import cast
+from functools import lru_cache
+from typing import Any, cast
 
 import numpy as np
+import scipy.interpolate as sint
 import scipy.ndimage as ndi
 import scipy.signal as sgl
 
@@ -33,7 +36,7 @@ from kineticstoolkit.typing_ import check_param
 
 
 def __dir__():
-    return ["savgol", "smooth", "butter", "deriv", "median"]
+    return ["savgol", "smooth", "butter", "deriv", "median", "Filter"]
 
 
 def _interpolate(ts: TimeSeries, key: str) -> tuple[TimeSeries, np.ndarray]:
@@ -66,6 +69,93 @@ def _validate_input(ts):
         warnings.warn("It seems that unit is not 's'.")
 
 
+@lru_cache(maxsize=128)
+def _design_butter(
+    order: int, fc: float | tuple[float, float], btype: str, fs: float
+) -> np.ndarray:
+    """
+    Design a Butterworth filter as second-order sections.
+
+    The result is cached since the same filter is usually applied to many
+    TimeSeries. The returned array must not be modified.
+    """
+    return sgl.butter(order, fc, btype, analog=False, output="sos", fs=fs)
+
+
+@lru_cache(maxsize=128)
+def _design_savgol(
+    window_length: int, poly_order: int, deriv: int, delta: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Design a Savitzky-Golay filter.
+
+    Returns a tuple of (coefficients, head, tail), where coefficients is
+    the convolution kernel, and head and tail are the matrices that
+    evaluate the polynomial fit on the first and last window_length samples,
+    which reproduces scipy.signal.savgol_filter's "interp" mode. The result
+    is cached and its arrays are read-only.
+    """
+    coeffs = sgl.savgol_coeffs(
+        window_length, poly_order, deriv=deriv, delta=delta, use="conv"
+    )
+
+    # Polynomial fit on the window: poly_coeffs = pinv(vander) @ x. The
+    # abscissa is centred and scaled to [-1, 1] so that the Vandermonde
+    # matrix stays well conditioned for long windows and high orders.
+    half = window_length // 2
+    scale = max(half, 1)
+    t = (np.arange(window_length, dtype=float) - half) / scale
+    fit = np.linalg.pinv(np.vander(t, poly_order + 1))
+
+    # Evaluation of the deriv-th derivative of the polynomial
+    powers = np.arange(poly_order, -1, -1)
+    factors = np.ones(poly_order + 1)
+    for i in range(deriv):
+        factors *= powers - i
+    exponents = np.maximum(powers - deriv, 0)
+
+    def evaluate(positions: np.ndarray) -> np.ndarray:
+        return (
+            factors
+            * positions[:, np.newaxis] ** exponents
+            / (scale * delta) ** deriv
+        )
+
+    head = evaluate(t[:half]) @ fit
+    tail = evaluate(t[window_length - half :]) @ fit
+
+    for array in (coeffs, head, tail):
+        array.flags.writeable = False
+    return (coeffs, head, tail)
+
+
+def _savgol_filter(
+    x: np.ndarray,
+    window_length: int,
+    poly_order: int,
+    deriv: int,
+    delta: float,
+) -> np.ndarray:
+    """Apply a Savitzky-Golay filter on axis 0 using a cached design."""
+    x = np.asarray(x, dtype=float)  # Integer data would stay integer
+    if window_length % 2 == 0 or window_length > x.shape[0]:
+        # Let scipy deal with these less common cases
+        return sgl.savgol_filter(
+            x, window_length, poly_order, deriv, delta=delta, axis=0
+        )
+
+    coeffs, head, tail = _design_savgol(
+        window_length, poly_order, deriv, float(delta)
+    )
+    half = window_length // 2
+
+    y = ndi.convolve1d(x, coeffs, axis=0, mode="constant")
+    if half > 0:
+        y[:half] = np.tensordot(head, x[:window_length], axes=(1, 0))
+        y[-half:] = np.tensordot(tail, x[-window_length:], axes=(1, 0))
+    return y
+
+
 def savgol(
     ts: TimeSeries, /, *, window_length: int, poly_order: int, deriv: int = 0
 ) -> TimeSeries:
@@ -128,8 +218,8 @@ def savgol(
         input_signal = subts.data[key]
 
         # Filter
-        filtered_data = sgl.savgol_filter(
-            input_signal, window_length, poly_order, deriv, delta=delta, axis=0
+        filtered_data = _savgol_filter(
+            input_signal, window_length, poly_order, deriv, delta
         )
 
         # Put back NaNs
@@ -230,12 +320,13 @@ def butter(
 
     """
     check_param("ts", ts, TimeSeries)
+    if not np.isscalar(fc):
+        # Normalized even without validation, since fc is a cache key
+        fc = cast(tuple[float, float], tuple(fc))
     try:
         check_param("fc", fc, float)
     except TypeError:
         try:
-            fc = cast(tuple[float, float], fc)
-            fc = cast(tuple[float, float], tuple(fc))
             check_param("fc", fc, tuple, length=2, contents_type=float)
         except TypeError:
             raise TypeError("fc must be an integer or a tuple or 2 floats.")
@@ -251,8 +342,13 @@ def butter(
     if np.isnan(fs):
         raise ValueError("The TimeSeries' time vector must not contain NaNs.")
 
-    sos = sgl.butter(order, fc, btype, analog=False, output="sos", fs=fs)
+    sos = _design_butter(order, fc, btype, fs)
+    _sos_filter(ts, sos, filtfilt)
+    return ts
+
 
+def _sos_filter(ts: TimeSeries, sos: np.ndarray, filtfilt: bool) -> None:
+    """Apply second-order sections on every data of ts, in place."""
     for data in ts.data:
         subts, missing = _interpolate(ts, data)
 
@@ -268,10 +364,43 @@ def butter(
         # Put back in main TimeSeries
         ts.data[data] = subts.data[data]
 
-    return ts
 
+def _stack_data(ts: TimeSeries) -> np.ndarray:
+    """Stack every data key of a TimeSeries in a single 2d float array."""
+    n_samples = ts.time.shape[0]
+    if len(ts.data) == 0:
+        return np.empty((n_samples, 0))
+    return np.concatenate(
+        [ts.data[key].reshape(n_samples, -1) for key in ts.data],
+        axis=1,
+        dtype=float,
+    )
+
+
+def _unstack_data(ts: TimeSeries, stacked: np.ndarray) -> dict:
+    """Split a stacked array back into data keys shaped like ts's data."""
+    n_samples = stacked.shape[0]
+    out = {}
+    i_column = 0
+    for key in ts.data:
+        shape = ts.data[key].shape
+        n_columns = int(np.prod(shape[1:]))
+        out[key] = stacked[:, i_column : i_column + n_columns].reshape(
+            (n_samples, *shape[1:])
+        )
+        i_column += n_columns
+    return out
 
-def deriv(ts: TimeSeries, /, n: int = 1) -> TimeSeries:
+
+def deriv(
+    ts: TimeSeries,
+    /,
+    n: int = 1,
+    *,
+    method: str = "diff",
+    window_length: int | None = None,
+    poly_order: int | None = None,
+) -> TimeSeries:
     """
     Calculate the nth numerical derivative.
 
@@ -286,11 +415,38 @@ def deriv(ts: TimeSeries, /, n: int = 1) -> TimeSeries:
     n
         Order of the derivative.
 
+    method
+        Optional. The differentiation method:
+
+        - "diff": difference between consecutive samples. The resulting
+          time is at the middle of the original samples, and the resulting
+          TimeSeries is n samples shorter than `ts`.
+        - "central": central difference. The resulting TimeSeries keeps
+          the original time, with one-sided differences at both ends.
+        - "spline": derivative of the interpolating spline that passes
+          through every sample. The resulting TimeSeries keeps the original
+          time.
+        - "savgol": combined smoothing and differentiation using a
+          Savitzky-Golay filter of length `window_length` and polynomial
+          order `poly_order`, in a single convolution. The resulting
+          TimeSeries keeps the original time.
+
+        The default is "diff". Except for "diff", missing samples are
+        interpolated before differentiation and then replaced by np.nan,
+        as for the other filters of this module.
+
+    window_length
+        Only for method "savgol". The length of the filter window, which
+        must be a positive odd integer.
+
+    poly_order
+        Only for method "savgol". The order of the polynomial used to fit
+        the samples. poly_order must be less than window_length.
+
     Returns
     -------
     TimeSeries
-        A copy of the input TimeSeries, which each data being derived. The
-        length of the resulting TimeSeries is one less than `ts`.
+        A copy of the input TimeSeries, which each data being derived.
 
     Raises
     ------
@@ -298,6 +454,10 @@ def deriv(ts: TimeSeries, /, n: int = 1) -> TimeSeries:
         If sample rate is not constant, or if there is no data to
         filter.
 
+    See Also
+    --------
+    ktk.filters.savgol
+
     Example
     -------
     >>> ts = ktk.TimeSeries(time=np.arange(0, 0.5, 0.1))
@@ -325,21 +485,86 @@ def deriv(ts: TimeSeries, /, n: int = 1) -> TimeSeries:
     >>> ts2.data["test"]
     array([ 100., -100., -100.])
 
+    >>> # First derivative, keeping the original time
+    >>> ts3 = ktk.filters.deriv(ts, method="central")
+
+    >>> ts3.time
+    array([0. , 0.1, 0.2, 0.3, 0.4])
+    >>> ts3.data["test"]
+    array([ -5.,   5.,   5.,  -5., -15.])
+
     """
     check_param("ts", ts, TimeSeries)
     check_param("n", n, int)
+    check_param(
+        "method",
+        method,
+        str,
+        expected_values=["diff", "central", "spline", "savgol"],
+    )
+    if method == "savgol":
+        if window_length is None or poly_order is None:
+            raise ValueError(
+                "window_length and poly_order must be specified when "
+                "method is 'savgol'."
+            )
+        check_param("window_length", window_length, int)
+        check_param("poly_order", poly_order, int)
     _validate_input(ts)
 
-    out_ts = ts.copy()
+    if method == "diff":
+        out_ts = ts.copy()
 
-    for _i in range(n):
-        out_ts.time = (out_ts.time[1:] + out_ts.time[0:-1]) / 2
+        for _i in range(n):
+            out_ts.time = (out_ts.time[1:] + out_ts.time[0:-1]) / 2
 
-    for key in ts.data:
-        out_ts.data[key] = (
-            np.diff(ts.data[key], n=n, axis=0) / (ts.time[1] - ts.time[0]) ** n
+        for key in ts.data:
+            out_ts.data[key] = (
+                np.diff(ts.data[key], n=n, axis=0)
+                / (ts.time[1] - ts.time[0]) ** n
+            )
+
+        return out_ts
+
+    # Other methods keep the original time. Differentiate every key at once.
+    out_ts = ts.copy(copy_data=False)
+    delta = ts.time[1] - ts.time[0]
+
+    nan_indexes = {key: ts.isnan(key) for key in ts.data}
+    if np.any([np.any(_) for _ in nan_indexes.values()]):
+        ts = ts.fill_missing_samples(0)
+        warnings.warn(
+            "NaNs found in the signal. They have been "
+            "interpolated before differentiation, and then put "
+            "back in the derived data."
         )
 
+    stacked = _stack_data(ts)
+
+    if method == "central":
+        # Interpolating polynomial on the smallest centered window
+        central_length = n + 1 + n % 2
+        derived = _savgol_filter(
+            stacked, central_length, central_length - 1, n, delta
+        )
+    elif method == "savgol":
+        derived = _savgol_filter(
+            stacked,
+            cast(int, window_length),
+            cast(int, poly_order),
+            n,
+            delta,
+        )
+    else:  # spline
+        spline = sint.make_interp_spline(
+            ts.time, stacked, k=max(3, n + 1 + n % 2), axis=0
+        )
+        derived = spline.derivative(n)(ts.time)
+
+    for key, value in _unstack_data(ts, derived).items():
+        out_ts.data[key] = value
+        out_ts.data[key][nan_indexes[key]] = np.nan
+
     return out_ts
 
 
@@ -378,6 +603,99 @@ def median(ts: TimeSeries, /, window_length: int = 3) -> TimeSeries:
     return out_ts
 
 
+class Filter:
+    """
+    A filter that can be applied to many TimeSeries.
+
+    A Filter stores a filter function of this module with its parameters, so
+    that the same filter can be applied to many TimeSeries. Filter designs
+    (Butterworth second-order sections, Savitzky-Golay coefficients) are
+    cached by sample rate, so that applying a Filter to many trials recorded
+    at the same sample rate designs the filter only once.
+
+    Parameters
+    ----------
+    kind
+        The filter function: "butter", "savgol", "smooth", "deriv" or
+        "median".
+    **kwargs
+        The parameters of this filter function, except the TimeSeries.
+
+    Raises
+    ------
+    ValueError
+        If kind is not a filter of this module.
+    TypeError
+        If a parameter is not accepted by this kind of filter.
+
+    See Also
+    --------
+    ktk.filters.butter, ktk.filters.savgol, ktk.filters.smooth,
+    ktk.filters.deriv, ktk.filters.median
+
+    Example
+    -------
+    >>> lowpass = ktk.filters.Filter("butter", fc=10.0, order=4)
+    >>> lowpass
+    Filter('butter', fc=10.0, order=4)
+
+    >>> ts = ktk.TimeSeries(time=np.arange(0, 1, 0.01))
+    >>> ts = ts.add_data("test", np.sin(2 * np.pi * ts.time))
+    >>> filtered = lowpass.apply(ts)
+
+    """
+
+    kind: str
+    kwargs: dict[str, Any]
+
+    def __init__(self, kind: str, /, **kwargs):
+        check_param(
+            "kind",
+            kind,
+            str,
+            expected_values=["butter", "savgol", "smooth", "deriv", "median"],
+        )
+        # Validate the parameter names now instead of on the first apply.
+        try:
+            inspect.signature(_FILTER_FUNCTIONS[kind]).bind(None, **kwargs)
+        except TypeError as e:
+            raise TypeError(f"Invalid parameters for a {kind} filter: {e}")
+        self.kind = kind
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        arguments = "".join(
+            f", {key}={value!r}" for key, value in self.kwargs.items()
+        )
+        return f"Filter({self.kind!r}{arguments})"
+
+    def apply(self, ts: TimeSeries, /) -> TimeSeries:
+        """
+        Apply the filter to a TimeSeries.
+
+        Parameters
+        ----------
+        ts
+            Input TimeSeries.
+
+        Returns
+        -------
+        TimeSeries
+            A copy of the input TimeSeries, with each data being filtered.
+
+        """
+        return _FILTER_FUNCTIONS[self.kind](ts, **self.kwargs)
+
+
+_FILTER_FUNCTIONS = {
+    "butter": butter,
+    "savgol": savgol,
+    "smooth": smooth,
+    "deriv": deriv,
+    "median": median,
+}
+
+
 if __name__ == "__main__":
     import doctest
 
@@ -28,12 +28,18 @@ __copyright__ = "Copyright (C) 2020-2025 Félix Chénier"
 __email__ = "chenier.felix@uqam.ca"
 __license__ = "Apache 2.0"
 
+import weakref
+from typing import TYPE_CHECKING
+
 import numpy as np
 from scipy.spatial import transform
 
-from kineticstoolkit.external import icp
+from kineticstoolkit import config
 from kineticstoolkit.typing_ import ArrayLike, check_param
 
+if TYPE_CHECKING:
+    from kineticstoolkit import TimeSeries
+
 
 def __dir__():
     return [
@@ -51,9 +57,13 @@ def __dir__():
         "mirror",
         "get_local_coordinates",
         "get_global_coordinates",
+        "get_relative_transforms",
         "get_angles",
         "get_quaternions",
+        "RotationSeries",
         "get_distances",
+        "get_pairwise_distances",
+        "get_rigidity_scores",
         "register_points",
         "isnan",
     ]
@@ -96,29 +106,31 @@ def matmul(op1: ArrayLike, op2: ArrayLike, /) -> np.ndarray:
            [16.,  9.]])
 
     """
-    op1_array = np.array(op1)
-    op2_array = np.array(op2)
-
-    def perform_mul(op1, op2):
-        if isinstance(op1, np.ndarray) and isinstance(op2, np.ndarray):
-            return op1 @ op2
-        else:
-            return op1 * op2  # In the case where we have a series of floats.
-
+    op1_array = np.asarray(op1)
+    op2_array = np.asarray(op2)
     op1_array, op2_array = _match_size(op1_array, op2_array)
 
-    n_samples = op1_array.shape[0]
-
-    # Get the expected shape by performing the first multiplication
-    temp = perform_mul(op1_array[0], op2_array[0])
-    result = np.empty((n_samples, *temp.shape))
-
-    # Perform the multiplication
-    for i_sample in range(n_samples):
-        result[i_sample] = perform_mul(
-            op1_array[i_sample], op2_array[i_sample]
+    # Multiply every sample at once
+    if op1_array.ndim == 1 or op2_array.ndim == 1:
+        # At least one series of floats
+        op1_array = op1_array.reshape(
+            op1_array.shape + (1,) * (op2_array.ndim - op1_array.ndim)
         )
+        op2_array = op2_array.reshape(
+            op2_array.shape + (1,) * (op1_array.ndim - op2_array.ndim)
+        )
+        return np.multiply(op1_array, op2_array, dtype=float)
 
+    # Series of vectors are multiplied as 1xM or Mx1 matrices
+    result = np.matmul(
+        op1_array[:, np.newaxis] if op1_array.ndim == 2 else op1_array,
+        op2_array[..., np.newaxis] if op2_array.ndim == 2 else op2_array,
+        dtype=float,
+    )
+    if op2_array.ndim == 2:
+        result = result[..., 0]
+    if op1_array.ndim == 2:
+        result = result[:, 0]
     return result
 
 
@@ -146,30 +158,35 @@ def invert(matrix_series: ArrayLike, /) -> np.ndarray:
     rotation component.
 
     """
-    matrix_series = np.array(matrix_series)
-    index_is_nan = isnan(matrix_series)
+    matrix_series = np.asarray(matrix_series)
+
+    _check_no_skewed_rotation(matrix_series, "matrix_series")
 
     if not is_transform_series(matrix_series):
         raise ValueError(
             "The input must be a series of homogeneous transform series."
         )
 
-    _check_no_skewed_rotation(matrix_series, "matrix_series")
+    return _invert(matrix_series, isnan(matrix_series))
+
 
-    invR = np.zeros((matrix_series.shape[0], 3, 3))
-    invT = np.zeros((matrix_series.shape[0], 3))
+def _invert(matrix_series: np.ndarray, index_is_nan: np.ndarray) -> np.ndarray:
+    """Invert a transform series that is known to be valid."""
+    out = np.empty(matrix_series.shape)
 
     # Inverse rotation
-    invR = np.transpose(matrix_series[:, 0:3, 0:3], (0, 2, 1))
+    invR = out[:, 0:3, 0:3]
+    invR[:] = np.transpose(matrix_series[:, 0:3, 0:3], (0, 2, 1))
 
     # Inverse translation
-    invT = -matmul(invR, matrix_series[:, 0:3, 3])
+    np.negative(
+        np.einsum(
+            "nji,nj->ni", matrix_series[:, 0:3, 0:3], matrix_series[:, 0:3, 3]
+        ),
+        out=out[:, 0:3, 3],
+    )
 
-    # output
-    out = np.zeros(matrix_series.shape)
-    out[:, 0:3, 0:3] = invR
-    out[:, 0:3, 3] = invT
-    out[:, 3, 3] = 1
+    out[:, 3, :] = [0.0, 0.0, 0.0, 1.0]
     out[index_is_nan] = np.nan
 
     return out
@@ -391,6 +408,9 @@ def get_angles(
     zero. Note however that the returned angles still represent the correct
     rotation.
 
+    To extract angles in several sequences from the same transform series,
+    use ktk.geometry.RotationSeries, which converts the matrices only once.
+
     Parameters
     ----------
     T
@@ -445,30 +465,12 @@ def get_angles(
     `seq` parameter.
 
     """
-    T = np.array(T)
+    T = np.asarray(T)
     check_param("seq", seq, str)
     check_param("degrees", degrees, bool)
     check_param("flip", flip, bool)
 
-    _check_no_skewed_rotation(T, "T")
-
-    R = transform.Rotation.from_matrix(T[:, 0:3, 0:3])
-    angles = R.as_euler(seq, degrees)
-
-    offset = 180 if degrees else np.pi
-
-    if flip:
-        if seq[0] == seq[2]:  # Euler angles
-            angles[:, 0] = np.mod(angles[:, 0], 2 * offset) - offset
-            angles[:, 1] = -angles[:, 1]
-            angles[:, 2] = np.mod(angles[:, 2], 2 * offset) - offset
-        else:  # Tait-Bryan angles
-            angles[:, 0] = np.mod(angles[:, 0], 2 * offset) - offset
-            angles[:, 1] = offset - angles[:, 1]
-            angles[angles[:, 1] > offset, :] -= 2 * offset
-            angles[:, 2] = np.mod(angles[:, 2], 2 * offset) - offset
-
-    return angles
+    return RotationSeries._wrap(T).get_angles(seq, degrees=degrees, flip=flip)
 
 
 def get_quaternions(
@@ -499,13 +501,234 @@ def get_quaternions(
         An Nx4 series of quaternions.
 
     """
-    T = np.array(T)
+    T = np.asarray(T)
     check_param("scalar_first", scalar_first, bool)
 
-    _check_no_skewed_rotation(T, "T")
+    return RotationSeries._wrap(T).get_quaternions(
+        canonical=canonical, scalar_first=scalar_first
+    )
+
+
+class RotationSeries:
+    """
+    A transform series that caches the rotations extracted from it.
+
+    Extracting Euler angles or quaternions from a transform series first
+    converts the rotation matrices to a SciPy Rotation, which is the most
+    expensive step. A RotationSeries performs this conversion, the
+    orthogonality check, the NaN detection and the inversion only once, so
+    that angles in several sequences, quaternions and inverse transforms can
+    then be extracted from the same series at minimal cost.
+
+    Samples that contain NaNs lead to NaN angles and quaternions.
+
+    Parameters
+    ----------
+    T
+        An Nx4x4 transform series. It is not copied if it is already an
+        array of floats, and therefore must not be modified afterward, since
+        the extracted rotations are cached.
+
+    Example
+    -------
+    >>> T = ktk.geometry.create_transform_series(
+    ...     angles=[[10.0, 20.0, 30.0], [40.0, 50.0, 60.0]],
+    ...     seq="xyz",
+    ...     degrees=True,
+    ... )
+    >>> rotations = ktk.geometry.RotationSeries(T)
+    >>> angles = rotations.get_angles(["xyz", "zyx"], degrees=True)
+    >>> angles["xyz"]
+    array([[10., 20., 30.],
+           [40., 50., 60.]])
+    >>> rotations.get_quaternions().shape
+    (2, 4)
+
+    """
 
-    R = transform.Rotation.from_matrix(T[:, 0:3, 0:3])
-    return R.as_quat(canonical=canonical, scalar_first=scalar_first)
+    def __init__(self, T: ArrayLike, /):
+        transforms = np.asarray(T, dtype=float)
+        check_param("T", transforms, np.ndarray, shape=(-1, 4, 4))
+
+        # Read-only, since the cached values depend on it. When T is not
+        # copied, a view is made read-only so that T stays writeable.
+        if transforms.flags.writeable:
+            if transforms is T:
+                transforms = transforms.view()
+            transforms.flags.writeable = False
+        self._initialize(transforms)
+
+    @classmethod
+    def _wrap(cls, T: np.ndarray) -> "RotationSeries":
+        """
+        Create a temporary RotationSeries on T, without copying it.
+
+        T may also be an Nx3x3 series of rotation matrices, as accepted by
+        get_angles and get_quaternions.
+        """
+        self = cls.__new__(cls)
+        self._initialize(T)
+        return self
+
+    def _initialize(self, transforms: np.ndarray) -> None:
+        """Check the transform series and initialize the caches."""
+        _check_no_skewed_rotation(transforms, "T")
+        self._transforms = transforms
+        self._nan_mask = None  # type: np.ndarray | None
+        self._rotation = None  # type: transform.Rotation | None
+        self._inverse = None  # type: np.ndarray | None
+        self._euler_angles = {}  # type: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return self._transforms.shape[0]
+
+    @property
+    def transforms(self) -> np.ndarray:
+        """The Nx4x4 transform series, as a read-only array."""
+        return self._transforms
+
+    @property
+    def nan_mask(self) -> np.ndarray:
+        """Array of N bools, with True for the samples that contain NaNs."""
+        if self._nan_mask is None:
+            self._nan_mask = isnan(self._transforms)
+        return self._nan_mask
+
+    @property
+    def rotation(self) -> transform.Rotation:
+        """The SciPy Rotation of the samples that do not contain NaNs."""
+        if self._rotation is None:
+            matrices = self._transforms[~self.nan_mask, 0:3, 0:3]
+            if _is_validated_rotation(self._transforms):
+                # Every matrix is known to be orthogonal: skip the
+                # orthonormalization if this version of SciPy allows it.
+                try:
+                    self._rotation = transform.Rotation.from_matrix(
+                        matrices, assume_valid=True
+                    )
+                except TypeError:
+                    self._rotation = transform.Rotation.from_matrix(matrices)
+            else:
+                self._rotation = transform.Rotation.from_matrix(matrices)
+        return self._rotation
+
+    @property
+    def inverse(self) -> np.ndarray:
+        """The inverse Nx4x4 transform series, as a read-only array."""
+        if self._inverse is None:
+            self._inverse = invert(self._transforms)
+            self._inverse.flags.writeable = False
+        return self._inverse
+
+    def _fill_valid(self, values: np.ndarray) -> np.ndarray:
+        """Expand values of the valid samples to N samples with NaNs."""
+        output = np.full((len(self), *values.shape[1:]), np.nan)
+        output[~self.nan_mask] = values
+        return output
+
+    def get_angles(
+        self,
+        seq: str | list[str],
+        degrees: bool = False,
+        flip: bool = False,
+    ) -> np.ndarray | dict[str, np.ndarray]:
+        """
+        Extract Euler angles, for one or multiple sequences.
+
+        Parameters
+        ----------
+        seq
+            Sequence of axes for successive rotations, as in
+            ktk.geometry.get_angles, or a list of such sequences.
+        degrees
+            If True, the returned angles are in degrees. If False, they are
+            in radians. Default is False.
+        flip
+            Return an alternate sequence with the second angle inverted, but
+            that leads to the same rotation matrices. See
+            ktk.geometry.get_angles for more information.
+
+        Returns
+        -------
+        np.ndarray | dict[str, np.ndarray]
+            An Nx3 series of Euler angles if `seq` is a string, or a dict of
+            Nx3 series of Euler angles with the sequences as keys if `seq` is
+            a list.
+
+        See Also
+        --------
+        ktk.geometry.get_angles
+
+        """
+        check_param("seq", seq, (str, list), contents_type=str)
+        check_param("degrees", degrees, bool)
+        check_param("flip", flip, bool)
+
+        if isinstance(seq, list):
+            return {
+                one_seq: self._get_angles(one_seq, degrees, flip)
+                for one_seq in seq
+            }
+        return self._get_angles(seq, degrees, flip)
+
+    def _get_angles(self, seq: str, degrees: bool, flip: bool) -> np.ndarray:
+        """Extract Euler angles for one sequence."""
+        if seq not in self._euler_angles:
+            self._euler_angles[seq] = self.rotation.as_euler(seq)
+
+        angles = self._fill_valid(self._euler_angles[seq])
+        if degrees:
+            np.rad2deg(angles, out=angles)
+
+        offset = 180 if degrees else np.pi
+
+        if flip:
+            if seq[0] == seq[2]:  # Euler angles
+                angles[:, 0] = np.mod(angles[:, 0], 2 * offset) - offset
+                angles[:, 1] = -angles[:, 1]
+                angles[:, 2] = np.mod(angles[:, 2], 2 * offset) - offset
+            else:  # Tait-Bryan angles
+                angles[:, 0] = np.mod(angles[:, 0], 2 * offset) - offset
+                angles[:, 1] = offset - angles[:, 1]
+                angles[angles[:, 1] > offset, :] -= 2 * offset
+                angles[:, 2] = np.mod(angles[:, 2], 2 * offset) - offset
+
+        return angles
+
+    def get_quaternions(
+        self, canonical: bool = False, scalar_first: bool = False
+    ) -> np.ndarray:
+        """
+        Extract quaternions.
+
+        Parameters
+        ----------
+        canonical
+            Whether to map the redundant double cover of rotation space to a
+            unique "canonical" single cover. See ktk.geometry.get_quaternions
+            for more information. Default is False.
+        scalar_first
+            Optional. If True, the quaternion order is (w, x, y, z). If
+            False, the quaternion order is (x, y, z, w). Default is False.
+
+        Returns
+        -------
+        np.ndarray
+            An Nx4 series of quaternions.
+
+        See Also
+        --------
+        ktk.geometry.get_quaternions
+
+        """
+        check_param("canonical", canonical, bool)
+        check_param("scalar_first", scalar_first, bool)
+
+        return self._fill_valid(
+            self.rotation.as_quat(
+                canonical=canonical, scalar_first=scalar_first
+            )
+        )
 
 
 def get_local_coordinates(
@@ -539,7 +762,7 @@ def get_local_coordinates(
 
     """
     global_coordinates_array = np.array(global_coordinates)
-    reference_frames_array = np.array(reference_frames)
+    reference_frames_array = np.asarray(reference_frames)
 
     _check_no_skewed_rotation(reference_frames_array, "reference_frames")
 
@@ -595,7 +818,7 @@ def get_global_coordinates(
 
     """
     local_coordinates_array = np.array(local_coordinates)
-    reference_frames_array = np.array(reference_frames)
+    reference_frames_array = np.asarray(reference_frames)
 
     _check_no_skewed_rotation(reference_frames_array, "reference_frames")
 
@@ -610,6 +833,122 @@ def get_global_coordinates(
     return global_coordinates
 
 
+def get_relative_transforms(
+    frames: "TimeSeries | dict[str, ArrayLike]",
+    pairs: list[tuple[str, str]] | dict[str, tuple[str, str]],
+    /,
+) -> "TimeSeries":
+    """
+    Express the frames of many segments in the frames of other segments.
+
+    For each (distal, proximal) pair of segments, this function calculates
+    the transform series of the distal frame expressed in the proximal
+    frame, which is the joint transform between both segments. The result is
+    the same as::
+
+        ktk.geometry.get_local_coordinates(frames[distal], frames[proximal])
+
+    but each proximal frame is checked and inverted only once, even if it is
+    shared by many pairs.
+
+    Parameters
+    ----------
+    frames
+        A TimeSeries or a dict where each data key is an Nx4x4 transform
+        series that represents a segment.
+    pairs
+        A list of (distal, proximal) tuples of segment names, in which case
+        the joint transforms are named "distal_proximal", or a dict where the
+        keys are the joint names and the values are (distal, proximal)
+        tuples.
+
+    Returns
+    -------
+    TimeSeries
+        A TimeSeries with one Nx4x4 transform series per joint. If `frames`
+        is a TimeSeries, its time and events are kept; otherwise, the time
+        is the sample index. Samples where either frame contains NaNs are
+        NaN.
+
+    See Also
+    --------
+    ktk.geometry.get_local_coordinates, ktk.geometry.RotationSeries
+
+    Example
+    -------
+    >>> thigh = ktk.geometry.create_transform_series(
+    ...     angles=[[0.0], [10.0]], seq="z", degrees=True
+    ... )
+    >>> shank = ktk.geometry.create_transform_series(
+    ...     angles=[[0.0], [30.0]], seq="z", degrees=True
+    ... )
+    >>> joints = ktk.geometry.get_relative_transforms(
+    ...     {"Thigh": thigh, "Shank": shank}, {"Knee": ("Shank", "Thigh")}
+    ... )
+    >>> angles = ktk.geometry.get_angles(
+    ...     joints.data["Knee"], "zyx", degrees=True
+    ... )
+    >>> angles[:, 0]
+    array([ 0., 20.])
+
+    """
+    from kineticstoolkit import TimeSeries  # noqa: PLC0415 circular import
+
+    check_param("frames", frames, (TimeSeries, dict))
+    check_param("pairs", pairs, (list, dict), contents_type=tuple)
+    if isinstance(pairs, list):
+        pairs = {
+            f"{distal}_{proximal}": (distal, proximal)
+            for distal, proximal in pairs
+        }
+
+    if isinstance(frames, TimeSeries):
+        frames_data = frames.data
+        ts_out = frames.get_subset([])
+    else:
+        frames_data = frames
+        ts_out = None
+
+    # Check each segment and invert each proximal frame once
+    segments = {}
+    nan_masks = {}
+    inverses = {}
+    for distal, proximal in pairs.values():
+        for segment in (distal, proximal):
+            if segment in segments:
+                continue
+            if segment not in frames_data:
+                raise KeyError(
+                    f"The segment {segment} is not in the provided frames."
+                )
+            segments[segment] = np.asarray(frames_data[segment])
+            _check_no_skewed_rotation(segments[segment], segment)
+            if not is_transform_series(segments[segment]):
+                raise ValueError(
+                    f"The frames of segment {segment} must be a series of "
+                    "homogeneous transforms."
+                )
+            nan_masks[segment] = isnan(segments[segment])
+        if proximal not in inverses:
+            inverses[proximal] = _invert(
+                segments[proximal], nan_masks[proximal]
+            )
+
+    # Calculate the joint transforms
+    joints = {}
+    for joint, (distal, proximal) in pairs.items():
+        transforms = matmul(inverses[proximal], segments[distal])
+        transforms[nan_masks[distal] | nan_masks[proximal]] = np.nan
+        joints[joint] = transforms
+
+    if ts_out is None:
+        n_samples = max([value.shape[0] for value in joints.values()] + [0])
+        ts_out = TimeSeries(time=np.arange(n_samples))
+    for joint, transforms in joints.items():
+        ts_out.data[joint] = transforms
+    return ts_out
+
+
 def get_distances(
     point_series1: ArrayLike, point_series2: ArrayLike, /
 ) -> np.ndarray:
@@ -620,24 +959,198 @@ def get_distances(
     ----------
     point_series1, point_series2
         Series of N points, as an Nx4 array-like of the form
-        [[x, y, z, 1.0], ...]
+        [[x, y, z, 1.0], ...], or series of N sets of M points, as Nx4xM
+        array-likes.
 
     Returns
     -------
     np.ndarray
-        Series of euclidian distance, as an Nx4 array of the form
-        [[x, y, z, 0.0], ...]
+        Series of euclidian distances, as an array of length N, or as an NxM
+        array for series of N sets of M points.
+
+    See Also
+    --------
+    ktk.geometry.get_pairwise_distances
 
     """
-    point_series1 = np.array(point_series1)
-    point_series2 = np.array(point_series2)
+    difference = np.subtract(point_series1, point_series2, dtype=float)
+    squared = np.einsum("nc...,nc...->n...", difference, difference)
+    return np.sqrt(squared, out=squared)
+
+
+# Number of distances calculated at once in get_pairwise_distances, which
+# sets the number of samples of each chunk.
+_PAIRWISE_CHUNK_ELEMENTS = 2**20
+
+
+def get_pairwise_distances(
+    point_series: ArrayLike, /, *, condensed: bool = False
+) -> np.ndarray:
+    """
+    Calculate the distances between every pair of points, at every sample.
+
+    Parameters
+    ----------
+    point_series
+        Series of N sets of M points, as an Nx4xM array-like.
+    condensed
+        Optional. If True, only the distances between points i and j with
+        i < j are returned, in the same order as scipy.spatial.distance.pdist,
+        which is more compact for many points. Default is False.
+
+    Returns
+    -------
+    np.ndarray
+        An NxMxM array where element [n, i, j] is the distance between points
+        i and j at sample n, or an NxP array where P = M(M-1)/2 if
+        `condensed` is True. Distances that involve a NaN point are NaN.
 
-    return np.sqrt(
-        np.sum(
-            (point_series1 - point_series2) ** 2,
-            axis=1,
+    Note
+    ----
+    The samples are processed in chunks, so that the temporary arrays stay
+    small even for long series of many points.
+
+    Example
+    -------
+    >>> points = [
+    ...     [
+    ...         [0.0, 3.0, 0.0],
+    ...         [0.0, 0.0, 4.0],
+    ...         [0.0, 0.0, 0.0],
+    ...         [1.0, 1.0, 1.0],
+    ...     ]
+    ... ]
+    >>> ktk.geometry.get_pairwise_distances(points)
+    array([[[0., 3., 4.],
+            [3., 0., 5.],
+            [4., 5., 0.]]])
+    >>> ktk.geometry.get_pairwise_distances(points, condensed=True)
+    array([[3., 4., 5.]])
+
+    """
+    points = np.asarray(point_series)
+    check_param("point_series", points, np.ndarray, shape=(-1, 4, -1))
+    check_param("condensed", condensed, bool)
+
+    n_samples, _, n_points = points.shape
+    i_pairs, j_pairs = np.triu_indices(n_points, k=1)
+    n_pairs = i_pairs.shape[0]
+    if condensed:
+        output = np.empty((n_samples, n_pairs))
+    else:
+        output = np.empty((n_samples, n_points, n_points))
+
+    chunk_length = max(1, _PAIRWISE_CHUNK_ELEMENTS // max(1, n_pairs))
+    for start in range(0, n_samples, chunk_length):
+        chunk = slice(start, start + chunk_length)
+        chunk_points = points[chunk]
+        distances = (
+            output[chunk]
+            if condensed
+            else np.empty((chunk_points.shape[0], n_pairs))
         )
+
+        # Calculate the distances of point i with every point j > i, one
+        # coordinate at a time.
+        i_pair = 0
+        for i_point in range(n_points - 1):
+            pairs = distances[:, i_pair : i_pair + n_points - i_point - 1]
+            for i_coordinate in range(3):
+                coordinate = chunk_points[:, i_coordinate]
+                difference = (
+                    coordinate[:, i_point + 1 :]
+                    - coordinate[:, i_point : i_point + 1]
+                )
+                difference *= difference
+                if i_coordinate == 0:
+                    pairs[:] = difference
+                else:
+                    pairs += difference
+            i_pair += pairs.shape[1]
+        np.sqrt(distances, out=distances)
+
+        if not condensed:
+            square = output[chunk]
+            square[:, i_pairs, j_pairs] = distances
+            square[:, j_pairs, i_pairs] = distances
+            diagonal = np.arange(n_points)
+            square[:, diagonal, diagonal] = np.where(
+                np.isnan(chunk_points[:, 0:3]).any(axis=1), np.nan, 0.0
+            )
+
+    return output
+
+
+def get_rigidity_scores(
+    point_series: ArrayLike,
+    /,
+    reference_distances: ArrayLike | None = None,
+) -> np.ndarray:
+    """
+    Measure how much a set of points deviates from a rigid body.
+
+    At each sample, the score is the root mean square difference between
+    the distances of every pair of points and their reference distances.
+    For a cluster of markers on a rigid body, the score stays close to zero;
+    peaks generally reveal mislabelled, swapped or noisy markers.
+
+    Parameters
+    ----------
+    point_series
+        Series of N sets of M points, as an Nx4xM array-like.
+    reference_distances
+        Optional. The expected distances between each pair of points, as an
+        MxM array-like, such as those returned by get_pairwise_distances for
+        a static acquisition. If None, the median distances over the whole
+        series are used.
+
+    Returns
+    -------
+    np.ndarray
+        Array of N scores, in the units of the points. Pairs that involve a
+        NaN point are ignored, and samples where no pair can be calculated
+        are NaN.
+
+    See Also
+    --------
+    ktk.geometry.get_pairwise_distances
+
+    Example
+    -------
+    >>> points = np.array(
+    ...     [[[0.0, 0.1], [0.0, 0.0], [0.0, 0.0], [1.0, 1.0]]] * 3
+    ... )
+    >>> points[2, 0, 1] = 0.13  # The second point moves at sample 2
+    >>> ktk.geometry.get_rigidity_scores(points).round(3)
+    array([0.  , 0.  , 0.03])
+
+    """
+    distances = get_pairwise_distances(point_series, condensed=True)
+    n_points = np.shape(point_series)[2]
+    i_pairs, j_pairs = np.triu_indices(n_points, k=1)
+
+    if reference_distances is None:
+        nan_pairs = np.all(np.isnan(distances), axis=0)
+        reference = np.full(distances.shape[1], np.nan)
+        reference[~nan_pairs] = np.nanmedian(distances[:, ~nan_pairs], axis=0)
+    else:
+        reference_array = np.asarray(reference_distances, dtype=float)
+        check_param(
+            "reference_distances",
+            reference_array,
+            np.ndarray,
+            shape=(n_points, n_points),
+        )
+        reference = reference_array[i_pairs, j_pairs]
+
+    deviations = distances - reference
+    deviations *= deviations
+    n_valid = np.sum(~np.isnan(deviations), axis=1)
+    scores = np.full(distances.shape[0], np.nan)
+    scores[n_valid > 0] = np.sqrt(
+        np.nansum(deviations[n_valid > 0], axis=1) / n_valid[n_valid > 0]
     )
+    return scores
 
 
 # %% "is" functions
@@ -659,10 +1172,11 @@ def isnan(array: ArrayLike, /) -> np.ndarray:
         True for the samples that contain at least one NaN.
 
     """
-    temp = np.isnan(array)
-    while len(temp.shape) > 1:
-        temp = temp.sum(axis=1) > 0
-    return temp
+    array = np.asarray(array)
+    if array.ndim <= 1:
+        return np.isnan(array)
+    # Reduce all the non-time dimensions at once, without copying
+    return np.isnan(array.reshape((array.shape[0], -1))).any(axis=1)
 
 
 def is_transform_series(array: ArrayLike, /) -> bool:
@@ -681,7 +1195,7 @@ def is_transform_series(array: ArrayLike, /) -> bool:
         4x4 homogeneous transform.
 
     """
-    value = np.array(array)
+    value = np.asarray(array)
 
     # Check the dimension
     if len(value.shape) != 3:
@@ -691,11 +1205,14 @@ def is_transform_series(array: ArrayLike, /) -> bool:
 
     # Check that we don't only have NaNs
     index = ~isnan(value)
-    if np.sum(index) == 0:
+    if not np.any(index):
         return False
 
     # Check the last line
-    if not np.allclose(value[index, 3], [0.0, 0.0, 0.0, 1.0]):
+    if not np.allclose(
+        value[:, 3] if np.all(index) else value[index, 3],
+        [0.0, 0.0, 0.0, 1.0],
+    ):
         return False
 
     # Check that the rotation is not skewed
@@ -709,7 +1226,7 @@ def is_transform_series(array: ArrayLike, /) -> bool:
 
 def _is_point_vector_series(array: ArrayLike, last_element: float) -> bool:
     """Check if the input is a `kind` series."""
-    value = np.array(array)
+    value = np.asarray(array)
 
     # Check the dimension
     if len(value.shape) != 2:
@@ -1203,6 +1720,21 @@ def _quaternions_to_frame_series(
     return output
 
 
+# Vector input forms of _vectors_to_frame_series: (primary axis, plane) ->
+# (column of the primary axis, column of the second axis, sign of the second
+# axis, column of the third axis). The second axis is the normalized cross
+# product of the primary axis and the plane vector, and the third axis
+# completes the right-handed frame.
+_VECTOR_FORMS = {
+    ("x", "xy"): (0, 2, 1.0, 1),
+    ("x", "xz"): (0, 1, -1.0, 2),
+    ("y", "yz"): (1, 0, 1.0, 2),
+    ("y", "xy"): (1, 2, -1.0, 0),
+    ("z", "xz"): (2, 1, 1.0, 0),
+    ("z", "yz"): (2, 0, -1.0, 1),
+}
+
+
 def _vectors_to_frame_series(
     x: ArrayLike | None = None,
     y: ArrayLike | None = None,
@@ -1210,74 +1742,98 @@ def _vectors_to_frame_series(
     xy: ArrayLike | None = None,
     xz: ArrayLike | None = None,
     yz: ArrayLike | None = None,
+    *,
+    out: np.ndarray | None = None,
 ):
-    """Create a frame series from cross products, with a zero origin."""
+    """
+    Create a frame series from cross products, with a zero origin.
 
-    def normalize(v):
-        """Normalize series of vectors."""
-        if not is_vector_series(v):
-            if is_point_series(v):
-                v[:, 3] = 0.0  # Convert to a vector series
-            else:
-                raise ValueError(
-                    "At least one of the provided vectors series is not a "
-                    "vector series."
-                )
-        norm = np.linalg.norm(v, axis=1)
-        return v / norm[..., np.newaxis]
+    The frames are built directly into one Nx4x4 array, which is `out` if
+    provided. The only temporary array is the Nx3x3 rotational part.
+    """
+    vectors = {"x": x, "y": y, "z": z, "xy": xy, "xz": xz, "yz": yz}
+    planes = {"x": ("xy", "xz"), "y": ("yz", "xy"), "z": ("xz", "yz")}
 
-    def cross(v1, v2):
-        """Cross on series of vectors."""
-        c = v1.copy()
-        c[:, 0:3] = np.cross(v1[:, 0:3], v2[:, 0:3])
-        return c
+    for primary_name in ["x", "y", "z"]:
+        if vectors[primary_name] is not None:
+            break
+    else:
+        raise ValueError("Either x, y or z must be set.")
 
-    if x is not None:
-        v_x = normalize(np.array(x))
-        if xy is not None:
-            v_z = normalize(cross(v_x, np.array(xy)))
-            v_y = cross(v_z, v_x)
-        elif xz is not None:
-            v_y = -normalize(cross(v_x, np.array(xz)))
-            v_z = cross(v_x, v_y)
-        else:
-            raise ValueError("Either xy or xz must be set.")
+    for plane_name in planes[primary_name]:
+        if vectors[plane_name] is not None:
+            break
+    else:
+        plane_names = {"x": "xy or xz", "y": "xy or yz", "z": "yz or xz"}
+        raise ValueError(f"Either {plane_names[primary_name]} must be set.")
 
-    elif y is not None:
-        v_y = normalize(np.array(y))
-        if yz is not None:
-            v_x = normalize(cross(v_y, np.array(yz)))
-            v_z = cross(v_x, v_y)
-        elif xy is not None:
-            v_z = -normalize(cross(v_y, np.array(xy)))
-            v_x = cross(v_y, v_z)
-        else:
-            raise ValueError("Either xy or yz must be set.")
+    primary = np.asarray(vectors[primary_name])
+    if not is_vector_series(primary) and not is_point_series(primary):
+        raise ValueError(
+            "At least one of the provided vectors series is not a "
+            "vector series."
+        )
+    plane = np.asarray(vectors[plane_name])
 
-    elif z is not None:
-        v_z = normalize(np.array(z))
-        if xz is not None:
-            v_y = normalize(cross(v_z, np.array(xz)))
-            v_x = cross(v_y, v_z)
-        elif yz is not None:
-            v_x = -normalize(cross(v_z, np.array(yz)))
-            v_y = cross(v_z, v_x)
-        else:
-            raise ValueError("Either yz or xz must be set.")
+    if out is None:
+        n_samples = max(primary.shape[0], plane.shape[0])
+        out = np.empty((n_samples, 4, 4))
 
-    else:
-        raise ValueError("Either x, y or z must be set.")
+    i_primary, i_second, sign, i_third = _VECTOR_FORMS[
+        (primary_name, plane_name)
+    ]
 
-    return np.stack(
-        (
-            v_x,
-            v_y,
-            v_z,
-            create_point_series([[0.0, 0.0, 0.0]], length=v_x.shape[0]),
-        ),
-        axis=2,
+    # The rotation is computed component by component, on contiguous
+    # arrays of shape (N,): rotation[i, j] is component i of axis j.
+    rotation = np.empty((3, 3, out.shape[0]))
+
+    def normalize(axis: int) -> None:
+        """Normalize an axis of the rotation, in place."""
+        vectors = rotation[:, axis]
+        vectors /= np.sqrt(np.einsum("in,in->n", vectors, vectors))
+
+    def cross(axis: int, v1: np.ndarray, v2: np.ndarray) -> None:
+        """Write the cross products of two series of vectors in an axis."""
+        for i in range(3):
+            j = (i + 1) % 3
+            k = (i + 2) % 3
+            np.multiply(v1[j], v2[k], out=rotation[i, axis])
+            rotation[i, axis] -= v1[k] * v2[j]
+
+    rotation[:, i_primary] = primary[:, 0:3].T
+    normalize(i_primary)
+    cross(i_second, rotation[:, i_primary], sign * plane[:, 0:3].T)
+    normalize(i_second)
+    cross(
+        i_third,
+        rotation[:, (i_third + 1) % 3],
+        rotation[:, (i_third + 2) % 3],
     )
 
+    out[:, 0:3, 0:3] = rotation.transpose((2, 0, 1))
+    out[:, 3, :] = [0.0, 0.0, 0.0, 1.0]
+    out[:, 0:3, 3] = 0.0
+    return out
+
+
+def _match_length(
+    output: np.ndarray, length: int | None, out: np.ndarray | None
+) -> np.ndarray:
+    """Repeat a one-sample series to length, and copy it in out if needed."""
+    if length is not None and output.shape[0] != length:
+        if output.shape[0] != 1:
+            raise ValueError(
+                f"The provided input must have a length of 1 or {length}"
+                f"but it has a length of {output.shape[0]}."
+            )
+        if out is None:
+            output = np.repeat(output, length, axis=0)
+
+    if out is not None and output is not out:
+        out[:] = output
+        return out
+    return output
+
 
 def create_transform_series(
     matrices: ArrayLike | None = None,
@@ -1295,6 +1851,7 @@ def create_transform_series(
     yz: ArrayLike | None = None,
     positions: ArrayLike | None = None,
     length: int | None = None,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Create an Nx4x4 transform series from multiple input forms.
@@ -1428,10 +1985,17 @@ def create_transform_series(
         duplicated to match length. Otherwise, an error is raised if the input
         array does not match length.
 
+    out
+        Optional. A preallocated Nx4x4 float array in which to write the
+        transform series, for instance a slice of a larger array of many
+        segments. With the vector input form, the frames are built directly
+        in this array, without intermediate Nx4x4 arrays. If `length` is not
+        specified, it is the length of `out`.
+
     Returns
     -------
     np.ndarray
-        An Nx4x4 transform series.
+        An Nx4x4 transform series. This is `out` if it was provided.
 
     Examples
     --------
@@ -1482,6 +2046,15 @@ def create_transform_series(
     check_param("scalar_first", scalar_first, bool)
     if length is not None:
         check_param("length", length, int)
+    if out is not None:
+        check_param("out", out, np.ndarray, shape=(-1, 4, 4))
+        if length is None:
+            length = out.shape[0]
+        elif length != out.shape[0]:
+            raise ValueError(
+                f"The length of out is {out.shape[0]}, but a length of "
+                f"{length} was provided."
+            )
 
     # Form the rotational part using the correct implementation
     if matrices is not None:
@@ -1495,25 +2068,20 @@ def create_transform_series(
             quaternions=quaternions, scalar_first=scalar_first
         )
     elif x is not None or y is not None or z is not None:
-        output = _vectors_to_frame_series(x=x, y=y, z=z, xy=xy, xz=xz, yz=yz)
+        output = _vectors_to_frame_series(
+            x=x, y=y, z=z, xy=xy, xz=xz, yz=yz, out=out
+        )
     else:
         raise ValueError("Insufficient parameters.")
 
     # Match length and add origin
-    if length is not None:
-        if output.shape[0] == 1:
-            output = np.repeat(output, length, axis=0)
-        elif output.shape[0] != length:
-            raise ValueError(
-                f"The provided input must have a length of 1 or {length}"
-                f"but it has a length of {output.shape[0]}."
-            )
+    output = _match_length(output, length, out)
 
     # Add origin if needed
     if (
         matrices is not None
-        and is_transform_series(matrices)
         and positions is None
+        and is_transform_series(matrices)
     ):
         # This was already a frame series and we don't want to set the origin.
         return output
@@ -1524,15 +2092,10 @@ def create_transform_series(
             positions = create_point_series(positions, length=length)
         except ValueError as e:
             raise ValueError(f"Parameter positions is invalid: {e}")
+        output[:, :, 3] = positions
     else:
-        try:
-            positions = create_point_series(
-                [[0.0, 0.0, 0.0, 1.0]], length=length
-            )
-        except ValueError as e:
-            raise ValueError(f"Parameter positions is invalid: {e}")
+        output[:, :, 3] = [0.0, 0.0, 0.0, 1.0]
 
-    output[:, :, 3] = positions
     return output
 
 
@@ -1558,43 +2121,26 @@ def register_points(
         transforms.
 
     """
-    global_points = np.array(global_points)
-    local_points = np.array(local_points)
-
-    n_samples = global_points.shape[0]
-
-    # Prealloc the transformation matrix
-    T = np.zeros((n_samples, 4, 4))
-    T[:, 3, 3] = np.ones(n_samples)
-
-    for i_sample in range(n_samples):
-        # Identify which global points are visible
-        sample_global_points = global_points[i_sample]
-        sample_global_points_missing = np.isnan(
-            np.sum(sample_global_points, axis=0)
-        )
-
-        # Identify which local points are visible
-        sample_local_points = local_points[i_sample]
-        sample_local_points_missing = np.isnan(
-            np.sum(sample_local_points, axis=0)
-        )
-
-        sample_points_missing = np.logical_or(
-            sample_global_points_missing, sample_local_points_missing
-        )
-
-        # If at least 3 common points are visible between local and global
-        # points, then we can regress the transformation.
-        if sum(~sample_points_missing) >= 3:
-            T[i_sample] = icp.best_fit_transform(
-                sample_local_points[0:3, ~sample_points_missing].T,
-                sample_global_points[0:3, ~sample_points_missing].T,
-            )[0]
-        else:
-            T[i_sample] = np.nan
+    # Imported on first use since it is slow to import
+    from kineticstoolkit.external import icp  # noqa: PLC0415
+
+    global_points = np.asarray(global_points, dtype=float)
+    local_points = np.asarray(local_points, dtype=float)
+
+    # Only use the points that are visible in both global and local points.
+    # If at least 3 common points are visible, then we can regress the
+    # transformation; otherwise, the transform is NaN.
+    points_visible = ~(
+        np.isnan(global_points).any(axis=1)
+        | np.isnan(local_points).any(axis=1)
+    )
 
-    return T
+    # Register every sample at once
+    return icp.best_fit_transforms(
+        np.swapaxes(local_points[:, 0:3], 1, 2),
+        np.swapaxes(global_points[:, 0:3], 1, 2),
+        points_visible,
+    )
 
 
 # %% Private functions
@@ -1629,10 +2175,117 @@ def _match_size(
     return op1, op2
 
 
+# Read-only transform series that passed _check_no_skewed_rotation:
+# id -> (weak reference, data pointer, shape, strides, dtype)
+_validated_rotations: dict[int, tuple] = {}
+
+
+def _is_read_only(series: np.ndarray) -> bool:
+    """
+    Check if the values of an array cannot be modified.
+
+    The array and every array it is a view of must be read-only, and its
+    memory must be owned by an array or by an immutable bytes object.
+    """
+    base = series
+    while isinstance(base, np.ndarray):
+        if base.flags.writeable:
+            return False
+        base = base.base
+    return base is None or isinstance(base, bytes)
+
+
+def _get_rotation_fingerprint(series: np.ndarray) -> tuple:
+    """Return a tuple that identifies the memory layout of an array."""
+    return (
+        series.__array_interface__["data"][0],
+        series.shape,
+        series.strides,
+        series.dtype,
+    )
+
+
+def _is_validated_rotation(series: np.ndarray) -> bool:
+    """Check if a transform series already passed the orthogonality check."""
+    try:
+        reference, *fingerprint = _validated_rotations[id(series)]
+    except KeyError:
+        return False
+    return (
+        reference() is series
+        and _is_read_only(series)
+        and tuple(fingerprint) == _get_rotation_fingerprint(series)
+    )
+
+
+def _set_validated_rotation(series: np.ndarray) -> None:
+    """
+    Remember that a transform series passed the orthogonality check.
+
+    Only read-only series are remembered, since the values of writeable
+    series may be modified at any time.
+    """
+    if not _is_read_only(series):
+        return
+    key = id(series)
+    try:
+        reference = weakref.ref(
+            series, lambda _: _validated_rotations.pop(key, None)
+        )
+    except TypeError:  # Some array subclasses do not support weakrefs
+        return
+    _validated_rotations[key] = (
+        reference,
+        *_get_rotation_fingerprint(series),
+    )
+
+
+def _get_skewed_rotations(series: np.ndarray) -> np.ndarray:
+    """
+    Find the rotation matrices that are not orthogonal.
+
+    Each unique element of R @ R.T is calculated with einsum, row by row, and
+    compared to the identity with the tolerances of np.allclose. Samples with
+    NaNs are never reported as skewed.
+
+    Parameters
+    ----------
+    series : array of shape Nx4x4
+        The input series.
+
+    Returns
+    -------
+    np.ndarray
+        Array of N bools, with True for the skewed rotation matrices.
+
+    """
+    rtol = 1e-5
+    atol = 1e-8
+    skewed = np.zeros(series.shape[0], dtype=bool)
+    for i in range(3):
+        for j in range(i, 3):
+            product = np.einsum(
+                "nk,nk->n",
+                series[:, i, 0:3],
+                series[:, j, 0:3],
+                dtype=float,
+            )
+            if i == j:
+                product -= 1.0
+            np.abs(product, out=product)
+            # Comparisons with NaN are False, so that NaNs are ignored
+            skewed |= product > (atol + rtol if i == j else atol)
+    return skewed
+
+
 def _check_no_skewed_rotation(series: np.ndarray, param_name) -> None:
     """
     Check if all rotation matrices are orthogonal.
 
+    If config.rotation_check_samples is set, only this number of evenly
+    spaced samples are checked. Read-only series that pass a complete check
+    are remembered and not checked again.
+
     Parameters
     ----------
     matrix_series : array of shape Nx4x4
@@ -1646,27 +2299,38 @@ def _check_no_skewed_rotation(series: np.ndarray, param_name) -> None:
         If at least one skewed rotation matrix is found in the provided series.
 
     """
-    if (
+    if not (
         len(series.shape) == 3
         and series.shape[1] == 4
         and series.shape[2] == 4
-    ):
-        series33 = series[:, 0:3, 0:3]
-        if not np.allclose(
-            matmul(series33, series33.transpose([0, 2, 1]))[~isnan(series)],
-            np.eye(3),
-        ):
-            raise ValueError(
-                f"Parameter {param_name} contains at least one rotation "
-                "component that is not orthogonal. This may happen, for "
-                "instance, if you attempted to average, resample, or filter a "
-                "homogeneous transform, which is usually forbidden. If this "
-                "is the case, then consider filtering quaternions or Euler "
-                "angles instead. If you created a homogeneous transform from "
-                "3D points, then average/resample/filter the "
-                "point trajectories before creating the transform, instead "
-                "of averaging/resampling/filtering the transform."
-            )
+    ) or _is_validated_rotation(series):
+        return
+
+    n_samples = series.shape[0]
+    n_checked = config.rotation_check_samples
+    if n_checked is not None and n_checked < n_samples:
+        checked = series[
+            np.round(np.linspace(0, n_samples - 1, n_checked)).astype(int)
+        ]
+    else:
+        checked = series
+
+    skewed = _get_skewed_rotations(checked)
+    if np.any(skewed) and np.any(skewed & ~isnan(checked)):
+        raise ValueError(
+            f"Parameter {param_name} contains at least one rotation "
+            "component that is not orthogonal. This may happen, for "
+            "instance, if you attempted to average, resample, or filter a "
+            "homogeneous transform, which is usually forbidden. If this "
+            "is the case, then consider filtering quaternions or Euler "
+            "angles instead. If you created a homogeneous transform from "
+            "3D points, then average/resample/filter the "
+            "point trajectories before creating the transform, instead "
+            "of averaging/resampling/filtering the transform."
+        )
+
+    if checked is series:
+        _set_validated_rotation(series)
 
 
 # %% To deprecate in version 1.0
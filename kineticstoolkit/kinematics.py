@@ -28,12 +28,20 @@ import numpy as np
 from kineticstoolkit import TimeSeries, geometry
 from kineticstoolkit.typing_ import check_param
 
+# Number of marker-to-candidate distances calculated at once in
+# relabel_markers, which sets the number of samples of each chunk.
+_RELABEL_CHUNK_ELEMENTS = 2**22
+
+# Number of track-then-assign passes in relabel_markers
+_RELABEL_PASSES = 2
+
 
 def __dir__():
     return [
         "create_cluster",
         "extend_cluster",
         "track_cluster",
+        "relabel_markers",
     ]
 
 
@@ -216,6 +224,285 @@ def track_cluster(
     return out
 
 
+def relabel_markers(
+    markers: TimeSeries,
+    /,
+    cluster: dict[str, np.ndarray],
+    *,
+    candidates: list[str] | None = None,
+    max_distance: float | None = None,
+) -> TimeSeries:
+    """
+    Fix swapped or unlabeled markers of a cluster.
+
+    After occlusions, markers often reappear swapped with other markers of
+    the same cluster, or unlabeled. This function predicts where each marker
+    of the cluster should be at every sample, based on the rigidity of the
+    cluster, and assigns to each marker the nearest candidate trajectory
+    point at each sample.
+
+    The prediction is done in passes. At each pass, the cluster is tracked
+    using the current labels. Samples where the labelled markers do not fit
+    the rigid cluster (e.g., because markers are swapped) or where the
+    cluster cannot be tracked (e.g., during occlusions) are registered
+    instead on the unlabelled candidate points that are within
+    `max_distance` of the cluster pose at the adjacent sample, using the
+    iterative closest point algorithm. Then, at every sample, each expected
+    marker position is paired with the nearest available candidate point,
+    with no candidate used twice. Samples where no pose can be estimated,
+    for instance because less than three candidates are visible, keep their
+    original labels.
+
+    Parameters
+    ----------
+    markers
+        A TimeSeries that contains point trajectories as Nx4 arrays.
+    cluster
+        A cluster definition as returned by ktk.kinematics.create_cluster().
+        Only the cluster points that are in `markers` are relabeled, so that
+        virtual points such as probed landmarks are ignored.
+    candidates
+        Optional. The data keys of the trajectories that can be assigned to
+        the cluster markers, for instance the cluster markers and some
+        unlabeled markers. The default is the cluster markers.
+    max_distance
+        Optional. The maximal distance between an expected marker position
+        and the assigned candidate point. Markers without any candidate
+        within this distance are NaN. The default is half the smallest
+        distance between two markers of the cluster.
+
+    Returns
+    -------
+    TimeSeries
+        A copy of `markers`, where the cluster markers are replaced by the
+        relabeled trajectories. The other trajectories are not modified.
+
+    See Also
+    --------
+    ktk.kinematics.create_cluster
+    ktk.kinematics.track_cluster
+    ktk.geometry.get_rigidity_scores
+
+    """
+    check_param("markers", markers, TimeSeries)
+    check_param("cluster", cluster, dict, key_type=str)
+    for key, points in cluster.items():
+        cluster[key] = np.array(points)
+    names = [name for name in cluster if name in markers.data]
+    if candidates is None:
+        candidates = names
+    check_param("candidates", candidates, list, contents_type=str)
+    if max_distance is not None:
+        check_param("max_distance", max_distance, float)
+    if len(names) < 3:
+        raise ValueError(
+            "At least three markers of the cluster must be in the markers "
+            f"TimeSeries to relabel them, but only {names} were found."
+        )
+    for candidate in candidates:
+        if candidate not in markers.data:
+            raise KeyError(f"The candidate {candidate} is not in markers.")
+
+    local_points = np.dstack([cluster[name] for name in names])
+    if max_distance is None:
+        distances = geometry.get_pairwise_distances(
+            local_points, condensed=True
+        )
+        max_distance = 0.5 * float(np.min(distances))
+
+    observed_points = np.dstack(
+        [markers.data[candidate] for candidate in candidates]
+    )
+    initial_points = np.dstack([markers.data[name] for name in names])
+    labelled_points = initial_points
+
+    for _ in range(_RELABEL_PASSES):
+        frames = _get_frames_without_labels(
+            labelled_points, observed_points, local_points, max_distance
+        )
+        expected_points = geometry.matmul(frames, local_points)
+        labelled_points = _assign_nearest_points(
+            expected_points, observed_points, max_distance
+        )
+        # Without any pose estimate, keep the original labels
+        is_untracked = geometry.isnan(frames)
+        labelled_points[is_untracked] = initial_points[is_untracked]
+
+    out = markers.copy()
+    for i_name, name in enumerate(names):
+        out.data[name] = labelled_points[:, :, i_name]
+    return out
+
+
+def _get_frames_without_labels(
+    labelled_points: np.ndarray,
+    observed_points: np.ndarray,
+    local_points: np.ndarray,
+    max_distance: float,
+) -> np.ndarray:
+    """
+    Track a cluster even where its markers are mislabelled.
+
+    The cluster is first tracked using the labelled markers. Poses where a
+    visible labelled marker is farther than max_distance / 2 from its
+    expected position are unreliable. These samples are registered on the
+    observed points using ICP, which does not rely on labels, starting from
+    the pose of the adjacent sample toward the nearest reliable pose. Only
+    the observed points within max_distance of a marker at this adjacent
+    pose are registered, so that distant candidates do not attract the
+    cluster. Every run of unreliable samples is processed in parallel, one
+    step at a time. Samples that cannot be registered are NaN, but the
+    next samples still start from the last registered pose.
+    """
+    # Imported on first use since it is slow to import
+    from kineticstoolkit.external import icp  # noqa: PLC0415
+
+    local_points, labelled_points = geometry._match_size(
+        local_points, labelled_points
+    )
+    frames = geometry.register_points(labelled_points, local_points)
+    errors = geometry.get_distances(
+        geometry.matmul(frames, local_points), labelled_points
+    )
+    is_reliable = ~np.any(
+        errors > 0.5 * max_distance, axis=1
+    ) & ~geometry.isnan(frames)
+    if not np.any(is_reliable):
+        raise ValueError(
+            "The cluster could not be tracked at any sample. The cluster "
+            "markers may be mislabelled during the whole TimeSeries."
+        )
+
+    # For each unreliable sample, find the adjacent sample to start from,
+    # and the number of steps from the nearest preceding reliable sample
+    # (or following, for the first samples).
+    n_samples = frames.shape[0]
+    indexes = np.arange(n_samples)
+    first_reliable = np.argmax(is_reliable)
+    last_reliable = np.where(is_reliable, indexes, 0)
+    np.maximum.accumulate(last_reliable, out=last_reliable)
+    previous = indexes - 1
+    steps = indexes - last_reliable
+    previous[:first_reliable] = indexes[:first_reliable] + 1
+    steps[:first_reliable] = first_reliable - indexes[:first_reliable]
+    steps[is_reliable] = 0
+
+    is_estimated = is_reliable.copy()
+    tree = icp.cKDTree(local_points[0, 0:3].T)
+    for step in range(1, np.max(steps) + 1):
+        samples = np.nonzero(steps == step)[0]
+        frames[samples] = frames[previous[samples]]
+
+        # Ignore the observed points that are far from every marker
+        predicted_points = geometry.matmul(
+            frames[samples], local_points[samples]
+        )
+        squared = np.zeros(
+            (
+                samples.shape[0],
+                predicted_points.shape[2],
+                observed_points.shape[2],
+            )
+        )
+        for i_coordinate in range(3):
+            difference = (
+                predicted_points[:, i_coordinate, :, np.newaxis]
+                - observed_points[samples, i_coordinate, np.newaxis, :]
+            )
+            squared += difference * difference
+        is_gated = np.any(squared <= max_distance**2, axis=1)  # NaN: False
+        gated_points = np.where(
+            is_gated[:, np.newaxis, :], observed_points[samples], np.nan
+        )
+
+        transforms, _, _ = icp.icp_batch(
+            np.swapaxes(gated_points[:, 0:3], 1, 2),
+            local_points[0, 0:3].T,
+            init_poses=geometry.invert(frames[samples]),
+            tree=tree,
+        )
+        is_registered = ~geometry.isnan(transforms)
+        if np.any(is_registered):
+            frames[samples[is_registered]] = geometry.invert(
+                transforms[is_registered]
+            )
+            is_estimated[samples[is_registered]] = True
+
+    frames[~is_estimated] = np.nan
+    return frames
+
+
+def _assign_nearest_points(
+    expected_points: np.ndarray,
+    observed_points: np.ndarray,
+    max_distance: float,
+) -> np.ndarray:
+    """
+    Assign the nearest observed point to each expected point, per sample.
+
+    Pairs are assigned from the nearest to the farthest, so that each
+    observed point is used only once per sample. Expected points without any
+    observed point within max_distance are NaN.
+
+    Parameters
+    ----------
+    expected_points
+        Nx4xM series of expected points.
+    observed_points
+        Nx4xK series of observed points, which may contain NaNs.
+    max_distance
+        The maximal distance between paired points.
+
+    Returns
+    -------
+    np.ndarray
+        Nx4xM series of the observed points that are assigned to each
+        expected point.
+
+    """
+    n_samples, _, n_expected = expected_points.shape
+    n_observed = observed_points.shape[2]
+    output = np.full(expected_points.shape, np.nan)
+
+    chunk_length = max(
+        1, _RELABEL_CHUNK_ELEMENTS // max(1, n_expected * n_observed)
+    )
+    for start in range(0, n_samples, chunk_length):
+        chunk = slice(start, start + chunk_length)
+        expected = expected_points[chunk]
+        observed = observed_points[chunk]
+        n_chunk = expected.shape[0]
+
+        # Squared distances between every expected and observed point
+        squared = np.zeros((n_chunk, n_expected, n_observed))
+        for i_coordinate in range(3):
+            difference = (
+                expected[:, i_coordinate, :, np.newaxis]
+                - observed[:, i_coordinate, np.newaxis, :]
+            )
+            squared += difference * difference
+        squared[~(squared <= max_distance**2)] = np.inf  # Including NaNs
+
+        # Pair the nearest points first, for every sample at once
+        samples = np.arange(n_chunk)
+        for _ in range(min(n_expected, n_observed)):
+            nearest = np.argmin(squared.reshape((n_chunk, -1)), axis=1)
+            i_expected, i_observed = np.divmod(nearest, n_observed)
+            is_paired = np.isfinite(squared[samples, i_expected, i_observed])
+            if not np.any(is_paired):
+                break
+            paired = samples[is_paired]
+            i_expected = i_expected[is_paired]
+            i_observed = i_observed[is_paired]
+            output[start + paired, :, i_expected] = observed[
+                paired, :, i_observed
+            ]
+            squared[paired, i_expected, :] = np.inf
+            squared[paired, :, i_observed] = np.inf
+
+    return output
+
+
 def _track_cluster_frames(
     markers: TimeSeries, cluster: dict[str, np.ndarray]
 ) -> np.ndarray:
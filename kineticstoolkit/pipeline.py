@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020-2025 Félix Chénier
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Provide the Pipeline class to chain TimeSeries processing steps."""
+
+__author__ = "Félix Chénier"
+__copyright__ = "Copyright (C) 2020-2025 Félix Chénier"
+__email__ = "chenier.felix@uqam.ca"
+__license__ = "Apache 2.0"
+
+
+from typing import Any
+
+import numpy as np
+
+from kineticstoolkit import cycles, filters
+from kineticstoolkit.timeseries import TimeSeries
+from kineticstoolkit.typing_ import ArrayLike, check_param
+
+
+def __dir__():
+    return ["Pipeline"]
+
+
+class Pipeline:
+    """
+    A lazy chain of processing steps on a TimeSeries.
+
+    A Pipeline records processing steps without executing them. When the
+    pipeline is run, compatible steps are fused, the input TimeSeries is
+    copied only once, and every step that can be executed in place is
+    executed on this single copy.
+
+    The following steps are fused:
+
+    - Consecutive identical `fill` steps are executed once, since filling
+      the same gaps again has no effect.
+    - Consecutive `butter` steps with the same `filtfilt` value are
+      executed as a single cascade of second-order sections. In filtfilt
+      mode, the cascade has the same frequency response as the individual
+      filters, but its edge effects on the first and last samples may
+      differ slightly.
+
+    Parameters
+    ----------
+    ts
+        The TimeSeries to process.
+
+    Example
+    -------
+    >>> ts = ktk.TimeSeries(time=np.arange(0, 10, 0.01))
+    >>> ts = ts.add_data("signal", np.sin(ts.time))
+
+    >>> pipeline = (
+    ...     ktk.Pipeline(ts)
+    ...     .fill(10)
+    ...     .butter(10.0)
+    ...     .butter(0.1, btype="highpass")
+    ...     .resample(50.0)
+    ... )
+    >>> print(pipeline.explain())
+    1. fill(max_missing_samples=10, method='linear')
+    2. butter(fc=10.0, order=2, btype='lowpass')
+       + butter(fc=0.1, order=2, btype='highpass'), filtfilt=True
+    3. resample(target=50.0, kind='linear', extrapolate=False)
+
+    >>> ts_processed = pipeline.run()
+
+    """
+
+    _ts: TimeSeries
+    _steps: list[tuple[str, dict[str, Any]]]
+
+    def __init__(self, ts: TimeSeries, /):
+        check_param("ts", ts, TimeSeries)
+        self._ts = ts
+        self._steps = []
+
+    def __repr__(self) -> str:
+        return f"Pipeline with {len(self._steps)} steps:\n{self.explain()}"
+
+    def _add_step(self, operation: str, **kwargs) -> "Pipeline":
+        """Return a new Pipeline with an additional step."""
+        pipeline = Pipeline(self._ts)
+        pipeline._steps = [*self._steps, (operation, kwargs)]
+        return pipeline
+
+    def fill(
+        self, max_missing_samples: int = 0, *, method: str = "linear"
+    ) -> "Pipeline":
+        """
+        Add a step that fills missing samples.
+
+        Parameters
+        ----------
+        max_missing_samples
+            Optional. Maximal number of consecutive missing samples to
+            fill. Set to zero to fill all missing samples. The default is 0.
+        method
+            Optional. The interpolation method, as in
+            ktk.TimeSeries.fill_missing_samples. The default is "linear".
+
+        Returns
+        -------
+        Pipeline
+            A new Pipeline with this additional step.
+
+        See Also
+        --------
+        ktk.TimeSeries.fill_missing_samples
+
+        """
+        check_param("max_missing_samples", max_missing_samples, int)
+        check_param("method", method, str)
+        return self._add_step(
+            "fill", max_missing_samples=max_missing_samples, method=method
+        )
+
+    def butter(
+        self,
+        fc: float | tuple[float, float],
+        *,
+        order: int = 2,
+        btype: str = "lowpass",
+        filtfilt: bool = True,
+    ) -> "Pipeline":
+        """
+        Add a step that applies a Butterworth filter.
+
+        Parameters
+        ----------
+        fc
+            Cut-off frequency in Hz, as in ktk.filters.butter.
+        order
+            Optional. Order of the filter. Default is 2.
+        btype
+            Optional. Can be either "lowpass", "highpass", "bandpass" or
+            "bandstop". Default is "lowpass".
+        filtfilt
+            Optional. If True, the filter is applied two times in reverse
+            direction to eliminate time lag. Default is True.
+
+        Returns
+        -------
+        Pipeline
+            A new Pipeline with this additional step.
+
+        See Also
+        --------
+        ktk.filters.butter
+
+        """
+        if not np.isscalar(fc):
+            # Normalized even without validation, for ktk.filters.butter
+            fc = tuple(fc)  # type: ignore
+        try:
+            check_param("fc", fc, float)
+        except TypeError:
+            try:
+                check_param("fc", fc, tuple, length=2, contents_type=float)
+            except TypeError:
+                raise TypeError(
+                    "fc must be an integer or a tuple or 2 floats."
+                )
+        check_param("order", order, int)
+        check_param(
+            "btype",
+            btype,
+            str,
+            expected_values=["lowpass", "highpass", "bandpass", "bandstop"],
+        )
+        check_param("filtfilt", filtfilt, bool)
+        return self._add_step(
+            "butter", fc=fc, order=order, btype=btype, filtfilt=filtfilt
+        )
+
+    def filter(self, filter: filters.Filter, /) -> "Pipeline":
+        """
+        Add a step that applies a filter.
+
+        Parameters
+        ----------
+        filter
+            The filter to apply.
+
+        Returns
+        -------
+        Pipeline
+            A new Pipeline with this additional step.
+
+        See Also
+        --------
+        ktk.filters.Filter
+
+        """
+        check_param("filter", filter, filters.Filter)
+        return self._add_step("filter", filter=filter)
+
+    def resample(
+        self,
+        target: ArrayLike | float,
+        kind: str = "linear",
+        *,
+        extrapolate: bool = False,
+    ) -> "Pipeline":
+        """
+        Add a step that resamples the TimeSeries.
+
+        Parameters
+        ----------
+        target
+            The new sample rate in Hz, or the new time vector, as in
+            ktk.TimeSeries.resample.
+        kind
+            Optional. The interpolation method, as in
+            ktk.TimeSeries.resample. The default is "linear".
+        extrapolate
+            Optional. True to extrapolate data outside of the original time
+            range. The default is False.
+
+        Returns
+        -------
+        Pipeline
+            A new Pipeline with this additional step.
+
+        See Also
+        --------
+        ktk.TimeSeries.resample
+
+        """
+        check_param("kind", kind, str)
+        check_param("extrapolate", extrapolate, bool)
+        if not isinstance(target, (float, int)):
+            target = np.array(target, dtype=float)
+        return self._add_step(
+            "resample", target=target, kind=kind, extrapolate=extrapolate
+        )
+
+    def normalize(
+        self,
+        event_name1: str,
+        event_name2: str,
+        *,
+        n_points: int = 100,
+        span: list[int] | None = None,
+    ) -> "Pipeline":
+        """
+        Add a step that time-normalizes cycles.
+
+        Parameters
+        ----------
+        event_name1
+            The event name that corresponds to the beginning of a cycle.
+        event_name2
+            The event name that corresponds to the end of a cycle.
+        n_points
+            Optional. The number of points of the output TimeSeries. The
+            default is 100.
+        span
+            Optional. The normalization span, as in
+            ktk.cycles.time_normalize.
+
+        Returns
+        -------
+        Pipeline
+            A new Pipeline with this additional step.
+
+        See Also
+        --------
+        ktk.cycles.time_normalize
+
+        """
+        check_param("event_name1", event_name1, str)
+        check_param("event_name2", event_name2, str)
+        check_param("n_points", n_points, int)
+        return self._add_step(
+            "normalize",
+            event_name1=event_name1,
+            event_name2=event_name2,
+            n_points=n_points,
+            span=span,
+        )
+
+    def _plan(self) -> list[tuple[str, list[dict[str, Any]]]]:
+        """
+        Fuse the recorded steps into an execution plan.
+
+        Returns a list of (operation, list of kwargs), where the list of
+        kwargs contains more than one element for fused steps.
+        """
+        plan: list[tuple[str, list[dict[str, Any]]]] = []
+        for operation, kwargs in self._steps:
+            if len(plan) > 0 and plan[-1][0] == operation:
+                last_kwargs = plan[-1][1][-1]
+                if (operation == "fill" and kwargs == last_kwargs) or (
+                    operation == "butter"
+                    and kwargs["filtfilt"] == last_kwargs["filtfilt"]
+                ):
+                    plan[-1][1].append(kwargs)
+                    continue
+            plan.append((operation, [kwargs]))
+        return plan
+
+    def explain(self) -> str:
+        """
+        Describe the execution plan, once compatible steps are fused.
+
+        Returns
+        -------
+        str
+            One numbered line per executed step. Fused steps are joined
+            by a plus sign.
+
+        """
+        lines = []
+        for i_step, (operation, kwargs_list) in enumerate(self._plan()):
+            descriptions = []
+            for kwargs in kwargs_list:
+                arguments = ", ".join(
+                    f"{key}={value!r}"
+                    for key, value in kwargs.items()
+                    if key != "filtfilt"
+                )
+                if operation == "filter":
+                    descriptions.append(arguments.removeprefix("filter="))
+                else:
+                    descriptions.append(f"{operation}({arguments})")
+
+            if operation == "butter":
+                descriptions[-1] += f", filtfilt={kwargs_list[0]['filtfilt']}"
+
+            indent = " " * (len(str(i_step + 1)) + 2)
+            lines.append(
+                f"{i_step + 1}. " + f"\n{indent}+ ".join(descriptions)
+            )
+        return "\n".join(lines)
+
+    def run(self) -> TimeSeries:
+        """
+        Execute the pipeline.
+
+        Returns
+        -------
+        TimeSeries
+            The processed TimeSeries. The input TimeSeries is not modified.
+
+        """
+        ts = self._ts.copy()
+
+        for operation, kwargs_list in self._plan():
+            if operation == "fill":
+                ts.fill_missing_samples(
+                    kwargs_list[0]["max_missing_samples"],
+                    method=kwargs_list[0]["method"],
+                    in_place=True,
+                )
+
+            elif operation == "butter":
+                filters._validate_input(ts)
+                fs = 1 / (ts.time[1] - ts.time[0])
+                sos = np.concatenate(
+                    [
+                        filters._design_butter(
+                            kwargs["order"], kwargs["fc"], kwargs["btype"], fs
+                        )
+                        for kwargs in kwargs_list
+                    ]
+                )
+                filters._sos_filter(ts, sos, kwargs_list[0]["filtfilt"])
+
+            elif operation == "filter":
+                ts = kwargs_list[0]["filter"].apply(ts)
+
+            elif operation == "resample":
+                kwargs = kwargs_list[0]
+                ts.resample(
+                    kwargs["target"],
+                    kwargs["kind"],
+                    extrapolate=kwargs["extrapolate"],
+                    in_place=True,
+                )
+
+            elif operation == "normalize":
+                ts = cycles.time_normalize(ts, **kwargs_list[0])
+
+        return ts
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import doctest
+
+    import kineticstoolkit as ktk  # noqa for doctest
+
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE)
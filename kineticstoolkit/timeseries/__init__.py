@@ -28,8 +28,10 @@ __email__ = "chenier.felix@uqam.ca"
 __license__ = "Apache 2.0"
 
 
+import re
 import warnings
-from ast import literal_eval
+from collections.abc import Iterator
+from copy import copy as shallow_copy
 from copy import deepcopy
 from numbers import Real
 from typing import Any, cast
@@ -45,6 +47,7 @@ from kineticstoolkit.exceptions import (
 )
 from kineticstoolkit.typing_ import ArrayLike, check_param
 
+from .arrow import _from_arrow, _to_arrow
 from .checks import (
     _check_constant_sample_rate,
     _check_increasing_time,
@@ -63,17 +66,31 @@ from .classes import (
     TimeSeriesEventList,
     TimeSeriesInfoDict,
 )
+from .concatenate import _concatenate
 from .deprecated import add_data_info, remove_data_info, sort_events
-from .gui import _plot, _ui_edit_events, _ui_sync
-from .merge import _merge
+from .merge import _merge, _merge_many
 
 # %% Constants
 
 MINIMUM_LENGTH_TO_INTERPOLATE = 3
 
+# DataFrame column names with bracketed indexes, such as "Forces[0]",
+# "Forces[:,0]" or "Frames[:, 0, 1]".
+_COLUMN_NAME_PATTERN = re.compile(r"^([^\[]+)\[(?:\s*:\s*,)?([\d\s,]+)\]$")
+
 # %% Helper functions
 
 
+def _get_nan_mask(values: np.ndarray) -> np.ndarray:
+    """Return which samples contain at least one nan, without copying."""
+    if values.dtype.kind not in "fcO":
+        # No nan is possible for these types
+        return np.zeros(values.shape[0], dtype=bool)
+    if values.ndim == 1:
+        return np.isnan(values)
+    return np.isnan(values.reshape((values.shape[0], -1))).any(axis=1)
+
+
 def _resample_create_new_time(
     original: ArrayLike, target: ArrayLike | float
 ) -> np.ndarray:
@@ -100,6 +117,53 @@ def _resample_create_new_time(
     return new_time
 
 
+def _get_column_names(key: str, shape: tuple[int, ...]) -> list[str]:
+    """
+    Get the DataFrame column names of a data key, in C order.
+
+    For instance, a key "Forces" of shape (2, 2) gives "Forces[:,0,0]",
+    "Forces[:,0,1]", "Forces[:,1,0]" and "Forces[:,1,1]".
+    """
+    if len(shape) == 0:
+        return [key]
+
+    names = np.array([f"{key}[:,"])
+    for i_dim, dim in enumerate(shape):
+        suffix = "]" if i_dim == len(shape) - 1 else ","
+        indexes = np.char.add(np.arange(dim).astype(str), suffix)
+        names = np.char.add(names[:, np.newaxis], indexes).ravel()
+    return names.tolist()
+
+
+def _group_dataframe_columns(
+    columns: pd.Index,
+) -> tuple[dict[str, list[int]], dict[str, list[tuple[int, ...]]]]:
+    """
+    Group DataFrame columns by data key.
+
+    Returns the positions of the columns of each key, and the indexes of
+    each column for keys with bracketed column names. For instance,
+    columns "Data1", "Data2[0]", "Data2[1]" give::
+
+        ({"Data1": [0], "Data2": [1, 2]}, {"Data2": [(0,), (1,)]})
+
+    """
+    positions = {}  # type: dict[str, list[int]]
+    indexes = {}  # type: dict[str, list[tuple[int, ...]]]
+    for i_column, column in enumerate(columns):
+        match = _COLUMN_NAME_PATTERN.match(column)
+        if match is None:  # No brackets
+            positions[column] = [i_column]
+        else:  # With brackets
+            key = match.group(1)
+            index = tuple(
+                int(_) for _ in match.group(2).replace(" ", "").split(",")
+            )
+            positions.setdefault(key, []).append(i_column)
+            indexes.setdefault(key, []).append(index)
+    return positions, indexes
+
+
 class TimeSeries:
     """
     A class that holds time, data series, events and metadata.
@@ -446,6 +510,8 @@ class TimeSeries:
             # Data management
             "get_subset",
             "merge",
+            "merge_many",
+            "concatenate",
             "add_data",
             "rename_data",
             "remove_data",
@@ -455,6 +521,7 @@ class TimeSeries:
             "resample",
             # Event management
             "add_event",
+            "add_events",
             "rename_event",
             "remove_event",
             "count_events",
@@ -480,8 +547,12 @@ class TimeSeries:
             "get_ts_before_event",
             "get_ts_after_event",
             "get_ts_between_events",
+            # Windows
+            "iter_windows",
+            "get_sliding_windows",
             # Missing data
             "isnan",
+            "nan_mask",
             "fill_missing_samples",
             # Interactive and plotting
             "ui_edit_events",
@@ -491,6 +562,8 @@ class TimeSeries:
             "to_dataframe",
             "from_dataframe",
             "from_array",
+            "to_arrow",
+            "from_arrow",
         ]
 
     def __str__(self):
@@ -1476,19 +1549,7 @@ class TimeSeries:
 
         """
         self._check_valid_time()
-
-        # list all events with correct name
-        event_times = []
-        event_indexes = []
-        for i_event, event in enumerate(self.events):
-            if event.name == name:
-                event_times.append(event.time)
-                event_indexes.append(i_event)
-
-        # Sort the indexes by time
-        sorted_indexes = np.argsort(event_times)
-        event_indexes = [event_indexes[i] for i in sorted_indexes]
-        return event_indexes
+        return self.events._get_indexes(name).tolist()
 
     def _get_event_index(self, name: str, occurrence: int = 0) -> int:
         """
@@ -1564,32 +1625,7 @@ class TimeSeries:
 
         """
         self._check_valid_time()
-
-        # Sort all events in a dict with key being tuple(time, name)
-        # and the value being the list of indexes in which this event appears.
-        sorted_events = {}  # type: dict[tuple[float, str], list[int]]
-        for i_event, event in enumerate(self.events):
-            tup_event = event._to_tuple()
-
-            # Check if this event already exist in the list.
-            # If it does, add it to the list.
-            found = False
-            for key, occurrence_list in sorted_events.items():
-                if np.isclose(key[0], event.time) and (key[1] == event.name):
-                    occurrence_list.append(i_event)
-                    found = True
-                    break
-            if not found:
-                # Otherwise, create it in the list
-                sorted_events[tup_event] = [i_event]
-
-        # Convert this dict to the desired list of lists
-        out = []
-        for _key, occurrence_list in sorted_events.items():
-            if len(occurrence_list) > 1:
-                out.extend(occurrence_list[1:])
-
-        return sorted(out)
+        return self.events._get_duplicate_indexes().tolist()
 
     def add_event(
         self,
@@ -1624,6 +1660,7 @@ class TimeSeries:
 
         See Also
         --------
+        ktk.TimeSeries.add_events
         ktk.TimeSeries.rename_event
         ktk.TimeSeries.remove_event
         ktk.TimeSeries.trim_events
@@ -1652,13 +1689,108 @@ class TimeSeries:
 
         if unique:
             # Ensure that no event of that name and time already exists
-            for event in ts.events:
-                if np.isclose(time, event.time) and (name == event.name):
-                    return ts
+            event_times = ts.events._get_index().times
+            if np.any(
+                np.isclose(time, event_times[ts.events._get_indexes(name)])
+            ):
+                return ts
 
         ts.events.append(TimeSeriesEvent(time, name))
         return ts
 
+    def add_events(
+        self,
+        times: ArrayLike,
+        names: str | list[str] = "event",
+        *,
+        in_place: bool = False,
+        unique: bool = False,
+    ) -> "TimeSeries":
+        """
+        Add several events to the TimeSeries at once.
+
+        Parameters
+        ----------
+        times
+            The times of the events, in the same unit as
+            `info["Time"]["Unit"]`.
+        names
+            Optional. The names of the events, as a list of the same length
+            as `times`, or as a single name for every event. Default is
+            "event".
+        in_place
+            Optional. True to modify and return the original TimeSeries. False
+            to return a modified copy of the TimeSeries while leaving the
+            original TimeSeries intact. Default is False.
+        unique
+            Optional. True to prevent duplicating an already existing event. In
+            this case, the events that have the same time and name as an
+            existing event or as another added event are not added. Default is
+            False.
+
+        Returns
+        -------
+        TimeSeries
+            The TimeSeries with the added events.
+
+        Raises
+        ------
+        ValueError
+            If `times` is not unidimensional, or if `names` is a list that
+            does not have the same length as `times`.
+
+        See Also
+        --------
+        ktk.TimeSeries.add_event
+        ktk.TimeSeries.remove_duplicate_events
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries()
+        >>> ts = ts.add_events(
+        ...     [5.5, 20.3, 10.8], ["event1", "event2", "event2"]
+        ... )
+
+        >>> ts.events
+        [TimeSeriesEvent(time=5.5, name='event1'),
+         TimeSeriesEvent(time=10.8, name='event2'),
+         TimeSeriesEvent(time=20.3, name='event2')]
+
+        >>> ts = ts.add_events([10.8, 30.0, 30.0], "event2", unique=True)
+        >>> ts.events
+        [TimeSeriesEvent(time=5.5, name='event1'),
+         TimeSeriesEvent(time=10.8, name='event2'),
+         TimeSeriesEvent(time=20.3, name='event2'),
+         TimeSeriesEvent(time=30.0, name='event2')]
+
+        """
+        times = np.array(times, dtype=float)
+        if times.ndim == 0:
+            times = times[np.newaxis]
+        if times.ndim != 1:
+            raise ValueError(
+                "times must be unidimensional. However, an array of shape "
+                f"{times.shape} was provided."
+            )
+        if isinstance(names, str):
+            names = [names] * times.shape[0]
+        else:
+            names = list(names)
+            check_param("names", names, list, contents_type=str)
+            if len(names) != times.shape[0]:
+                raise ValueError(
+                    "names must have the same length as times. However, "
+                    f"{len(names)} names were provided for "
+                    f"{times.shape[0]} times."
+                )
+        check_param("in_place", in_place, bool)
+        check_param("unique", unique, bool)
+        self._check_valid_time()
+
+        ts = self if in_place else self.copy()
+        ts.events._add_events(times, names, unique)
+        return ts
+
     def rename_event(
         self,
         old_name: str,
@@ -1808,19 +1940,12 @@ class TimeSeries:
         ts = self if in_place else self.copy()
 
         if occurrence is None:  # Remove all occurrences
-            event_index = ts._get_event_index(name, 0)
-            try:
-                # Continually remove the first event of this name, until
-                # there are no more.
-                count = 0
-                while True:
-                    ts.remove_event(name, occurrence=0, in_place=True)
-                    count += 1
-            except TimeSeriesEventNotFoundError:
-                if count == 0:  # No event of that name was even found.
-                    raise TimeSeriesEventNotFoundError(
-                        f"No event named {name} could be found."
-                    )
+            event_indexes = ts._get_event_indexes(name)
+            if len(event_indexes) == 0:
+                raise TimeSeriesEventNotFoundError(
+                    f"No event named {name} could be found."
+                )
+            ts.events._remove_indexes(event_indexes)
 
         else:  # Remove only the specified occurrence
             event_index = ts._get_event_index(name, occurrence)
@@ -1915,9 +2040,7 @@ class TimeSeries:
         self._check_valid_time()
 
         ts = self if in_place else self.copy()
-        duplicates = ts._get_duplicate_event_indexes()
-        for event_index in duplicates[-1::-1]:
-            ts.events.pop(event_index)
+        ts.events._remove_indexes(ts._get_duplicate_event_indexes())
         return ts
 
     def trim_events(self, *, in_place: bool = False) -> "TimeSeries":
@@ -1973,11 +2096,10 @@ class TimeSeries:
 
         ts = self if in_place else self.copy()
 
-        events = deepcopy(ts.events)
-        ts.events = []
-        for event in events:
-            if event.time <= np.max(ts.time) and event.time >= np.min(ts.time):
-                ts.add_event(event.time, event.name, in_place=True)
+        event_times = ts.events._get_index().times
+        ts.events._remove_indexes(
+            (event_times > np.max(ts.time)) | (event_times < np.min(ts.time))
+        )
         return ts
 
     # %% Get index methods
@@ -2358,7 +2480,11 @@ class TimeSeries:
     # %% Get ts methods
 
     def get_ts_before_index(
-        self, index: int, *, inclusive: bool = False
+        self,
+        index: int,
+        *,
+        inclusive: bool = False,
+        copy: bool = True,
     ) -> "TimeSeries":
         """
         Get a TimeSeries before the specified time index.
@@ -2370,6 +2496,14 @@ class TimeSeries:
         inclusive
             Optional. True to include the given time index.
 
+        copy
+            Optional. True to copy the time and data of the new TimeSeries.
+            False to return views on the time and data of this TimeSeries
+            instead, which is much faster on long TimeSeries; in this case,
+            the events are also shared, and modifying the new TimeSeries'
+            time, data or events also modifies this TimeSeries. The default
+            is True.
+
         Returns
         -------
         TimeSeries
@@ -2402,6 +2536,7 @@ class TimeSeries:
         """
         check_param("index", index, int)
         check_param("inclusive", inclusive, bool)
+        check_param("copy", copy, bool)
         self._check_well_shaped()
         self._check_increasing_time()
 
@@ -2411,11 +2546,15 @@ class TimeSeries:
             )
 
         return self.get_ts_between_indexes(
-            0, index, inclusive=(True, inclusive)
+            0, index, inclusive=(True, inclusive), copy=copy
         )
 
     def get_ts_after_index(
-        self, index: int, *, inclusive: bool = False
+        self,
+        index: int,
+        *,
+        inclusive: bool = False,
+        copy: bool = True,
     ) -> "TimeSeries":
         """
         Get a TimeSeries after the specified time index.
@@ -2427,6 +2566,14 @@ class TimeSeries:
         inclusive
             Optional. True to include the given time index.
 
+        copy
+            Optional. True to copy the time and data of the new TimeSeries.
+            False to return views on the time and data of this TimeSeries
+            instead, which is much faster on long TimeSeries; in this case,
+            the events are also shared, and modifying the new TimeSeries'
+            time, data or events also modifies this TimeSeries. The default
+            is True.
+
         Returns
         -------
         TimeSeries
@@ -2459,6 +2606,7 @@ class TimeSeries:
         """
         check_param("index", index, int)
         check_param("inclusive", inclusive, bool)
+        check_param("copy", copy, bool)
         self._check_well_shaped()
         self._check_increasing_time()
 
@@ -2472,7 +2620,10 @@ class TimeSeries:
             )
 
         return self.get_ts_between_indexes(
-            index, self.time.shape[0] - 1, inclusive=(inclusive, True)
+            index,
+            self.time.shape[0] - 1,
+            inclusive=(inclusive, True),
+            copy=copy,
         )
 
     def get_ts_between_indexes(
@@ -2481,6 +2632,7 @@ class TimeSeries:
         index2: int,
         *,
         inclusive: bool | tuple[bool, bool] = False,
+        copy: bool = True,
     ) -> "TimeSeries":
         """
         Get a TimeSeries between two specified time indexes.
@@ -2498,6 +2650,14 @@ class TimeSeries:
             - (True, False): index1 <= index < index2
             - (False, True): index1 < index <= index2
 
+        copy
+            Optional. True to copy the time and data of the new TimeSeries.
+            False to return views on the time and data of this TimeSeries
+            instead, which is much faster on long TimeSeries; in this case,
+            the events are also shared, and modifying the new TimeSeries'
+            time, data or events also modifies this TimeSeries. The default
+            is True.
+
         Returns
         -------
         TimeSeries
@@ -2549,6 +2709,7 @@ class TimeSeries:
             raise TypeError(
                 "inclusive must be either a bool or a tuple of two bools."
             )
+        check_param("copy", copy, bool)
 
         self._check_well_shaped()
         self._check_increasing_time()
@@ -2573,16 +2734,39 @@ class TimeSeries:
             )
         index2 += int(inclusive[1])
 
-        index_range = range(index1 + 1, index2)
+        return self._get_ts_between_slice(index1 + 1, index2, copy)
+
+    def _get_ts_between_slice(
+        self, start: int, stop: int, copy: bool
+    ) -> "TimeSeries":
+        """
+        Get a TimeSeries with samples start <= index < stop.
 
-        out_ts = self.copy(copy_data=False, copy_time=False)
-        out_ts.time = self.time[index_range]
-        for the_data in self.data.keys():
-            out_ts.data[the_data] = self.data[the_data][index_range]
+        This is the unchecked backend of the get_ts_* methods. With
+        copy=False, the time and data of the output TimeSeries are views on
+        the original arrays, and its events are the original events.
+        """
+        index_slice = slice(start, stop)
+        out_ts = TimeSeries()
+        if copy:
+            out_ts.time = self.time[index_slice]
+            for key, value in self.data.items():
+                out_ts.data[key] = value[index_slice]
+            out_ts._events = deepcopy(self.events)
+        else:
+            out_ts._time = self.time[index_slice]
+            for key, value in self.data.items():
+                out_ts.data._set_view(key, value[index_slice])
+            out_ts._events = shallow_copy(self.events)
+        out_ts._info = deepcopy(self.info)
         return out_ts
 
     def get_ts_before_time(
-        self, time: float, *, inclusive: bool = False
+        self,
+        time: float,
+        *,
+        inclusive: bool = False,
+        copy: bool = True,
     ) -> "TimeSeries":
         """
         Get a TimeSeries before the specified time.
@@ -2594,6 +2778,14 @@ class TimeSeries:
         inclusive
             Optional. True to include the given time in the comparison.
 
+        copy
+            Optional. True to copy the time and data of the new TimeSeries.
+            False to return views on the time and data of this TimeSeries
+            instead, which is much faster on long TimeSeries; in this case,
+            the events are also shared, and modifying the new TimeSeries'
+            time, data or events also modifies this TimeSeries. The default
+            is True.
+
         Returns
         -------
         TimeSeries
@@ -2626,6 +2818,7 @@ class TimeSeries:
         """
         check_param("time", time, float)
         check_param("inclusive", inclusive, bool)
+        check_param("copy", copy, bool)
         self._check_well_shaped()
         self._check_increasing_time()
 
@@ -2639,11 +2832,15 @@ class TimeSeries:
             )
 
         return self.get_ts_between_times(
-            self.time[0], time, inclusive=(True, inclusive)
+            self.time[0], time, inclusive=(True, inclusive), copy=copy
         )
 
     def get_ts_after_time(
-        self, time: float, *, inclusive: bool = False
+        self,
+        time: float,
+        *,
+        inclusive: bool = False,
+        copy: bool = True,
     ) -> "TimeSeries":
         """
         Get a TimeSeries after the specified time.
@@ -2655,6 +2852,14 @@ class TimeSeries:
         inclusive
             Optional. True to include the given time in the comparison.
 
+        copy
+            Optional. True to copy the time and data of the new TimeSeries.
+            False to return views on the time and data of this TimeSeries
+            instead, which is much faster on long TimeSeries; in this case,
+            the events are also shared, and modifying the new TimeSeries'
+            time, data or events also modifies this TimeSeries. The default
+            is True.
+
         Returns
         -------
         TimeSeries
@@ -2687,6 +2892,7 @@ class TimeSeries:
         """
         check_param("time", time, float)
         check_param("inclusive", inclusive, bool)
+        check_param("copy", copy, bool)
         self._check_well_shaped()
         self._check_increasing_time()
 
@@ -2700,7 +2906,7 @@ class TimeSeries:
             )
 
         return self.get_ts_between_times(
-            time, self.time[-1], inclusive=(inclusive, True)
+            time, self.time[-1], inclusive=(inclusive, True), copy=copy
         )
 
     def get_ts_between_times(
@@ -2709,6 +2915,7 @@ class TimeSeries:
         time2: float,
         *,
         inclusive: bool | tuple[bool, bool] = False,
+        copy: bool = True,
     ) -> "TimeSeries":
         """
         Get a TimeSeries between two specified times.
@@ -2726,6 +2933,14 @@ class TimeSeries:
             - (True, False): time1 <= time < time2
             - (False, True): time1 < time <= time2
 
+        copy
+            Optional. True to copy the time and data of the new TimeSeries.
+            False to return views on the time and data of this TimeSeries
+            instead, which is much faster on long TimeSeries; in this case,
+            the events are also shared, and modifying the new TimeSeries'
+            time, data or events also modifies this TimeSeries. The default
+            is True.
+
         Returns
         -------
         TimeSeries
@@ -2776,6 +2991,7 @@ class TimeSeries:
             raise TypeError(
                 "inclusive must be either a bool or a tuple of two bools."
             )
+        check_param("copy", copy, bool)
 
         if time2 < time1:
             raise ValueError(
@@ -2785,10 +3001,17 @@ class TimeSeries:
 
         index1 = self.get_index_after_time(time1, inclusive=inclusive[0])
         index2 = self.get_index_before_time(time2, inclusive=inclusive[1])
-        return self.get_ts_between_indexes(index1, index2, inclusive=True)
+        return self.get_ts_between_indexes(
+            index1, index2, inclusive=True, copy=copy
+        )
 
     def get_ts_before_event(
-        self, name: str, occurrence: int = 0, *, inclusive: bool = False
+        self,
+        name: str,
+        occurrence: int = 0,
+        *,
+        inclusive: bool = False,
+        copy: bool = True,
     ) -> "TimeSeries":
         """
         Get a TimeSeries before the specified event.
@@ -2803,6 +3026,14 @@ class TimeSeries:
         inclusive
             Optional. True to include the given time in the comparison.
 
+        copy
+            Optional. True to copy the time and data of the new TimeSeries.
+            False to return views on the time and data of this TimeSeries
+            instead, which is much faster on long TimeSeries; in this case,
+            the events are also shared, and modifying the new TimeSeries'
+            time, data or events also modifies this TimeSeries. The default
+            is True.
+
         Returns
         -------
         TimeSeries
@@ -2844,6 +3075,7 @@ class TimeSeries:
         check_param("name", name, str)
         check_param("occurrence", occurrence, int)
         check_param("inclusive", inclusive, bool)
+        check_param("copy", copy, bool)
         self._check_well_shaped()
 
         try:
@@ -2852,6 +3084,7 @@ class TimeSeries:
                     name, occurrence, inclusive=inclusive
                 ),
                 inclusive=True,
+                copy=copy,
             )
         except TimeSeriesRangeError:
             time = self.events[self._get_event_index(name, occurrence)].time
@@ -2864,7 +3097,12 @@ class TimeSeries:
             return retval
 
     def get_ts_after_event(
-        self, name: str, occurrence: int = 0, *, inclusive: bool = False
+        self,
+        name: str,
+        occurrence: int = 0,
+        *,
+        inclusive: bool = False,
+        copy: bool = True,
     ) -> "TimeSeries":
         """
         Get a TimeSeries after the specified event.
@@ -2879,6 +3117,14 @@ class TimeSeries:
         inclusive
             Optional. True to include the given event in the comparison.
 
+        copy
+            Optional. True to copy the time and data of the new TimeSeries.
+            False to return views on the time and data of this TimeSeries
+            instead, which is much faster on long TimeSeries; in this case,
+            the events are also shared, and modifying the new TimeSeries'
+            time, data or events also modifies this TimeSeries. The default
+            is True.
+
         Returns
         -------
         TimeSeries
@@ -2920,6 +3166,7 @@ class TimeSeries:
         check_param("name", name, str)
         check_param("occurrence", occurrence, int)
         check_param("inclusive", inclusive, bool)
+        check_param("copy", copy, bool)
         self._check_well_shaped()
 
         try:
@@ -2928,6 +3175,7 @@ class TimeSeries:
                     name, occurrence, inclusive=inclusive
                 ),
                 inclusive=True,
+                copy=copy,
             )
         except TimeSeriesRangeError:
             time = self.events[self._get_event_index(name, occurrence)].time
@@ -2947,6 +3195,7 @@ class TimeSeries:
         occurrence2: int = 0,
         *,
         inclusive: bool | tuple[bool, bool] = False,
+        copy: bool = True,
     ) -> "TimeSeries":
         """
         Get a TimeSeries between two specified events.
@@ -2967,6 +3216,14 @@ class TimeSeries:
             - (True, False): event1.time <= time < event2.time
             - (False, True): event1.time < time <= event2.time
 
+        copy
+            Optional. True to copy the time and data of the new TimeSeries.
+            False to return views on the time and data of this TimeSeries
+            instead, which is much faster on long TimeSeries; in this case,
+            the events are also shared, and modifying the new TimeSeries'
+            time, data or events also modifies this TimeSeries. The default
+            is True.
+
         Returns
         -------
         TimeSeries
@@ -3019,6 +3276,7 @@ class TimeSeries:
             raise TypeError(
                 "inclusive must be either a bool or a tuple of two bools."
             )
+        check_param("copy", copy, bool)
 
         self._check_well_shaped()
 
@@ -3040,7 +3298,214 @@ class TimeSeries:
         index2 = self.get_index_before_event(
             name2, occurrence2, inclusive=inclusive[1]
         )
-        return self.get_ts_between_indexes(index1, index2, inclusive=True)
+        return self.get_ts_between_indexes(
+            index1, index2, inclusive=True, copy=copy
+        )
+
+    # %% Windows
+
+    def iter_windows(
+        self,
+        length: float | None = None,
+        step: float | None = None,
+        *,
+        by: str = "time",
+        event_name: str | None = None,
+        copy: bool = False,
+    ) -> Iterator["TimeSeries"]:
+        """
+        Iterate over successive windows of the TimeSeries.
+
+        Parameters
+        ----------
+        length
+            Length of each window, in time units if `by` is "time", or in
+            samples if `by` is "index". Not used if `by` is "event".
+        step
+            Optional. Time (or number of samples) between the beginning of
+            two successive windows. The default is `length`, which yields
+            non-overlapping windows.
+        by
+            Optional. Either "time", "index" or "event":
+
+            - "time": each window contains the samples where
+              begin <= time < begin + length.
+            - "index": each window contains `length` samples.
+            - "event": each window contains the samples between two
+              successive occurrences of event `event_name`, where
+              event1.time <= time < event2.time.
+
+            The default is "time".
+        event_name
+            Name of the event that delimitates the windows when `by` is
+            "event".
+        copy
+            Optional. True to copy the time and data of each window. False
+            to use views on the time and data of this TimeSeries instead,
+            as with `copy=False` in ktk.TimeSeries.get_ts_between_indexes.
+            The default is False.
+
+        Yields
+        ------
+        TimeSeries
+            One TimeSeries per window. When `by` is "time" or "index", only
+            the windows that end before the last sample of the TimeSeries
+            are yielded.
+
+        Raises
+        ------
+        ValueError
+            If `length`, `step` or `event_name` are not consistent with `by`.
+
+        See Also
+        --------
+        ktk.TimeSeries.get_ts_between_indexes
+        ktk.TimeSeries.get_ts_between_times
+        ktk.TimeSeries.get_ts_between_events
+        ktk.TimeSeries.get_sliding_windows
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.arange(10.0))
+
+        >>> for window in ts.iter_windows(4.0, 2.0):
+        ...     print(window.time)
+        [0. 1. 2. 3.]
+        [2. 3. 4. 5.]
+        [4. 5. 6. 7.]
+
+        >>> for window in ts.iter_windows(3, by="index"):
+        ...     print(window.time)
+        [0. 1. 2.]
+        [3. 4. 5.]
+        [6. 7. 8.]
+
+        >>> ts = ts.add_events([1.0, 4.5, 8.0], "cycle")
+        >>> for window in ts.iter_windows(by="event", event_name="cycle"):
+        ...     print(window.time)
+        [1. 2. 3. 4.]
+        [5. 6. 7.]
+
+        """
+        check_param("by", by, str, expected_values=["time", "index", "event"])
+        check_param("copy", copy, bool)
+        self._check_well_shaped()
+        self._check_increasing_time()
+
+        if by == "event":
+            check_param("event_name", event_name, str)
+            if length is not None or step is not None:
+                raise ValueError(
+                    "length and step must not be specified when by is 'event'."
+                )
+            event_times = np.array(
+                [
+                    self.events[i_event].time
+                    for i_event in self._get_event_indexes(
+                        cast(str, event_name)
+                    )
+                ]
+            )
+            begins = np.searchsorted(self.time, event_times[:-1], "left")
+            ends = np.searchsorted(self.time, event_times[1:], "left")
+
+        else:
+            if length is None:
+                raise ValueError(
+                    "length must be specified when by is 'time' or 'index'."
+                )
+            if step is None:
+                step = length
+
+            if by == "time":
+                check_param("length", length, float)
+                check_param("step", step, float)
+                if length <= 0 or step <= 0:
+                    raise ValueError("length and step must be positive.")
+                if len(self.time) == 0:
+                    return iter([])
+                begin_times = self.time[0] + step * np.arange(
+                    int((self.time[-1] - self.time[0] - length) // step) + 1
+                )
+                begins = np.searchsorted(self.time, begin_times, "left")
+                ends = np.searchsorted(self.time, begin_times + length, "left")
+            else:
+                check_param("length", length, int)
+                check_param("step", step, int)
+                if length <= 0 or step <= 0:
+                    raise ValueError("length and step must be positive.")
+                begins = np.arange(0, len(self.time) - length + 1, step)
+                ends = begins + length
+
+        return (
+            self._get_ts_between_slice(int(begin), int(end), copy)
+            for begin, end in zip(begins, ends, strict=True)
+        )
+
+    def get_sliding_windows(
+        self, data_key: str, length: int, *, step: int = 1
+    ) -> np.ndarray:
+        """
+        Get a read-only array of sliding windows on a data key.
+
+        The returned array is a view on the TimeSeries data: no data is
+        copied, regardless of the number of windows.
+
+        Parameters
+        ----------
+        data_key
+            Name of the data key.
+        length
+            Number of samples in each window.
+        step
+            Optional. Number of samples between the beginning of two
+            successive windows. The default is 1.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape (n_windows, length, ...), where ... is the
+            shape of one sample of the data.
+
+        See Also
+        --------
+        ktk.TimeSeries.iter_windows
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.arange(6.0))
+        >>> ts = ts.add_data("data", np.arange(6.0))
+        >>> ts.get_sliding_windows("data", 3, step=2)
+        array([[0., 1., 2.],
+               [2., 3., 4.]])
+
+        Compute a sliding RMS value:
+
+        >>> windows = ts.get_sliding_windows("data", 3)
+        >>> np.sqrt(np.mean(windows**2, axis=1))
+        array([1.29099445, 2.1602469 , 3.10912635, 4.0824829 ])
+
+        """
+        check_param("data_key", data_key, str)
+        check_param("length", length, int)
+        check_param("step", step, int)
+        self._check_well_shaped()
+        if data_key not in self.data:
+            self._raise_data_key_error(data_key)
+        if length <= 0 or step <= 0:
+            raise ValueError("length and step must be positive.")
+
+        data = self.data[data_key]
+        if length > data.shape[0]:
+            raise ValueError(
+                f"The window length of {length} is longer than the "
+                f"{data.shape[0]} samples of the TimeSeries."
+            )
+
+        windows = np.lib.stride_tricks.sliding_window_view(
+            data, length, axis=0
+        )[::step]
+        return np.moveaxis(windows, -1, 1)
 
     # %% Subsetting and merging
 
@@ -3197,6 +3662,176 @@ class TimeSeries:
             in_place=in_place,
         )
 
+    @staticmethod
+    def merge_many(
+        ts_list: list["TimeSeries"],
+        /,
+        *,
+        resample: bool = False,
+        merge_events: bool = True,
+        merge_info: bool = True,
+        overwrite: bool = False,
+        on_conflict: str = "warning",
+    ) -> "TimeSeries":
+        """
+        Merge many TimeSeries at once.
+
+        This is equivalent to merging every TimeSeries of the list, in order,
+        into the first one, but faster: the accumulated result is never
+        copied, and the events are merged in a single operation.
+
+        Parameters
+        ----------
+        ts_list
+            The TimeSeries to merge. The time of the first TimeSeries is the
+            time of the merged TimeSeries.
+        resample
+            Optional. Set to True to resample every TimeSeries to the time of
+            the first one using a linear interpolation. If the time
+            attributes are not equivalent and resample is False, an exception
+            is raised. Default is False.
+        merge_events
+            Optional. Set to True to also merge events. Default is True.
+        merge_info
+            Optional. Set to True to also merge info. Default is True.
+        overwrite
+            Optional. Select what to do if a data or info key already exists
+            in a preceding TimeSeries of the list. True to overwrite the
+            already existing value, False to ignore the new value. Default is
+            False.
+        on_conflict
+            Optional. Select the warning level when a data or info key
+            already exists in a preceding TimeSeries of the list. May take the
+            following values:
+            "mute": No warning;
+            "warning": Warns that duplicate keys were found and how the
+            conflict has been resolved following the `overwrite` parameter.
+            "error": Raises a TimeSeriesMergeConflictError.
+            Default is "warning".
+
+        Returns
+        -------
+        TimeSeries
+            The merged TimeSeries. The TimeSeries of ts_list are not modified.
+
+        Raises
+        ------
+        TimeSeriesMergeConflictError
+            If a data or info key already exists in a preceding TimeSeries of
+            the list and on_conflict is set to "error".
+
+        See Also
+        --------
+        ktk.TimeSeries.merge
+
+        Example
+        -------
+        >>> markers = ktk.TimeSeries(time=np.arange(0.0, 1.0, 0.01))
+        >>> markers = markers.add_data("Marker", np.zeros((100, 4)))
+        >>> forces = ktk.TimeSeries(time=np.arange(0.0, 1.0, 0.001))
+        >>> forces = forces.add_data("Force", np.ones((1000, 4)))
+        >>> emg = ktk.TimeSeries(time=np.arange(0.0, 1.0, 0.0005))
+        >>> emg = emg.add_data("EMG", np.ones(2000))
+
+        >>> ts = ktk.TimeSeries.merge_many(
+        ...     [markers, forces, emg], resample=True
+        ... )
+        >>> ts.time.shape
+        (100,)
+
+        >>> {key: ts.data[key].shape for key in ts.data}
+        {'Marker': (100, 4), 'Force': (100, 4), 'EMG': (100,)}
+
+        """
+        # Call the method implementation (too large/complex to be included
+        # directly in the class definition)
+        return _merge_many(
+            ts_list,
+            resample=resample,
+            merge_events=merge_events,
+            merge_info=merge_info,
+            overwrite=overwrite,
+            on_conflict=on_conflict,
+        )
+
+    @staticmethod
+    def concatenate(
+        ts_list: list["TimeSeries"],
+        /,
+        *,
+        shift: bool = False,
+        fill_gaps: bool = False,
+    ) -> "TimeSeries":
+        """
+        Concatenate many TimeSeries along time.
+
+        Every TimeSeries must have the same data keys, with the same shapes
+        except for the first dimension. The output is allocated once, and the
+        events of every TimeSeries are kept.
+
+        Parameters
+        ----------
+        ts_list
+            The TimeSeries to concatenate, in order. Unless `shift` is True,
+            each TimeSeries must begin after the end of the preceding one.
+        shift
+            Optional. True to shift the time and events of each TimeSeries so
+            that it begins one sample after the end of the preceding one, for
+            instance to stitch consecutive recordings that all begin at 0.
+            Requires every TimeSeries to have the same constant sample rate.
+            Default is False.
+        fill_gaps
+            Optional. True to fill the time gaps between non-contiguous
+            TimeSeries with missing samples (nan). Requires every TimeSeries to
+            have the same constant sample rate. Default is False.
+
+        Returns
+        -------
+        TimeSeries
+            The concatenated TimeSeries. Its info is a copy of the info of the
+            first TimeSeries.
+
+        Raises
+        ------
+        ValueError
+            If the TimeSeries do not have the same data keys or compatible
+            shapes, if a TimeSeries does not begin after the end of the
+            preceding one, or if `shift` or `fill_gaps` is True and the
+            TimeSeries do not share a constant sample rate.
+
+        See Also
+        --------
+        ktk.TimeSeries.merge_many
+        ktk.TimeSeries.shift
+
+        Example
+        -------
+        >>> ts1 = ktk.TimeSeries(time=[0.0, 0.1, 0.2])
+        >>> ts1 = ts1.add_data("data", [1.0, 2.0, 3.0])
+        >>> ts1 = ts1.add_event(0.1, "event")
+        >>> ts2 = ktk.TimeSeries(time=[0.5, 0.6])
+        >>> ts2 = ts2.add_data("data", [4.0, 5.0])
+        >>> ts2 = ts2.add_event(0.6, "event")
+
+        >>> ts = ktk.TimeSeries.concatenate([ts1, ts2], fill_gaps=True)
+        >>> ts.time
+        array([0. , 0.1, 0.2, 0.3, 0.4, 0.5, 0.6])
+        >>> ts.data["data"]
+        array([ 1.,  2.,  3., nan, nan,  4.,  5.])
+        >>> [(event.time, event.name) for event in ts.events]
+        [(0.1, 'event'), (0.6, 'event')]
+
+        >>> ts = ktk.TimeSeries.concatenate([ts1, ts2], shift=True)
+        >>> ts.time
+        array([0. , 0.1, 0.2, 0.3, 0.4])
+        >>> [(event.time, event.name) for event in ts.events]
+        [(0.1, 'event'), (0.4, 'event')]
+
+        """
+        # Call the method implementation (too large/complex to be included
+        # directly in the class definition)
+        return _concatenate(ts_list, shift=shift, fill_gaps=fill_gaps)
+
     # %% Missing sample management
 
     def isnan(self, data_key: str) -> np.ndarray:
@@ -3233,12 +3868,62 @@ class TimeSeries:
         """
         check_param("data_key", data_key, str)
         self._check_well_shaped()
+        return _get_nan_mask(self.data[data_key])
 
-        values = self.data[data_key].copy()
-        # Reduce the dimension of values while keeping the time dimension.
-        while len(values.shape) > 1:
-            values = np.sum(values, 1)  # type: ignore
-        return np.isnan(values)
+    def nan_mask(self, data_keys: str | list[str] | None = None) -> np.ndarray:
+        """
+        Return a boolean matrix of missing samples for many data keys.
+
+        This is equivalent to stacking the results of TimeSeries.isnan for
+        every data key, but validates the TimeSeries only once.
+
+        Parameters
+        ----------
+        data_keys
+            Optional. The data keys to analyze. The default is every data
+            key, in the order of the data attribute.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array of shape (n_samples, n_keys), where column i is
+            True for the samples of data key i that contain at least one nan
+            value.
+
+        See Also
+        --------
+        ktk.TimeSeries.isnan
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.arange(4))
+        >>> ts = ts.add_data("data1", np.zeros((4, 2)))
+        >>> ts = ts.add_data("data2", np.zeros(4))
+        >>> ts.data["data1"][2, 0] = np.nan
+        >>> ts.data["data2"][3] = np.nan
+
+        >>> ts.nan_mask()
+        array([[False, False],
+               [False, False],
+               [ True, False],
+               [False,  True]])
+
+        """
+        if data_keys is None:
+            data_keys = list(self.data.keys())
+        elif isinstance(data_keys, str):
+            data_keys = [data_keys]
+        check_param("data_keys", data_keys, list, contents_type=str)
+        self._check_well_shaped()
+
+        n_samples = self.time.shape[0]
+        if n_samples == 0 and len(self.data) > 0:
+            n_samples = next(iter(self.data.values())).shape[0]
+
+        mask = np.empty((n_samples, len(data_keys)), dtype=bool)
+        for i_key, key in enumerate(data_keys):
+            mask[:, i_key] = _get_nan_mask(self.data[key])
+        return mask
 
     def fill_missing_samples(
         self,
@@ -3371,7 +4056,10 @@ class TimeSeries:
 
         """
         # Call the method implementation (too large/complex to be included
-        # directly in the class definition)
+        # directly in the class definition). Matplotlib is only imported on
+        # first use.
+        from .gui import _ui_edit_events  # noqa: PLC0415 import-outside-toplevel
+
         return _ui_edit_events(self, name, data_keys, legend, max_lines)
 
     def ui_sync(
@@ -3428,7 +4116,10 @@ class TimeSeries:
 
         """
         # Call the method implementation (too large/complex to be included
-        # directly in the class definition)
+        # directly in the class definition). Matplotlib is only imported on
+        # first use.
+        from .gui import _ui_sync  # noqa: PLC0415 import-outside-toplevel
+
         return _ui_sync(self, data_keys, ts2, data_keys2, legend, max_lines)
 
     def plot(
@@ -3480,7 +4171,10 @@ class TimeSeries:
 
         """
         # Call the method implementation (too large/complex to be included
-        # directly in the class definition)
+        # directly in the class definition). Matplotlib is only imported on
+        # first use.
+        from .gui import _plot  # noqa: PLC0415 import-outside-toplevel
+
         _plot(
             self,
             data_keys,
@@ -3494,7 +4188,7 @@ class TimeSeries:
     # %% Input/Output
 
     def _to_dataframe_and_info(
-        self,
+        self, copy: bool = True
     ) -> tuple[pd.DataFrame, list[dict[str, Any]]]:
         """
         Implement TimeSeries.to_dataframe with additional info.
@@ -3505,89 +4199,52 @@ class TimeSeries:
         an element of the list could be: {"Unit": "N"}.
 
         """
-        # Init
-        df_out = pd.DataFrame()
-        info_out = []
-
-        # Go through data
-        the_keys = self.data.keys()
-        for the_key in the_keys:
-            # Assign data
-            original_data = self.data[the_key]
-
-            if original_data.shape[0] > 0:  # Not empty
-                original_data_shape = original_data.shape
-                data_length = original_data.shape[0]
-
-                reshaped_data = np.reshape(original_data, (data_length, -1))
-                reshaped_data_shape = reshaped_data.shape
-
-                df_data = pd.DataFrame(reshaped_data)
-
-                # Get the column names index from the shape of the original
-                # data. The strategy here is to build matrices of indexes,
-                # that have the same shape as the original data, then reshape
-                # these matrices the same way we reshaped the original data.
-                # Then we know where the original indexes are in the new
-                # reshaped data.
-                original_indexes = np.indices(original_data_shape[1:])
-                reshaped_indexes = np.reshape(
-                    original_indexes, (-1, reshaped_data_shape[1])
-                )
+        column_names = []  # type: list[str]
+        info_out = []  # type: list[dict[str, Any]]
+        blocks = []  # type: list[np.ndarray]
+
+        for key, data in self.data.items():
+            if data.shape[0] > 0:  # Not empty
+                block = np.reshape(data, (data.shape[0], -1))
+                names = _get_column_names(key, data.shape[1:])
+            else:  # Empty data
+                block = np.empty((0, 1), dtype=object)
+                names = [key]
+
+            blocks.append(block)
+            column_names.extend(names)
+            info = self.info[key] if key in self.info else {}
+            info_out.extend(deepcopy(info) for _ in names)
+
+        if len(blocks) == 0:
+            df_out = pd.DataFrame(index=self.time)
+
+        elif copy and len({block.dtype for block in blocks}) == 1:
+            # Single allocation for all columns
+            values = np.empty(
+                (self.time.shape[0], len(column_names)),
+                dtype=blocks[0].dtype,
+            )
+            i_column = 0
+            for block in blocks:
+                values[:, i_column : i_column + block.shape[1]] = block
+                i_column += block.shape[1]
+            df_out = pd.DataFrame(
+                values, index=self.time, columns=column_names, copy=False
+            )
 
-                # Hint for my future self:
-                # For a one-dimension series, reshaped_indexes will be:
-                # [[0]].
-                # For a two-dimension series, reshaped_indexes will be:
-                # [[0 1 2 ...]].
-                # For a three-dimension series, reshaped_indexes will be:
-                # [[0 0 0 ... 1 1 1 ... 2 2 2 ...]
-                #   0 1 2 ... 0 1 2 ... 0 1 2 ...]]
-                # and so on.
-
-                # Assign column names
-                column_names = []
-                for i_column in range(0, len(df_data.columns)):
-                    this_column_name = the_key
-                    n_indexes = np.shape(reshaped_indexes)[0]
-                    if n_indexes > 0:
-                        # This data is expressed in more than one dimension.
-                        # We must add brackets to the column names to specify
-                        # the indexes.
-                        this_column_name += "[:,"
-
-                        for i_indice in range(0, n_indexes):
-                            this_column_name += str(
-                                reshaped_indexes[i_indice, i_column]
-                            )
-                            if i_indice == n_indexes - 1:
-                                this_column_name += "]"
-                            else:
-                                this_column_name += ","
-
-                    column_names.append(this_column_name)
-
-                df_data.columns = column_names
-
-            else:  # empty data
-                df_data = pd.DataFrame(columns=[the_key])
-
-            # Merge this dataframe with the output dataframe
-            df_out = pd.concat([df_out, df_data], axis=1)
-
-            # Add the info that correspond to this key
-            for _i in df_data.columns:
-                try:
-                    info = self.info[the_key]
-                    info_out.append(deepcopy(info))
-                except KeyError:
-                    info_out.append({})
-
-        df_out.index = self.time
+        else:
+            # One block per key, either to keep each key's dtype or to
+            # share memory with the original data.
+            df_out = pd.concat(
+                [pd.DataFrame(block, copy=copy) for block in blocks], axis=1
+            )
+            df_out.columns = column_names
+            df_out.index = self.time
 
         return (df_out, info_out)
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self, *, copy: bool = True) -> pd.DataFrame:
         """
         Create a DataFrame by reshaping all data to one bidimensional table.
 
@@ -3596,6 +4253,15 @@ class TimeSeries:
         dimensions in brackets. The TimeSeries's events and info attributes are
         not included in the resulting DataFrame.
 
+        Parameters
+        ----------
+        copy
+            Optional. True to copy the data into a new DataFrame. False to
+            create a DataFrame that shares memory with the TimeSeries' data
+            when possible, which avoids copying large TimeSeries; in this
+            case, modifying the TimeSeries' data may also modify the
+            DataFrame. The default is True.
+
         Returns
         -------
         pd.DataFrame
@@ -3637,8 +4303,9 @@ class TimeSeries:
          0.3        0.0        2.0        3.0
 
         """
+        check_param("copy", copy, bool)
         self._check_well_shaped()
-        return self._to_dataframe_and_info()[0]
+        return self._to_dataframe_and_info(copy)[0]
 
     @staticmethod
     def from_dataframe(
@@ -3785,60 +4452,45 @@ class TimeSeries:
         if "data_info" in kwargs:
             ts.data_info = kwargs["data_info"].copy()
 
-        # Protect the original dataframe
-        dataframe = dataframe.copy()
-
-        # Remove spaces and ":," in indexes between brackets
-        columns = dataframe.columns
-        new_columns = []
-        for _i_column, column in enumerate(columns):
-            splitted = column.split("[")
-            if len(splitted) > 1:  # There are brackets
-                new_columns.append(
-                    splitted[0]
-                    + "["
-                    + splitted[1].replace(" ", "").replace(":,", "")
-                )
-            else:
-                new_columns.append(column)
-        dataframe.columns = new_columns
-
-        # Search for the column names and their dimensions
-        # At the end, we end with something like:
-        #    dimensions['Data1'] = []
-        #    dimensions['Data2'] = [[0], [1], [2]]
-        #    dimensions['Data3'] = [[0,0],[0,1],[1,0],[1,1]]
-        dimensions = dict()  # type: dict[str, list]
-        for column in dataframe.columns:
-            splitted = column.split("[")
-            if len(splitted) == 1:  # No brackets
-                dimensions[column] = []
-            else:  # With brackets
-                key = splitted[0]
-                index = literal_eval("[" + splitted[1])
-
-                if key in dimensions:
-                    dimensions[key].append(index)
-                else:
-                    dimensions[key] = [index]
+        columns, indexes = _group_dataframe_columns(dataframe.columns)
 
         n_samples = len(dataframe)
+        if len(set(dataframe.dtypes)) == 1:
+            values = dataframe.to_numpy()
+        else:
+            values = None  # Keep the dtype of each key
 
         # Assign the columns to the output
-        for key, dimension in dimensions.items():
-            if len(dimension) == 0:
-                ts.data[key] = dataframe[key].to_numpy()
+        for key, key_columns in columns.items():
+            if values is None:
+                key_values = dataframe.iloc[:, key_columns].to_numpy()
+            elif key_columns[-1] - key_columns[0] == len(key_columns) - 1:
+                # Contiguous slice
+                key_values = values[:, key_columns[0] : key_columns[-1] + 1]
             else:
-                highest_dims = np.max(np.array(dimension), axis=0)
+                key_values = values[:, key_columns]
 
-                columns = [
-                    key + str(dim).replace(" ", "")
-                    for dim in sorted(dimension)
-                ]
-                ts.data[key] = dataframe[columns].to_numpy()
-                ts.data[key] = np.reshape(
-                    ts.data[key], [n_samples] + (highest_dims + 1).tolist()
+            if key not in indexes:
+                ts.data[key] = key_values[:, 0]
+                continue
+
+            # Sort the columns in C order, then reshape
+            key_indexes = np.array(indexes[key])
+            shape = tuple((np.max(key_indexes, axis=0) + 1).tolist())
+            if len(key_columns) != np.prod(shape):
+                raise ValueError(
+                    f"The columns of data '{key}' do not form a complete "
+                    f"array of shape {shape}: only {len(key_columns)} "
+                    "columns were found."
+                )
+            order = np.ravel_multi_index(tuple(key_indexes.T), shape)
+            if np.unique(order).shape[0] != order.shape[0]:
+                raise ValueError(
+                    f"The columns of data '{key}' contain duplicated indexes."
                 )
+            if np.any(order[1:] != order[:-1] + 1):
+                key_values = key_values[:, np.argsort(order)]
+            ts.data[key] = np.reshape(key_values, (n_samples, *shape))
 
         return ts
 
@@ -3933,6 +4585,108 @@ class TimeSeries:
 
         return ts
 
+    def to_arrow(self) -> Any:
+        """
+        Create an Arrow table with the TimeSeries' time, data, events and info.
+
+        The first column of the table is named "time" and contains the
+        TimeSeries' time. Each data key is then converted to one column:
+        unidimensional data are converted to columns of values, and
+        multidimensional data are converted to columns of fixed-size lists,
+        so that each row of an Nx4x4 data is a list of 4 lists of 4 values.
+        The info of each data key is saved in the metadata of its column,
+        and the events and other info are saved in the metadata of the
+        table.
+
+        For contiguous numeric data, the table shares memory with the
+        TimeSeries: no data is copied.
+
+        This method requires pyarrow, which is an optional dependency of
+        Kinetics Toolkit.
+
+        Returns
+        -------
+        pyarrow.Table
+            The Arrow table.
+
+        Raises
+        ------
+        ValueError
+            If the TimeSeries has a data key named "time".
+
+        See Also
+        --------
+        ktk.TimeSeries.from_arrow
+        ktk.TimeSeries.to_dataframe
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.arange(3) / 10)
+        >>> ts = ts.add_data("Forces", np.arange(6.0).reshape(3, 2))
+        >>> table = ts.to_arrow()
+        >>> table.schema  # doctest: +ELLIPSIS
+        time: double
+          -- field metadata --
+          ktk.info: '{"Unit": "s"}'
+        Forces: fixed_size_list<item: double>[2]
+          child 0, item: double
+        -- schema metadata --
+        ktk.events: '[]'
+        ktk.info: '{}'
+
+        """
+        return _to_arrow(self)
+
+    @staticmethod
+    def from_arrow(table: Any, /) -> "TimeSeries":
+        """
+        Create a new TimeSeries from an Arrow table.
+
+        The table must have a column named "time", and each other column is
+        converted to a data key. Columns of fixed-size lists are converted to
+        multidimensional data. The events and info saved by
+        ktk.TimeSeries.to_arrow are restored.
+
+        This method requires pyarrow, which is an optional dependency of
+        Kinetics Toolkit.
+
+        Parameters
+        ----------
+        table
+            A pyarrow.Table, as created by ktk.TimeSeries.to_arrow.
+
+        Returns
+        -------
+        TimeSeries
+            The converted TimeSeries.
+
+        Raises
+        ------
+        ValueError
+            If the table has no column named "time".
+
+        See Also
+        --------
+        ktk.TimeSeries.to_arrow
+        ktk.TimeSeries.from_dataframe
+
+        Example
+        -------
+        >>> ts = ktk.TimeSeries(time=np.arange(3) / 10)
+        >>> ts = ts.add_data("Forces", np.arange(6.0).reshape(3, 2))
+        >>> ts = ts.add_event(0.1, "event")
+        >>> ktk.TimeSeries.from_arrow(ts.to_arrow())
+        TimeSeries with attributes:
+              time: array([0. , 0.1, 0.2])
+              data: {'Forces': array([[0., 1.],
+               [2., 3.],
+               [4., 5.]])}
+            events: [TimeSeriesEvent(time=0.1, name='event')]
+              info: {'Time': {'Unit': 's'}}
+
+        """
+        return _from_arrow(table)
+
     # Deprecated methods
     sort_events = sort_events
     add_data_info = add_data_info
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020-2025 Félix Chénier
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Implement the TimeSeries conversions to and from Arrow tables."""
+
+__author__ = "Félix Chénier"
+__copyright__ = "Copyright (C) 2020-2025 Félix Chénier"
+__email__ = "chenier.felix@uqam.ca"
+__license__ = "Apache 2.0"
+
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from kineticstoolkit.typing_ import check_param
+
+if TYPE_CHECKING:
+    from kineticstoolkit import TimeSeries
+
+# Name of the time column, and metadata keys of the Arrow schema and fields
+TIME_COLUMN = "time"
+INFO_METADATA_KEY = b"ktk.info"
+EVENTS_METADATA_KEY = b"ktk.events"
+
+
+def _import_pyarrow():
+    """Import pyarrow or raise a ModuleNotFoundError."""
+    try:
+        import pyarrow  # noqa: PLC0415 import-outside-toplevel
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "The pyarrow module is an optional dependency of Kinetics "
+            "Toolkit. It must be installed to convert TimeSeries to and "
+            "from Arrow tables or Parquet files."
+        )
+    return pyarrow
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy values found in info to JSON-serializable values."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(
+        f"The info value {obj} of type {type(obj)} cannot be converted to "
+        "JSON."
+    )
+
+
+def _array_to_arrow(data: np.ndarray):
+    """
+    Convert a NumPy array to an Arrow array.
+
+    Multidimensional arrays are converted to nested fixed-size lists, so
+    that an Nx4x4 array becomes N elements of 4 lists of 4 values. For
+    contiguous numeric arrays, no data is copied.
+    """
+    pa = _import_pyarrow()
+    if data.ndim == 1:
+        return pa.array(data)
+
+    values = pa.array(np.ravel(data))
+    for dim in reversed(data.shape[1:]):
+        values = pa.FixedSizeListArray.from_arrays(values, dim)
+    return values
+
+
+def _array_from_arrow(column) -> np.ndarray:
+    """Convert an Arrow array or chunked array to a NumPy array."""
+    pa = _import_pyarrow()
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+
+    shape = [len(column)]
+    while pa.types.is_fixed_size_list(column.type):
+        shape.append(column.type.list_size)
+        column = column.flatten()
+
+    return np.reshape(column.to_numpy(zero_copy_only=False), shape)
+
+
+def _to_arrow(ts: "TimeSeries"):
+    """Implement TimeSeries.to_arrow."""
+    pa = _import_pyarrow()
+    ts._check_well_shaped()
+
+    if TIME_COLUMN in ts.data:
+        raise ValueError(
+            f"A TimeSeries with a data key named '{TIME_COLUMN}' cannot be "
+            "converted to an Arrow table, since this is the name of the time "
+            "column."
+        )
+
+    fields = []
+    arrays = []
+    for key, data in [(TIME_COLUMN, ts.time), *ts.data.items()]:
+        array = _array_to_arrow(data)
+        info_key = "Time" if key == TIME_COLUMN else key
+        metadata = (
+            {
+                INFO_METADATA_KEY: json.dumps(
+                    ts.info[info_key], default=_json_default
+                )
+            }
+            if info_key in ts.info
+            else None
+        )
+        fields.append(pa.field(key, array.type, metadata=metadata))
+        arrays.append(array)
+
+    events = [[event.time, event.name] for event in ts.events]
+    schema = pa.schema(
+        fields,
+        metadata={
+            EVENTS_METADATA_KEY: json.dumps(events, default=_json_default),
+            INFO_METADATA_KEY: json.dumps(
+                {
+                    key: value
+                    for key, value in ts.info.items()
+                    if key != "Time" and key not in ts.data
+                },
+                default=_json_default,
+            ),
+        },
+    )
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _from_arrow(table) -> "TimeSeries":
+    """Implement TimeSeries.from_arrow."""
+    pa = _import_pyarrow()
+    check_param("table", table, pa.Table)
+
+    from kineticstoolkit import TimeSeries  # noqa: PLC0415 circular import
+
+    if TIME_COLUMN not in table.column_names:
+        raise ValueError(
+            f"The Arrow table must have a column named '{TIME_COLUMN}'."
+        )
+
+    ts = TimeSeries()
+    schema_metadata = table.schema.metadata or {}
+    if INFO_METADATA_KEY in schema_metadata:
+        for key, value in json.loads(
+            schema_metadata[INFO_METADATA_KEY]
+        ).items():
+            ts.info[key] = value
+
+    for i_column, key in enumerate(table.column_names):
+        data = _array_from_arrow(table.column(i_column))
+        if key == TIME_COLUMN:
+            ts.time = data
+        else:
+            ts.data[key] = data
+
+        field_metadata = table.schema.field(i_column).metadata or {}
+        if INFO_METADATA_KEY in field_metadata:
+            info_key = "Time" if key == TIME_COLUMN else key
+            ts.info[info_key] = json.loads(field_metadata[INFO_METADATA_KEY])
+
+    if EVENTS_METADATA_KEY in schema_metadata:
+        events = json.loads(schema_metadata[EVENTS_METADATA_KEY])
+        ts.add_events(
+            [event[0] for event in events],
+            [event[1] for event in events],
+            in_place=True,
+        )
+
+    return ts
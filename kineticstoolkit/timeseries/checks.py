@@ -131,6 +131,11 @@ def _check_valid_time(self) -> None:
         If the time attribute contains invalid values.
 
     """
+    # Fast path for the usual case: a strictly increasing time has neither
+    # nans nor duplicates.
+    if np.all(self.time[1:] > self.time[:-1]):
+        return
+
     if not np.all(~np.isnan(self.time)):
         raise ValueError(
             "A TimeSeries' time attribute must not contain nans. "
@@ -205,7 +210,8 @@ def _check_increasing_time(self) -> None:
         If the TimeSeries' time is not always increasing.
 
     """
-    if not np.array_equal(self.time, np.sort(self.time)):
+    # Comparisons with nan are False, so a time with nans is not increasing.
+    if not np.all(self.time[1:] >= self.time[:-1]):
         raise ValueError(
             "The TimeSeries' time attribute is not always increasing, "
             "which is required by the requested function. You can "
@@ -15,49 +15,318 @@
 # limitations under the License.
 """Provide the classes uses by TimeSeries."""
 
+import sys
 from dataclasses import dataclass
+from typing import NamedTuple
 
 import numpy as np
 
 from kineticstoolkit.typing_ import check_param
 
+# Number of modifications made to existing TimeSeriesEvent instances. Event
+# lists compare it to the value they had when their index was built, to know
+# whether an event may have been modified since then.
+_event_modifications = 0
+
+
+class _EventIndex(NamedTuple):
+    """
+    Index of a sorted event list, for fast event queries.
+
+    Attributes
+    ----------
+    times
+        Time of each event, in the order of the event list.
+    codes
+        Name code of each event, in the order of the event list.
+    name_codes
+        Correspondence between event names and name codes.
+    modifications
+        The value of _event_modifications when the index was built.
+
+    """
+
+    times: np.ndarray
+    codes: np.ndarray
+    name_codes: dict[str, int]
+    modifications: int
+
+    @staticmethod
+    def build(events: list) -> "_EventIndex":
+        """Create the index of a sorted list of events."""
+        name_codes: dict[str, int] = {}
+        codes = np.fromiter(
+            (
+                name_codes.setdefault(event.name, len(name_codes))
+                for event in events
+            ),
+            dtype=int,
+            count=len(events),
+        )
+        times = np.fromiter(
+            (event.time for event in events), dtype=float, count=len(events)
+        )
+        return _EventIndex(times, codes, name_codes, _event_modifications)
+
+    def inserted(self, position: int, time: float, name: str) -> "_EventIndex":
+        """Return a new index with an additional event."""
+        name_codes = self.name_codes
+        if name not in name_codes:
+            name_codes = {**name_codes, name: len(name_codes)}
+        return _EventIndex(
+            np.insert(self.times, position, time),
+            np.insert(self.codes, position, name_codes[name]),
+            name_codes,
+            self.modifications,
+        )
+
+    def masked(self, mask: np.ndarray) -> "_EventIndex":
+        """Return a new index with only the events where mask is True."""
+        return _EventIndex(
+            self.times[mask],
+            self.codes[mask],
+            self.name_codes,
+            self.modifications,
+        )
+
 
 class TimeSeriesEventList(list):
-    """Event list that ensures every element is a TimeSeriesEvent."""
+    """
+    Event list that ensures every element is a TimeSeriesEvent.
+
+    The list is kept sorted by time, and maintains an index of event times
+    and names that is used for event queries.
+    """
+
+    _index: _EventIndex | None
 
     def __init__(self, source: list | None = None):
         """Initialize the class instance using a source list."""
+        self._index = None
         if source is None:
             source = []
         check_param("source", source, list)
-        for element in source:
-            self.append(element)
+        self.extend(source)
 
-    def __setitem__(self, index, value):
-        """Cast the value to a TimeSeriesEvent."""
-        check_param("index", index, int)
+    @staticmethod
+    def _to_event(value) -> "TimeSeriesEvent":
+        """Cast a value to a new TimeSeriesEvent."""
         try:
-            event = TimeSeriesEvent(time=value.time, name=value.name)
+            return TimeSeriesEvent(time=value.time, name=value.name)
         except AttributeError:
             raise AttributeError(
                 f"The provided value {value} cannot be interpreted as a "
                 "TimeSeriesEvent, because it does not have `time` and `name` "
                 "attributes."
             )
-        super().__setitem__(index, event)
-        # Sort the events
-        self.sort()
+
+    def _sort(self) -> None:
+        """Sort the events by time and invalidate the index."""
+        super().sort(key=_get_event_time)
+        self._index = None
+
+    def _get_index(self) -> _EventIndex:
+        """Return the index of this list, sorting the list if needed."""
+        if self._index is None or (
+            self._index.modifications != _event_modifications
+        ):
+            # Events may have been modified since the last sort.
+            self._sort()
+            self._index = _EventIndex.build(self)
+        return self._index
+
+    def _get_indexes(self, name: str) -> np.ndarray:
+        """Return the indexes of every event of a given name, by time."""
+        index = self._get_index()
+        try:
+            return np.flatnonzero(index.codes == index.name_codes[name])
+        except KeyError:
+            return np.array([], dtype=int)
+
+    def _get_duplicate_indexes(self) -> np.ndarray:
+        """
+        Return the indexes of events that duplicate a previous event.
+
+        An event duplicates a previous event if they have the same name and
+        if their times are close as defined by np.isclose.
+        """
+        index = self._get_index()
+
+        # Sort by name code; since the list is sorted, each name group is
+        # sorted by time.
+        order = np.argsort(index.codes, kind="stable")
+        is_duplicate = _find_duplicates(index.times[order], index.codes[order])
+        return np.sort(order[is_duplicate])
+
+    def _add_events(
+        self, times: np.ndarray, names: list[str], unique: bool
+    ) -> None:
+        """
+        Add events from arrays of times and names, in one operation.
+
+        If unique is True, the events that duplicate an existing event or a
+        previous event of the batch are not added.
+        """
+        index = self._get_index()
+
+        # Name codes, extending those of the index
+        name_codes = dict(index.name_codes)
+        codes = np.fromiter(
+            (name_codes.setdefault(name, len(name_codes)) for name in names),
+            dtype=int,
+            count=len(names),
+        )
+
+        if unique:
+            keep = np.ones(times.shape[0], dtype=bool)
+
+            # Remove the events that are close to an existing event
+            for code in np.unique(codes):
+                in_group = codes == code
+                existing_times = index.times[index.codes == code]
+                if existing_times.shape[0] == 0:
+                    continue
+                group_times = times[in_group]
+                after = np.searchsorted(existing_times, group_times)
+                before = np.maximum(after - 1, 0)
+                after = np.minimum(after, existing_times.shape[0] - 1)
+                keep[in_group] = ~(
+                    np.isclose(group_times, existing_times[before])
+                    | np.isclose(group_times, existing_times[after])
+                )
+
+            # Remove the events that are close to another new event
+            order = np.flatnonzero(keep)
+            order = order[np.argsort(times[order], kind="stable")]
+            order = order[np.argsort(codes[order], kind="stable")]
+            keep[order[_find_duplicates(times[order], codes[order])]] = False
+
+            times = times[keep]
+            codes = codes[keep]
+            names = [
+                name for name, kept in zip(names, keep, strict=True) if kept
+            ]
+
+        # Add everything and sort once. With a stable sort, the new events
+        # come after the existing events at the same time, as with append.
+        events = list(self) + [
+            TimeSeriesEvent(time, name)
+            for time, name in zip(times.tolist(), names, strict=True)
+        ]
+        all_times = np.concatenate([index.times, times])
+        all_codes = np.concatenate([index.codes, codes])
+        order = np.argsort(all_times, kind="stable")
+
+        super().__setitem__(slice(None), [events[i] for i in order])
+        self._index = _EventIndex(
+            all_times[order], all_codes[order], name_codes, index.modifications
+        )
+
+    def _remove_indexes(self, indexes: np.ndarray | list[int]) -> None:
+        """Remove the events at the given indexes."""
+        index = self._get_index()
+        mask = np.ones(len(self), dtype=bool)
+        mask[indexes] = False
+        super().__setitem__(
+            slice(None),
+            [event for event, keep in zip(self, mask, strict=True) if keep],
+        )
+        self._index = index.masked(mask)
+
+    def __setitem__(self, index, value):
+        """Cast the value to a TimeSeriesEvent."""
+        check_param("index", index, int)
+        super().__setitem__(index, self._to_event(value))
+        self._sort()
+
+    def __delitem__(self, index):
+        """Delete events and invalidate the index."""
+        super().__delitem__(index)
+        self._index = None
+
+    def __iadd__(self, values):
+        """Ensure the added values are TimeSeriesEvent."""
+        self.extend(values)
+        return self
+
+    def __imul__(self, value):
+        """Repeat the list and invalidate the index."""
+        super().__imul__(value)
+        self._sort()
+        return self
+
+    def __reduce_ex__(self, protocol):
+        """Pickle as a list of events, without the index."""
+        return (TimeSeriesEventList, (list(self),))
+
+    def __copy__(self):
+        """Return a shallow copy, with the index."""
+        out = TimeSeriesEventList()
+        list.extend(out, self)
+        out._index = self._index
+        return out
+
+    def __deepcopy__(self, memo):
+        """Return a deep copy, with the index."""
+        out = TimeSeriesEventList()
+        list.extend(
+            out, [TimeSeriesEvent(event.time, event.name) for event in self]
+        )
+        out._index = self._index
+        return out
 
     def append(self, value):
         """Ensure the appended value is a TimeSeriesEvent."""
-        super().append(None)
-        self[-1] = value  # Calls __setitem__ which does the check
+        event = self._to_event(value)
+        index = self._index
+        if index is not None and index.modifications == _event_modifications:
+            # Insert directly at the right position, after any event at the
+            # same time, as a stable sort would do.
+            position = int(
+                np.searchsorted(index.times, event.time, side="right")
+            )
+            super().insert(position, event)
+            self._index = index.inserted(position, event.time, event.name)
+        else:
+            super().append(event)
+            self._get_index()  # Sort and build the index
 
     def extend(self, values):
         """Ensure the extended values are TimeSeriesEvent."""
-        for value in values:
-            self.append(value)  # Calls append that calls __setitem__ that
-            # does the check.
+        events = [self._to_event(value) for value in values]
+        super().extend(events)
+        self._sort()
+
+    def insert(self, index, value):
+        """Ensure the inserted value is a TimeSeriesEvent."""
+        super().insert(index, self._to_event(value))
+        self._sort()
+
+    def pop(self, index=-1):
+        """Remove and return an event."""
+        event = super().pop(index)
+        self._index = None
+        return event
+
+    def remove(self, value):
+        """Remove the first occurrence of an event."""
+        super().remove(value)
+        self._index = None
+
+    def clear(self):
+        """Remove every event."""
+        super().clear()
+        self._index = None
+
+    def sort(self, *args, **kwargs):
+        """Sort the events and invalidate the index."""
+        super().sort(*args, **kwargs)
+        self._index = None
+
+    def reverse(self):
+        """Reverse the events and invalidate the index."""
+        super().reverse()
+        self._index = None
 
 
 class TimeSeriesDataDict(dict):
@@ -84,6 +353,10 @@ class TimeSeriesDataDict(dict):
 
         super().__setitem__(key, to_set)
 
+    def _set_view(self, key: str, value: np.ndarray) -> None:
+        """Assign an array without copying it."""
+        super().__setitem__(key, value)
+
 
 class TimeSeriesInfoDict(dict):
     """Info dictionary that ensures it is well formatted."""
@@ -123,7 +396,7 @@ class TimeSeriesStringDict(dict):
         super().__setitem__(key, value)
 
 
-@dataclass
+@dataclass(init=False, slots=True)
 class TimeSeriesEvent:
     """
     Define an event in a TimeSeries.
@@ -147,8 +420,23 @@ class TimeSeriesEvent:
 
     """
 
-    time: float = 0.0
-    name: str = "event"
+    time: float
+    name: str
+
+    def __init__(self, time: float = 0.0, name: str = "event"):
+        """Initialize the event without counting it as a modification."""
+        object.__setattr__(self, "time", time)
+        # Events often share a few names: interning them saves memory and
+        # speeds up name comparisons.
+        object.__setattr__(
+            self, "name", sys.intern(name) if type(name) is str else name
+        )
+
+    def __setattr__(self, name, value):
+        """Keep track of modifications to existing events."""
+        global _event_modifications  # noqa: PLW0603 global-statement
+        _event_modifications += 1
+        object.__setattr__(self, name, value)
 
     def __lt__(self, other):
         """Define < operator."""
@@ -204,3 +492,46 @@ class TimeSeriesEvent:
 
         """
         return {"Time": self.time, "Name": self.name}
+
+
+def _find_duplicates(times: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """
+    Find the events that duplicate a previous event.
+
+    Parameters
+    ----------
+    times
+        The event times, sorted by time in each group of name codes.
+    codes
+        The event name codes, grouped.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array that is True for each event that is close (as
+        defined by np.isclose) to the last non-duplicate event of its name.
+
+    """
+    # Candidates are events close to the previous event of the same name
+    candidates = (
+        np.flatnonzero(
+            (codes[1:] == codes[:-1]) & np.isclose(times[:-1], times[1:])
+        )
+        + 1
+    )
+
+    # Only successions of candidates need to be tested one by one.
+    is_duplicate = np.zeros(times.shape[0], dtype=bool)
+    reference = 0
+    for i in candidates:
+        if not is_duplicate[i - 1]:
+            reference = i - 1
+            is_duplicate[i] = True
+        else:
+            is_duplicate[i] = np.isclose(times[reference], times[i])
+    return is_duplicate
+
+
+def _get_event_time(event: TimeSeriesEvent) -> float:
+    """Return the time of an event, as a sort key."""
+    return event.time
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020-2025 Félix Chénier
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Implement the TimeSeries concatenate method."""
+
+__author__ = "Félix Chénier"
+__copyright__ = "Copyright (C) 2020-2025 Félix Chénier"
+__email__ = "chenier.felix@uqam.ca"
+__license__ = "Apache 2.0"
+
+
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from kineticstoolkit.typing_ import check_param
+
+if TYPE_CHECKING:
+    from kineticstoolkit import TimeSeries
+
+
+def _get_common_sample_rate(ts_list: list["TimeSeries"]) -> float:
+    """
+    Return the sample rate shared by every TimeSeries of the list.
+
+    TimeSeries with less than two samples have no sample rate and are
+    ignored.
+    """
+    sample_rates = [
+        ts.get_sample_rate() for ts in ts_list if ts.time.shape[0] > 1
+    ]
+    if (
+        len(sample_rates) == 0
+        or np.any(np.isnan(sample_rates))
+        or not np.allclose(sample_rates, sample_rates[0])
+    ):
+        raise ValueError(
+            "To shift the TimeSeries or to fill the gaps between them, "
+            "every TimeSeries must have the same constant sample rate."
+        )
+    return sample_rates[0]
+
+
+def _check_same_data(ts_list: list["TimeSeries"]) -> None:
+    """Check that every TimeSeries has the same data keys and shapes."""
+    reference = ts_list[0]
+    for i_ts, ts in enumerate(ts_list[1:], start=1):
+        if set(ts.data) != set(reference.data):
+            raise ValueError(
+                f"The TimeSeries at index {i_ts} does not have the same "
+                f"data keys as the first TimeSeries. The data keys are "
+                f"{list(ts.data)}, but {list(reference.data)} were expected."
+            )
+        for key in ts.data:
+            if ts.data[key].shape[1:] != reference.data[key].shape[1:]:
+                raise ValueError(
+                    f"The data '{key}' of the TimeSeries at index {i_ts} "
+                    f"has a shape of {ts.data[key].shape}, which is not "
+                    "compatible with the shape "
+                    f"{reference.data[key].shape} of the first TimeSeries."
+                )
+
+
+def _concatenate(
+    ts_list: list["TimeSeries"],
+    *,
+    shift: bool = False,
+    fill_gaps: bool = False,
+) -> "TimeSeries":
+    """Implement TimeSeries.concatenate."""
+    # Circular import
+    from kineticstoolkit import TimeSeries  # noqa: PLC0415
+
+    check_param("ts_list", ts_list, list, contents_type=TimeSeries)
+    check_param("shift", shift, bool)
+    check_param("fill_gaps", fill_gaps, bool)
+    if len(ts_list) == 0:
+        raise ValueError("ts_list must contain at least one TimeSeries.")
+    for ts in ts_list:
+        ts._check_well_shaped()
+        ts._check_not_empty_time()
+    _check_same_data(ts_list)
+    # --
+
+    period = 0.0
+    if shift or fill_gaps:
+        period = 1.0 / _get_common_sample_rate(ts_list)
+
+    # Compute the time offset of each TimeSeries, and the number of missing
+    # samples to insert before it.
+    n_blocks = len(ts_list)
+    offsets = np.zeros(n_blocks)
+    n_gap_samples = np.zeros(n_blocks, dtype=int)
+    previous_end = ts_list[0].time[-1]
+    for i_ts in range(1, n_blocks):
+        ts = ts_list[i_ts]
+        if shift:
+            offsets[i_ts] = previous_end + period - ts.time[0]
+        begin = ts.time[0] + offsets[i_ts]
+        if begin <= previous_end:
+            raise ValueError(
+                f"The TimeSeries at index {i_ts} begins at {begin}, which is "
+                f"not after the end of the preceding TimeSeries at "
+                f"{previous_end}. Use shift=True to place each TimeSeries "
+                "after the preceding one."
+            )
+        if fill_gaps:
+            n_gap_samples[i_ts] = max(
+                int(np.round((begin - previous_end) / period)) - 1, 0
+            )
+        previous_end = ts.time[-1] + offsets[i_ts]
+
+    # Preallocate the outputs
+    lengths = np.array([ts.time.shape[0] for ts in ts_list])
+    starts = np.cumsum(n_gap_samples) + np.concatenate(
+        [[0], np.cumsum(lengths)[:-1]]
+    )
+    total_length = starts[-1] + lengths[-1]
+    has_gaps = np.any(n_gap_samples > 0)
+
+    time = np.empty(total_length)
+    data = {}
+    for key in ts_list[0].data:
+        dtype = np.result_type(*[ts.data[key].dtype for ts in ts_list])
+        if has_gaps:
+            dtype = np.result_type(dtype, float)
+        data[key] = np.empty(
+            (total_length, *ts_list[0].data[key].shape[1:]), dtype=dtype
+        )
+
+    # Fill them
+    for i_ts, ts in enumerate(ts_list):
+        block = slice(starts[i_ts], starts[i_ts] + lengths[i_ts])
+        time[block] = ts.time + offsets[i_ts]
+        for key, value in data.items():
+            value[block] = ts.data[key]
+
+        if n_gap_samples[i_ts] > 0:
+            gap = slice(starts[i_ts] - n_gap_samples[i_ts], starts[i_ts])
+            time[gap] = (
+                time[gap.start - 1]
+                + np.arange(1, n_gap_samples[i_ts] + 1) * period
+            )
+            for value in data.values():
+                value[gap] = np.nan
+
+    ts_out = TimeSeries()
+    ts_out._time = time
+    for key, value in data.items():
+        ts_out.data._set_view(key, value)
+    ts_out._info = deepcopy(ts_list[0].info)
+
+    # Offset and add the events in one operation
+    n_events = np.array([len(ts.events) for ts in ts_list])
+    if np.sum(n_events) > 0:
+        ts_out.add_events(
+            np.array([event.time for ts in ts_list for event in ts.events])
+            + np.repeat(offsets, n_events),
+            [event.name for ts in ts_list for event in ts.events],
+            in_place=True,
+        )
+
+    return ts_out
@@ -25,6 +25,7 @@ import warnings
 from copy import deepcopy
 
 import numpy as np
+import scipy as sp
 
 from kineticstoolkit.exceptions import TimeSeriesMergeConflictError
 from kineticstoolkit.typing_ import TYPE_CHECKING, check_param
@@ -33,38 +34,106 @@ if TYPE_CHECKING:
     from kineticstoolkit import TimeSeries
 
 
-def _merge_resample_if_needed(
+def _must_resample(
     ts_in: "TimeSeries", ts_out: "TimeSeries", resample: bool
-) -> None:
-    """Resample ts_in if needed."""
+) -> bool:
+    """Check if ts_in must be resampled to the time of ts_out."""
     if (ts_out.time.shape == ts_in.time.shape) and np.all(
         ts_out.time == ts_in.time
     ):
-        must_resample = False
-    else:
-        must_resample = True
+        return False
 
-    if must_resample is True and resample is False:
+    if resample is False:
         raise ValueError(
             "Time attributes do not match, resampling is required."
         )
+    return True
+
+
+def _merge_resample(
+    ts_in: "TimeSeries", data_keys: list[str], new_time: np.ndarray
+) -> dict[str, np.ndarray]:
+    """
+    Resample the given data keys of ts_in on a new time.
+
+    The data without missing samples are interpolated together, in one call
+    to interp1d. The other data go through TimeSeries.resample, which
+    handles missing samples.
+    """
+    # Circular import
+    from kineticstoolkit.timeseries import (  # noqa: PLC0415
+        MINIMUM_LENGTH_TO_INTERPOLATE,
+    )
+
+    batched_keys = []
+    other_keys = []
+    for key in data_keys:
+        if (
+            ts_in.time.shape[0] >= MINIMUM_LENGTH_TO_INTERPOLATE
+            and ts_in.data[key].dtype.kind in "biuf"
+            and not np.isnan(ts_in.data[key]).any()
+        ):
+            batched_keys.append(key)
+        else:
+            other_keys.append(key)
 
-    if must_resample is True:
-        ts_in.resample(ts_out.time, in_place=True)
+    new_data = {}  # type: dict[str, np.ndarray]
+
+    if len(batched_keys) > 0:
+        n_samples = ts_in.time.shape[0]
+        columns = [
+            ts_in.data[key].reshape((n_samples, -1)) for key in batched_keys
+        ]
+        f = sp.interpolate.interp1d(
+            ts_in.time,
+            np.concatenate(columns, axis=1),
+            axis=0,
+            fill_value="extrapolate",
+        )
+        resampled = f(new_time)
+        resampled[(new_time < ts_in.time[0]) | (new_time > ts_in.time[-1])] = (
+            np.nan
+        )
+
+        splits = np.cumsum([column.shape[1] for column in columns])[:-1]
+        for key, data in zip(
+            batched_keys, np.split(resampled, splits, axis=1), strict=True
+        ):
+            new_data[key] = data.reshape(
+                (new_time.shape[0], *ts_in.data[key].shape[1:])
+            )
+
+    if len(other_keys) > 0:
+        new_data.update(
+            ts_in.get_subset(other_keys).resample(new_time, in_place=True).data
+        )
+
+    return new_data
 
 
 def _merge_data(
-    ts_in: "TimeSeries",
+    new_data: dict[str, np.ndarray],
     ts_out: "TimeSeries",
-    data_keys: list[str],
     on_conflict: str,
     overwrite: bool,
+    copy: bool,
 ) -> None:
-    """Merge data from ts_in into ts_out."""
-    for key in data_keys:
+    """
+    Merge data into ts_out.
+
+    If copy is False, the arrays of new_data are assigned without copying.
+    """
+
+    def set_data(key: str) -> None:
+        if copy:
+            ts_out.data[key] = new_data[key]
+        else:
+            ts_out.data._set_view(key, new_data[key])
+
+    for key in new_data:
         if key not in ts_out.data:
             # No conflict
-            ts_out.add_data(key, ts_in.data[key], in_place=True)
+            set_data(key)
         elif on_conflict == "error":
             # Conflict, and we need to raise
             raise TimeSeriesMergeConflictError(
@@ -73,9 +142,7 @@ def _merge_data(
         elif on_conflict == "warning":
             # Conflict, and we need to warn
             if overwrite:
-                ts_out.add_data(
-                    key, ts_in.data[key], overwrite=True, in_place=True
-                )
+                set_data(key)
                 warnings.warn(
                     f"The key '{key}' exists in both TimeSeries's data. "
                     "According to the overwrite=True "
@@ -92,9 +159,7 @@ def _merge_data(
                 )
         # Conflict, and we need to not warn.
         elif overwrite:
-            ts_out.add_data(
-                key, ts_in.data[key], overwrite=True, in_place=True
-            )
+            set_data(key)
 
 
 def _merge_info(
@@ -105,24 +170,22 @@ def _merge_info(
     overwrite: bool,
 ):
     """Merge info from ts_in into ts_out."""
+
+    def set_info(outer_key: str, inner_key: str) -> None:
+        if outer_key not in ts_out.info:
+            ts_out.info[outer_key] = {}
+        ts_out.info[outer_key][inner_key] = deepcopy(
+            ts_in.info[outer_key][inner_key]
+        )
+
     for outer_key in ts_in.info:
         for inner_key in ts_in.info[outer_key]:
             if outer_key not in ts_out.info:
                 # No conflict
-                ts_out.add_info(
-                    outer_key,
-                    inner_key,
-                    ts_in.info[outer_key][inner_key],
-                    in_place=True,
-                )
+                set_info(outer_key, inner_key)
             elif inner_key not in ts_out.info[outer_key]:
                 # No conflict
-                ts_out.add_info(
-                    outer_key,
-                    inner_key,
-                    ts_in.info[outer_key][inner_key],
-                    in_place=True,
-                )
+                set_info(outer_key, inner_key)
             elif (
                 ts_out.info[outer_key][inner_key]
                 == ts_in.info[outer_key][inner_key]
@@ -140,13 +203,7 @@ def _merge_info(
             elif on_conflict == "warning":
                 # Conflict, and we need to warn
                 if overwrite:
-                    ts_out.add_info(
-                        outer_key,
-                        inner_key,
-                        ts_in.info[outer_key][inner_key],
-                        overwrite=True,
-                        in_place=True,
-                    )
+                    set_info(outer_key, inner_key)
                     warnings.warn(
                         f"The key '{inner_key}' exists in both "
                         f"TimeSeries's attribute info[{outer_key}]. "
@@ -166,13 +223,7 @@ def _merge_info(
 
             # Conflict, and we need to not warn.
             elif overwrite:
-                ts_out.add_info(
-                    outer_key,
-                    inner_key,
-                    ts_in.info[outer_key][inner_key],
-                    overwrite=True,
-                    in_place=True,
-                )
+                set_info(outer_key, inner_key)
 
 
 def _merge(
@@ -212,30 +263,84 @@ def _merge(
     # --
 
     ts_out = self if in_place else self.copy()
-    ts = ts.copy()
     if len(data_keys) == 0:
         data_keys = list(ts.data.keys())
     elif isinstance(data_keys, str):
         data_keys = [data_keys]
 
     if len(ts_out.time) == 0:
-        ts_out.time = deepcopy(ts.time)
-
-    # Check if resampling is needed
-    _merge_resample_if_needed(ts, ts_out, resample)
+        ts_out.time = ts.time
 
-    # Merge data
-    _merge_data(ts, ts_out, data_keys, on_conflict, overwrite)
+    # Merge data. The incoming TimeSeries is not copied: only the merged
+    # data are copied, or resampled into new arrays.
+    if _must_resample(ts, ts_out, resample):
+        new_data = _merge_resample(ts, data_keys, ts_out.time)
+        _merge_data(new_data, ts_out, on_conflict, overwrite, copy=False)
+    else:
+        new_data = {key: ts.data[key] for key in data_keys}
+        _merge_data(new_data, ts_out, on_conflict, overwrite, copy=True)
 
     # Merge info
     if merge_info:
         _merge_info(ts, ts_out, data_keys, on_conflict, overwrite)
 
     # Merge events
+    if merge_events and len(ts.events) > 0:
+        ts_out.add_events(
+            [event.time for event in ts.events],
+            [event.name for event in ts.events],
+            in_place=True,
+            unique=True,
+        )
+
+    return ts_out
+
+
+def _merge_many(
+    ts_list: list["TimeSeries"],
+    *,
+    resample: bool = False,
+    merge_events: bool = True,
+    merge_info: bool = True,
+    overwrite: bool = False,
+    on_conflict: str = "warning",
+) -> "TimeSeries":
+    """Implement TimeSeries.merge_many."""
+    # Circular import
+    from kineticstoolkit import TimeSeries  # noqa: PLC0415
+
+    check_param("ts_list", ts_list, list, contents_type=TimeSeries)
+    check_param("merge_events", merge_events, bool)
+    # The other parameters are checked by _merge
+    # --
+
+    if len(ts_list) == 0:
+        return TimeSeries()
+
+    # The time of the first TimeSeries is the common time base. Every other
+    # TimeSeries is merged in place into the only copy, and the events are
+    # merged at the end, in one operation.
+    ts_out = ts_list[0].copy()
+    for ts in ts_list[1:]:
+        _merge(
+            ts_out,
+            ts,
+            resample=resample,
+            merge_events=False,
+            merge_info=merge_info,
+            overwrite=overwrite,
+            on_conflict=on_conflict,
+            in_place=True,
+        )
+
     if merge_events:
-        for event in ts.events:
-            ts_out.add_event(
-                event.time, event.name, in_place=True, unique=True
+        events = [event for ts in ts_list[1:] for event in ts.events]
+        if len(events) > 0:
+            ts_out.add_events(
+                [event.time for event in events],
+                [event.name for event in events],
+                in_place=True,
+                unique=True,
             )
 
     return ts_out
@@ -25,13 +25,21 @@ from typing import TYPE_CHECKING, NewType
 
 from numpy.typing import ArrayLike as npt_ArrayLike
 
+from kineticstoolkit import config
+
+# Each type is mapped to the concrete built-in types first, then to the
+# abstract type. isinstance checks a tuple from left to right, and checking a
+# concrete type is much faster than checking an abstract base class.
 PARAM_MAPPING = {
-    int: Integral,
-    float: Real,
-    complex: Complex,
+    int: (int, Integral),
+    float: (float, int, Real),
+    complex: (complex, float, int, Complex),
     None: type(None),
 }
 
+# Cache of the mapped types, for the tuples of types
+_mapped_types = {}  # type: dict[tuple, tuple]
+
 # Define custom types so that sphinx and mypy and the users are all happy
 if TYPE_CHECKING:  # mypy is running
     ArrayLike = npt_ArrayLike
@@ -40,16 +48,22 @@ else:  # runtime
     ArrayLike = NewType("ArrayLike", npt_ArrayLike)
 
 
+def _map_type(expected_type):
+    """Map a type or a tuple of types to the types to check with isinstance."""
+    if not isinstance(expected_type, tuple):
+        return PARAM_MAPPING.get(expected_type, expected_type)
+    try:
+        return _mapped_types[expected_type]
+    except KeyError:
+        # isinstance accepts nested tuples of types
+        mapped_type = tuple(_map_type(_) for _ in expected_type)
+        _mapped_types[expected_type] = mapped_type
+        return mapped_type
+
+
 def _check_type(name, value, expected_type):
     """Check that value is of expected type and raise if not."""
-    if isinstance(expected_type, tuple):
-        mapped_expected_type = tuple(
-            [PARAM_MAPPING.get(_, _) for _ in expected_type]
-        )
-    else:
-        mapped_expected_type = PARAM_MAPPING.get(expected_type, expected_type)  # type: ignore
-
-    if not isinstance(value, mapped_expected_type):  # type: ignore
+    if not isinstance(value, _map_type(expected_type)):
         raise TypeError(
             f"{name} must be of type {expected_type}, however it is "
             f"of type {type(value)}, with a value of {value}."
@@ -69,21 +83,14 @@ def _check_value(name, value, expected_values: list | None):
 def _check_contents_type(name, value, contents_type):
     """Check that the value items are of contents_type and raise if not."""
     if contents_type is not None:
-        if isinstance(contents_type, tuple):
-            mapped_contents_type = tuple(
-                [PARAM_MAPPING.get(_, _) for _ in contents_type]
-            )
-        else:
-            mapped_contents_type = PARAM_MAPPING.get(
-                contents_type, contents_type
-            )  # type: ignore
+        mapped_contents_type = _map_type(contents_type)
 
         if isinstance(value, dict):
             value_list = value.values()
         else:
             value_list = value
         for element in value_list:
-            if not isinstance(element, mapped_contents_type):  # type: ignore
+            if not isinstance(element, mapped_contents_type):
                 raise TypeError(
                     f"{name} must contain only elements of type "
                     f"{contents_type}, however it contains an element of type "
@@ -134,15 +141,10 @@ def _check_shape(name, value, shape: tuple | None):
 def _check_key_type(name, value, key_type):
     """Check that every dict key is of correct type and raise if not."""
     if key_type is not None:
-        if isinstance(key_type, tuple):
-            mapped_key_type = tuple(
-                [PARAM_MAPPING.get(_, _) for _ in key_type]
-            )
-        else:
-            mapped_key_type = PARAM_MAPPING.get(key_type, key_type)  # type: ignore
+        mapped_key_type = _map_type(key_type)
 
         for key in value:
-            if not isinstance(key, mapped_key_type):  # type: ignore
+            if not isinstance(key, mapped_key_type):
                 raise TypeError(
                     f"{name} must contain only keys of type "
                     f"{key_type}, however it contains a key of type "
@@ -165,6 +167,10 @@ def check_param(
     """
     Check that a given parameter has the expected specifications.
 
+    The extent of the checks depends on `ktk.config.validation`: "full"
+    performs every check, "fast" only checks the type of the parameter, and
+    "off" performs no check at all.
+
     Parameters
     ----------
     name
@@ -204,13 +210,29 @@ def check_param(
         If the value does not meet the given criteria.
 
     """
-    _check_type(name, value, expected_type)  # type: ignore
-    _check_value(name, value, expected_values)
-    _check_contents_type(name, value, contents_type)
-    _check_length(name, value, length)
-    _check_ndims(name, value, ndims)
-    _check_shape(name, value, shape)
-    _check_key_type(name, value, key_type)
+    validation = config.validation
+    if validation == "off":
+        return
+
+    # Fast path: a single isinstance, the most common case
+    if not isinstance(value, _map_type(expected_type)):
+        _check_type(name, value, expected_type)  # Raises
+    if validation == "fast":
+        return
+
+    # Full validation
+    if expected_values is not None:
+        _check_value(name, value, expected_values)
+    if contents_type is not None:
+        _check_contents_type(name, value, contents_type)
+    if length is not None:
+        _check_length(name, value, length)
+    if ndims is not None:
+        _check_ndims(name, value, ndims)
+    if shape is not None:
+        _check_shape(name, value, shape)
+    if key_type is not None:
+        _check_key_type(name, value, key_type)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -33,7 +33,6 @@ setuptools.setup(
         "pyqt5",  # For Player and interactive functions
         "scipy",
         "matplotlib",
-        "scikit-learn",
         "limitedinteraction",  # For UI
         "tqdm",  # For progress bars
         "requests",  # To download documentation examples
@@ -26,6 +26,7 @@ import warnings
 
 import numpy as np
 import pandas as pd
+import pytest
 
 import kineticstoolkit as ktk
 
@@ -126,6 +127,119 @@ def test_save_load():
         d = ktk.load(filename)
         assert d == c
 
+        os.remove(filename)
+
+
+def test_save_load_parquet():
+    pytest.importorskip("pyarrow")
+    ts = ktk.TimeSeries(time=np.arange(100) / 10)
+    ts = ts.add_data("Frames", np.random.rand(100, 4, 4))
+    ts = ts.add_data("Forces", np.random.rand(100, 3))
+    ts = ts.add_data("Signal", np.random.rand(100))
+    ts = ts.add_info("Forces", "Unit", "N")
+    ts = ts.add_info("Trial", "Subject", 12)
+    ts = ts.add_event(1.53, "TestEvent1")
+    ts = ts.add_event(7.2, "TestEvent2")
+
+    ktk.save("test.parquet", ts)
+    assert ktk.load("test.parquet") == ts
+
+    # Load only some keys
+    ts2, metadata = ktk.load(
+        "test.parquet", include_metadata=True, data_keys="Forces"
+    )
+    assert list(ts2.data) == ["Forces"]
+    assert ts2.info == {
+        "Time": {"Unit": "s"},
+        "Forces": {"Unit": "N"},
+        "Trial": {"Subject": 12},
+    }
+    assert ts2.events == ts.events
+    assert metadata["Software"] == "Kinetics Toolkit"
+
+    # Only TimeSeries are supported
+    try:
+        ktk.save("test.parquet", {"ts": ts})
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+    # Plain Parquet file, written by another tool
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table({"time": [0.0, 0.1, 0.2], "Signal": [1.0, 2.0, 3.0]})
+    pq.write_table(table, "test.parquet")
+    ts3, metadata = ktk.load("test.parquet", include_metadata=True)
+    assert np.allclose(ts3.time, [0.0, 0.1, 0.2])
+    assert np.allclose(ts3.data["Signal"], [1.0, 2.0, 3.0])
+    assert ts3.events == []
+    assert metadata == {}
+    os.remove("test.parquet")
+
+
+def test_session_store():
+    pytest.importorskip("h5py")
+    ts = ktk.TimeSeries(time=np.arange(10000) / 100)
+    ts = ts.add_data("Frames", np.random.rand(10000, 4, 4))
+    ts = ts.add_data("Angle", np.random.rand(10000))
+    ts = ts.add_data("Labels", np.array(["a", "b"] * 5000))
+    ts = ts.add_info("Angle", "Unit", "deg")
+    ts = ts.add_info("Trial", "Subject", 12)
+    ts = ts.add_events([1.5, 20.0, 80.25], ["start", "event", "stop"])
+
+    with ktk.files.SessionStore("test.h5", "w") as store:
+        store.add("subject12/trial01", ts)
+        store.add("subject12/trial02", ts.remove_data("Angle"))
+        store.add("subject13/trial01", ts)
+        try:
+            store.add("subject13/trial01", ts)
+            raise AssertionError("This should fail.")
+        except ValueError:
+            pass
+        store.add("subject13/trial01", ts.shift(1.0), overwrite=True)
+
+    with ktk.files.SessionStore("test.h5", "r") as store:
+        assert store.find() == [
+            "subject12/trial01",
+            "subject12/trial02",
+            "subject13/trial01",
+        ]
+        assert store.find("subject12/*", data_key="Angle") == [
+            "subject12/trial01"
+        ]
+        assert "subject12" not in store  # A group, not a TimeSeries
+
+        # Full read
+        ts2 = store.get("subject12/trial01")
+        assert np.array_equal(ts2.data["Labels"], ts.data["Labels"])
+        assert ts2.remove_data("Labels") == ts.remove_data("Labels")
+
+        # Partial read
+        ts2 = store.get(
+            "subject13/trial01", data_keys="Angle", time_range=(20.0, 30.0)
+        )
+        assert list(ts2.data) == ["Angle"]
+        assert np.allclose(ts2.time[[0, -1]], [20.0, 30.0])
+        assert np.array_equal(ts2.data["Angle"], ts.data["Angle"][1900:2901])
+        assert ts2.info == {
+            "Time": {"Unit": "s"},
+            "Angle": {"Unit": "deg"},
+            "Trial": {"Subject": 12},
+        }
+        assert ts2.events == ts.shift(1.0).events
+
+        try:
+            store.get("subject12/trial02", data_keys="Angle")
+            raise AssertionError("This should fail.")
+        except KeyError:
+            pass
+
+    with ktk.files.SessionStore("test.h5") as store:
+        store.remove("subject12/trial02")
+        assert len(store.find()) == 2
+    os.remove("test.h5")
+
 
 def test_read_c3d():
     """Test read_c3d."""
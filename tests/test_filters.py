@@ -105,6 +105,13 @@ def test_savgol():
         np.abs(ddoty.data["data2"][tokeep, 1] - 12 * time[tokeep] ** 2) < tol
     )
 
+    # Integer data are filtered as floats
+    tsin = ktk.TimeSeries(time=time)
+    tsin.data["data"] = np.arange(100) ** 2
+    y = ktk.filters.savgol(tsin, window_length=5, poly_order=2)
+    assert y.data["data"].dtype == float
+    assert np.allclose(y.data["data"], np.arange(100) ** 2)
+
 
 def test_smooth():
     """Test smooth."""
@@ -230,6 +237,17 @@ def test_butter():
         np.abs(np.sum(new_ts.data["data"] ** 2) - 1.5161649322350133) < 1e-12
     )
 
+    # The list of cut-off frequencies is still normalized without validation
+    ktk.config.validation = "off"
+    try:
+        off_ts = ktk.filters.butter(ts, [3, 3.5], btype="bandpass")
+        off_pipeline = ktk.Pipeline(ts).butter([3, 3.5], btype="bandpass")
+        pipeline_ts = off_pipeline.run()
+    finally:
+        ktk.config.validation = "full"
+    assert np.allclose(off_ts.data["data"], new_ts.data["data"])
+    assert np.allclose(pipeline_ts.data["data"], new_ts.data["data"])
+
 
 def test_median():
     """Test median filter."""
@@ -324,6 +342,57 @@ def test_deriv():
     )
 
 
+def test_deriv_methods():
+    """Test the deriv methods that keep the original time."""
+    ts = ktk.TimeSeries(time=np.linspace(0, 1, 101))
+    ts.data["square"] = ts.time**2
+    ts.data["sine"] = np.stack(
+        [np.sin(2 * np.pi * ts.time), np.cos(2 * np.pi * ts.time)], axis=1
+    )
+
+    # Central differences are exact for polynomials of order 2
+    ts1 = ktk.filters.deriv(ts, method="central")
+    assert np.allclose(ts1.time, ts.time)
+    assert np.allclose(ts1.data["square"], 2 * ts.time)
+    ts2 = ktk.filters.deriv(ts, n=2, method="central")
+    assert np.allclose(ts2.data["square"], 2)
+
+    # Spline
+    ts1 = ktk.filters.deriv(ts, method="spline")
+    assert np.allclose(ts1.time, ts.time)
+    assert np.allclose(
+        ts1.data["sine"][:, 0],
+        2 * np.pi * np.cos(2 * np.pi * ts.time),
+        atol=1e-2,
+    )
+    assert np.allclose(
+        ts1.data["sine"][:, 1],
+        -2 * np.pi * np.sin(2 * np.pi * ts.time),
+        atol=1e-2,
+    )
+
+    # Savitzky-Golay: same as filters.savgol
+    ts1 = ktk.filters.deriv(ts, method="savgol", window_length=7, poly_order=3)
+    ts2 = ktk.filters.savgol(ts, window_length=7, poly_order=3, deriv=1)
+    for key in ts.data:
+        assert np.allclose(ts1.data[key], ts2.data[key])
+
+    # Missing samples are interpolated and put back
+    ts.data["sine"][50] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        ts1 = ktk.filters.deriv(ts, method="central")
+    assert np.all(ts1.isnan("sine") == ts.isnan("sine"))
+    assert np.allclose(ts1.data["square"], 2 * ts.time)
+
+    # Missing savgol parameters
+    try:
+        ktk.filters.deriv(ts, method="savgol")
+        raise AssertionError("This should have failed.")
+    except ValueError:
+        pass
+
+
 def test_validate_input():
     ts = ktk.TimeSeries(
         time=np.array([0, 0.1, 0.2]), data={"Data": np.array([0, 0.1, 0.2])}
@@ -339,6 +408,145 @@ def test_validate_input():
         pass
 
 
+def test_cached_design():
+    """Test that cached filter designs give the same results as scipy."""
+    import scipy.signal as sgl
+
+    np.random.seed(0)
+    ts = ktk.TimeSeries(time=np.arange(0, 1, 0.01))
+    ts.data["data"] = np.random.rand(100, 3, 2)
+
+    # savgol, with every combination used in this module
+    for window_length, poly_order, deriv in [
+        (3, 2, 0),
+        (5, 0, 0),
+        (7, 3, 1),
+        (11, 4, 3),
+        (6, 2, 1),  # Even window length, falls back to scipy
+    ]:
+        filtered = ktk.filters.savgol(
+            ts, window_length=window_length, poly_order=poly_order, deriv=deriv
+        )
+        expected = sgl.savgol_filter(
+            ts.data["data"],
+            window_length,
+            poly_order,
+            deriv,
+            delta=0.01,
+            axis=0,
+        )
+        assert np.allclose(filtered.data["data"], expected)
+
+    # savgol with long windows and high orders, where the edge fit must
+    # stay well conditioned
+    ts = ktk.TimeSeries(time=np.arange(0, 10, 0.01))
+    ts.data["data"] = np.cumsum(np.random.rand(1000, 2) - 0.5, axis=0)
+    for window_length, poly_order, deriv in [
+        (101, 8, 0),
+        (201, 7, 2),
+        (401, 9, 0),
+        (401, 9, 1),
+    ]:
+        filtered = ktk.filters.savgol(
+            ts, window_length=window_length, poly_order=poly_order, deriv=deriv
+        )
+        expected = sgl.savgol_filter(
+            ts.data["data"],
+            window_length,
+            poly_order,
+            deriv,
+            delta=0.01,
+            axis=0,
+        )
+        assert np.allclose(filtered.data["data"], expected)
+        derivative = ktk.filters.deriv(
+            ts,
+            method="savgol",
+            window_length=window_length,
+            poly_order=poly_order,
+        )
+        expected = sgl.savgol_filter(
+            ts.data["data"], window_length, poly_order, 1, delta=0.01, axis=0
+        )
+        assert np.allclose(derivative.data["data"], expected)
+
+    # butter: the second call must reuse the cached design
+    ktk.filters._design_butter.cache_clear()
+    ktk.filters.butter(ts, 10.0)
+    ktk.filters.butter(ts.copy(), 10.0)
+    assert ktk.filters._design_butter.cache_info().hits == 1
+
+
+def test_design_savgol():
+    """Test the cached Savitzky-Golay design directly against scipy."""
+    import scipy.signal as sgl
+
+    np.random.seed(0)
+    x = np.random.rand(50, 3)
+    for window_length, poly_order, deriv in [
+        (1, 0, 0),
+        (5, 2, 0),
+        (9, 4, 2),
+        (21, 3, 1),
+    ]:
+        ktk.filters._design_savgol.cache_clear()
+        coeffs, head, tail = ktk.filters._design_savgol(
+            window_length, poly_order, deriv, 0.01
+        )
+        half = window_length // 2
+        assert np.allclose(
+            coeffs,
+            sgl.savgol_coeffs(
+                window_length, poly_order, deriv=deriv, delta=0.01, use="conv"
+            ),
+        )
+        assert head.shape == (half, window_length)
+        assert tail.shape == (half, window_length)
+        assert not coeffs.flags.writeable
+        assert not head.flags.writeable
+        assert not tail.flags.writeable
+
+        # The second design comes from the cache and gives the same result,
+        # including on the edges that are computed by head and tail.
+        expected = sgl.savgol_filter(
+            x, window_length, poly_order, deriv, delta=0.01, axis=0
+        )
+        for _ in range(2):
+            filtered = ktk.filters._savgol_filter(
+                x, window_length, poly_order, deriv, 0.01
+            )
+            assert np.allclose(filtered[:half], expected[:half])
+            assert np.allclose(filtered[-half:], expected[-half:])
+            assert np.allclose(filtered, expected)
+        assert ktk.filters._design_savgol.cache_info().hits == 2
+
+
+def test_filter():
+    """Test the Filter class."""
+    ts = ktk.TimeSeries(time=np.linspace(0, 30, 1000))
+    ts.data["data"] = np.sin(2 * np.pi * ts.time)
+
+    lowpass = ktk.filters.Filter("butter", fc=1.0, order=1)
+    assert repr(lowpass) == "Filter('butter', fc=1.0, order=1)"
+    assert lowpass.apply(ts) == ktk.filters.butter(ts, 1.0, order=1)
+
+    smooth = ktk.filters.Filter("smooth", window_length=5)
+    assert smooth.apply(ts) == ktk.filters.smooth(ts, window_length=5)
+
+    # Invalid filters
+    try:
+        ktk.filters.Filter("unknown")
+        raise AssertionError("This should have failed.")
+    except ValueError:
+        pass
+
+    try:
+        ktk.filters.Filter("butter", order=2)  # Missing fc
+        raise AssertionError("This should have failed.")
+    except TypeError:
+        pass
+
+
 if __name__ == "__main__":
     import pytest
 
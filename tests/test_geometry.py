@@ -22,6 +22,7 @@ __license__ = "Apache 2.0"
 
 
 import numpy as np
+import pytest
 
 import kineticstoolkit as ktk
 
@@ -311,6 +312,43 @@ def test_create_transform_series_with_vector_input():
     assert np.allclose(test, ktk.geometry.create_transforms("z", [np.pi / 2]))
 
 
+def test_create_transform_series_out():
+    # Build the frames of two segments in one preallocated array
+    n_samples = 5
+    frames = np.empty((2 * n_samples, 4, 4))
+    x = np.repeat([[2.0, 0.0, 0.0, 0.0]], n_samples, axis=0)
+    xy = np.repeat([[1.0, 1.0, 0.0, 0.0]], n_samples, axis=0)
+    positions = np.repeat([[1.0, 2.0, 3.0, 1.0]], n_samples, axis=0)
+
+    result = ktk.geometry.create_transform_series(
+        x=x, xy=xy, positions=positions, out=frames[0:n_samples]
+    )
+    assert np.shares_memory(result, frames)
+    expected = np.eye(4)
+    expected[0:3, 3] = [1.0, 2.0, 3.0]
+    assert np.allclose(frames[0:n_samples], expected)
+
+    # One-sample input, repeated to the length of out
+    ktk.geometry.create_transform_series(
+        angles=[[90.0]], seq="z", degrees=True, out=frames[n_samples:]
+    )
+    assert np.allclose(
+        frames[n_samples:],
+        [
+            [0.0, -1.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0, 0.0],
+            [0, 0, 1, 0],
+            [0, 0, 0, 1],
+        ],
+    )
+
+    # Length mismatch
+    with pytest.raises(ValueError):
+        ktk.geometry.create_transform_series(
+            x=x, xy=xy, length=3, out=frames[0:n_samples]
+        )
+
+
 def test_is_frame_point_vector_series():
     """Test is_transform_series, is_point_series and is_vector_series."""
     assert (
@@ -351,6 +389,47 @@ def test_is_frame_point_vector_series():
     )
 
 
+def test_check_no_skewed_rotation():
+    T = ktk.geometry.create_transform_series(
+        angles=np.linspace(0, 1, 30), seq="z", positions=[[1.0, 2.0, 3.0]]
+    )
+    T[5] = np.nan
+    ktk.geometry._check_no_skewed_rotation(T, "T")
+
+    # Writeable series are not remembered, since they may be modified
+    assert not ktk.geometry._is_validated_rotation(T)
+    T[[0, 1], 0, 0] = T[[1, 0], 0, 0]  # Keeps every sum along the samples
+    with pytest.raises(ValueError):
+        ktk.geometry._check_no_skewed_rotation(T, "T")
+    T[[0, 1], 0, 0] = T[[1, 0], 0, 0]
+
+    # Read-only series are remembered, until they become writeable again
+    T.flags.writeable = False
+    ktk.geometry._check_no_skewed_rotation(T, "T")
+    assert ktk.geometry._is_validated_rotation(T)
+    assert not ktk.geometry._is_validated_rotation(T[:])
+    T.flags.writeable = True
+    assert not ktk.geometry._is_validated_rotation(T)
+    T[10, 0:3, 0:3] *= 2
+    with pytest.raises(ValueError):
+        ktk.geometry._check_no_skewed_rotation(T, "T")
+    with pytest.raises(ValueError):
+        ktk.geometry._check_no_skewed_rotation(T, "T")
+    with pytest.raises(ValueError):
+        ktk.geometry.get_local_coordinates(T, T)
+
+    # Check only some samples
+    try:
+        ktk.config.rotation_check_samples = 3  # Samples 0, 14 and 29
+        ktk.geometry._check_no_skewed_rotation(T, "T")
+        assert not ktk.geometry._is_validated_rotation(T)
+        T[14, 0:3, 0:3] *= 2
+        with pytest.raises(ValueError):
+            ktk.geometry._check_no_skewed_rotation(T, "T")
+    finally:
+        ktk.config.rotation_check_samples = None
+
+
 def test_invert():
     """Test inverse matrix series."""
     # Try with simple rotations and translations
@@ -529,6 +608,50 @@ def test_get_local_global_broadcast():
     )
 
 
+def test_get_relative_transforms():
+    np.random.seed(0)
+    ts = ktk.TimeSeries(time=np.arange(10) / 10)
+    for segment in ["Pelvis", "Thigh", "Shank"]:
+        ts.data[segment] = ktk.geometry.create_transform_series(
+            angles=np.random.rand(10, 3),
+            seq="xyz",
+            positions=np.random.rand(10, 3),
+        )
+    ts.data["Thigh"][2] = np.nan
+    ts = ts.add_event(0.5, "heel_strike")
+
+    joints = ktk.geometry.get_relative_transforms(
+        ts, [("Thigh", "Pelvis"), ("Shank", "Thigh")]
+    )
+    assert np.all(joints.time == ts.time)
+    assert joints.events == ts.events
+    for distal, proximal in [("Thigh", "Pelvis"), ("Shank", "Thigh")]:
+        assert np.allclose(
+            joints.data[f"{distal}_{proximal}"],
+            ktk.geometry.get_local_coordinates(
+                ts.data[distal], ts.data[proximal]
+            ),
+            equal_nan=True,
+        )
+
+    # dict inputs
+    joints = ktk.geometry.get_relative_transforms(
+        {"Pelvis": ts.data["Pelvis"], "Thigh": ts.data["Thigh"]},
+        {"Hip": ("Thigh", "Pelvis")},
+    )
+    assert np.all(joints.time == np.arange(10))
+    assert np.allclose(
+        joints.data["Hip"],
+        ktk.geometry.get_local_coordinates(
+            ts.data["Thigh"], ts.data["Pelvis"]
+        ),
+        equal_nan=True,
+    )
+
+    with pytest.raises(KeyError):
+        ktk.geometry.get_relative_transforms(ts, [("Foot", "Shank")])
+
+
 def test_get_angles():
     """Test get_angles and create_transforms."""
     np.random.seed(0)
@@ -602,6 +725,65 @@ def test_get_quaternions():
     assert np.allclose(T, T2)
 
 
+def test_rotation_series():
+    """Test that RotationSeries matches get_angles and get_quaternions."""
+    np.random.seed(0)
+    T = ktk.geometry.create_transform_series(
+        angles=np.random.rand(10, 3),
+        seq="xyz",
+        positions=np.random.rand(10, 3),
+    )
+    T[3] = np.nan
+    rotations = ktk.geometry.RotationSeries(T)
+
+    # Float arrays are not copied, but only T stays writeable
+    assert np.shares_memory(rotations.transforms, T)
+    assert T.flags.writeable
+    assert len(rotations) == 10
+    assert np.all(rotations.nan_mask == (np.arange(10) == 3))
+    with pytest.raises(ValueError):
+        rotations.transforms[0, 0, 0] = 2.0
+
+    # Other inputs are copied
+    rotations_from_list = ktk.geometry.RotationSeries(T.tolist())
+    assert not np.shares_memory(rotations_from_list.transforms, T)
+
+    angles = rotations.get_angles(["xyz", "ZXZ"], degrees=True, flip=True)
+    for seq in ["xyz", "ZXZ"]:
+        expected = np.full((10, 3), np.nan)
+        expected[~rotations.nan_mask] = ktk.geometry.get_angles(
+            T[~rotations.nan_mask], seq, degrees=True, flip=True
+        )
+        assert np.allclose(angles[seq], expected, equal_nan=True)
+        assert np.allclose(
+            rotations.get_angles(seq),
+            ktk.geometry.get_angles(T, seq),
+            equal_nan=True,
+        )
+
+    assert np.allclose(
+        rotations.get_quaternions(scalar_first=True),
+        ktk.geometry.get_quaternions(T, scalar_first=True),
+        equal_nan=True,
+    )
+    assert np.allclose(
+        rotations.inverse, ktk.geometry.invert(T), equal_nan=True
+    )
+
+    # get_angles and get_quaternions also accept Nx3x3 rotation matrices
+    R = T[:, 0:3, 0:3]
+    assert np.allclose(
+        ktk.geometry.get_angles(R, "xyz"),
+        rotations.get_angles("xyz"),
+        equal_nan=True,
+    )
+    assert np.allclose(
+        ktk.geometry.get_quaternions(R),
+        rotations.get_quaternions(),
+        equal_nan=True,
+    )
+
+
 def test_get_distances():
     """Test get_distances."""
     points1 = ktk.geometry.create_point_series(
@@ -621,6 +803,80 @@ def test_get_distances():
     )
 
 
+def test_get_pairwise_distances(monkeypatch):
+    from scipy.spatial.distance import pdist, squareform
+
+    np.random.seed(0)
+    points = np.random.rand(10, 4, 5)
+    points[:, 3] = 1.0
+    points[3, :, 2] = np.nan
+
+    # Process a few samples at a time
+    monkeypatch.setattr(ktk.geometry, "_PAIRWISE_CHUNK_ELEMENTS", 60)
+    distances = ktk.geometry.get_pairwise_distances(points)
+    condensed = ktk.geometry.get_pairwise_distances(points, condensed=True)
+    for i_sample in range(10):
+        expected = pdist(points[i_sample, 0:3].T)
+        assert np.allclose(condensed[i_sample], expected, equal_nan=True)
+        expected = squareform(expected)
+        expected[np.isnan(points[i_sample, 0]), :] = np.nan  # and diagonal
+        assert np.allclose(distances[i_sample], expected, equal_nan=True)
+
+    # get_distances on sets of points
+    assert np.allclose(
+        ktk.geometry.get_distances(points, points[:, :, [1, 2, 3, 4, 0]]),
+        distances[:, [0, 1, 2, 3, 4], [1, 2, 3, 4, 0]],
+        equal_nan=True,
+    )
+
+
+def test_get_rigidity_scores():
+    # A rigid cluster that rotates
+    local_points = np.array(
+        [[[0.0, 0.1, 0.0], [0.0, 0.0, 0.1], [0.0, 0.0, 0.0], [1, 1, 1]]]
+    )
+    T = ktk.geometry.create_transform_series(
+        angles=np.linspace(0, 3, 20), seq="z", positions=[[1.0, 2.0, 3.0]]
+    )
+    points = ktk.geometry.get_global_coordinates(local_points, T)
+    assert np.allclose(ktk.geometry.get_rigidity_scores(points), 0.0)
+
+    # Move the first point at sample 5, and hide a point at sample 6
+    points[5, 0, 0] += 0.01
+    points[6, :, 1] = np.nan
+    scores = ktk.geometry.get_rigidity_scores(points)
+    assert scores[5] > 0.001
+    assert np.allclose(np.delete(scores, 5), 0.0)
+
+    # Provide the reference distances
+    reference = ktk.geometry.get_pairwise_distances(local_points)[0]
+    assert np.allclose(
+        ktk.geometry.get_rigidity_scores(points, reference), scores
+    )
+    points[6, :, 0] = np.nan
+    assert np.isnan(ktk.geometry.get_rigidity_scores(points, reference)[6])
+
+
+def test_register_points():
+    np.random.seed(0)
+    T = ktk.geometry.create_transform_series(
+        angles=np.random.rand(10, 3),
+        seq="xyz",
+        positions=np.random.rand(10, 3),
+    )
+    local_points = np.ones((10, 4, 5))
+    local_points[:, 0:3] = np.random.rand(10, 3, 5)
+    global_points = ktk.geometry.get_global_coordinates(local_points, T)
+    global_points[2, :, 0:3] = np.nan  # Only two visible points
+    local_points[3, :, 0] = np.nan  # Four visible points
+
+    registered = ktk.geometry.register_points(global_points, local_points)
+    assert np.all(np.isnan(registered[2]))
+    assert np.allclose(
+        np.delete(registered, 2, axis=0), np.delete(T, 2, axis=0)
+    )
+
+
 def test_create_transforms_tobedeprecated():
     """Test create_transforms."""
     # Identity matrix
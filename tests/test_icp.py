@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020-2025 Félix Chénier
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the ICP implementation in kineticstoolkit.external."""
+
+__author__ = "Félix Chénier"
+__copyright__ = "Copyright (C) 2020-2025 Félix Chénier"
+__email__ = "chenier.felix@uqam.ca"
+__license__ = "Apache 2.0"
+
+
+import numpy as np
+
+import kineticstoolkit as ktk
+from kineticstoolkit.external import icp
+
+
+def _get_test_frames(n_frames: int = 10) -> tuple:
+    """Return a template, moved subsets of it, and the expected transforms."""
+    rng = np.random.default_rng(0)
+    template = rng.random((200, 3))
+    T = ktk.geometry.create_transform_series(
+        angles=rng.normal(0, 0.1, (n_frames, 3)),
+        seq="xyz",
+        positions=rng.normal(0, 0.02, (n_frames, 3)),
+    )
+    inverse = ktk.geometry.invert(T)
+    points = template[rng.choice(200, (n_frames, 80))]
+    moved = (
+        np.einsum("nij,nkj->nki", inverse[:, 0:3, 0:3], points)
+        + inverse[:, np.newaxis, 0:3, 3]
+    )
+    return template, moved, T
+
+
+def test_icp_batch():
+    template, moved, T = _get_test_frames()
+    moved[2] = np.nan  # No point
+    moved[3, 2:] = np.nan  # Not enough points
+    moved[4, 0:10] = np.nan  # Some missing points
+
+    T_batch, distances, iterations = icp.icp_batch(moved, template)
+
+    assert np.all(np.isnan(T_batch[[2, 3]]))
+    assert np.all(np.isnan(distances[4, 0:10]))
+    valid = np.ones(10, dtype=bool)
+    valid[[2, 3]] = False
+    assert np.allclose(T_batch[valid], T[valid])
+    assert np.all(iterations[valid] > 0)
+
+    # Same result as registering each frame with icp and a shared tree
+    tree = icp.cKDTree(template)
+    for i_frame in np.nonzero(valid)[0]:
+        points = moved[i_frame][~np.isnan(moved[i_frame, :, 0])]
+        T_frame, _, _ = icp.icp(points, template, tree=tree)
+        assert np.allclose(T_frame, T_batch[i_frame])
+
+
+def test_best_fit_transforms():
+    _, moved, T = _get_test_frames()
+    destination = (
+        np.einsum("nij,nkj->nki", T[:, 0:3, 0:3], moved)
+        + T[:, np.newaxis, 0:3, 3]
+    )
+    T_batch = icp.best_fit_transforms(moved, destination)
+    for i_frame in range(10):
+        assert np.allclose(
+            T_batch[i_frame],
+            icp.best_fit_transform(moved[i_frame], destination[i_frame])[0],
+        )
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020-2025 Félix Chénier
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test the import of kineticstoolkit."""
+
+__author__ = "Félix Chénier"
+__copyright__ = "Copyright (C) 2020-2025 Félix Chénier"
+__email__ = "chenier.felix@uqam.ca"
+__license__ = "Apache 2.0"
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import kineticstoolkit as ktk
+
+# Maximal duration of import kineticstoolkit, in seconds. It takes about
+# 0.5 s on a typical workstation.
+_MAX_IMPORT_DURATION = 5.0
+
+
+def _run_in_new_interpreter(code: str) -> dict:
+    """Run code in a new interpreter and return the json it prints."""
+    env = os.environ.copy()
+    env["KINETICSTOOLKIT_NO_VERSION_CHECK"] = "1"
+    env["PYTHONPATH"] = os.pathsep.join(
+        [ktk.config.root_folder, env.get("PYTHONPATH", "")]
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def test_import_is_lazy():
+    result = _run_in_new_interpreter(
+        "import json, sys, time\n"
+        "tic = time.perf_counter()\n"
+        "import kineticstoolkit as ktk\n"
+        "duration = time.perf_counter() - tic\n"
+        "imported = {\n"
+        "    name: name in sys.modules\n"
+        "    for name in ['matplotlib', 'sklearn', 'ezc3d', 'requests_cache',"
+        "                 'kineticstoolkit.filters', 'kineticstoolkit.player']\n"
+        "}\n"
+        "ktk.filters\n"
+        "imported['after'] = 'kineticstoolkit.filters' in sys.modules\n"
+        "print(json.dumps({'duration': duration, 'imported': imported}))\n"
+    )
+
+    # Loose bound, to catch a heavy import without failing on slow runners
+    assert result["duration"] < _MAX_IMPORT_DURATION
+
+    imported = result["imported"]
+    assert imported.pop("after") is True
+    for name, is_imported in imported.items():
+        assert not is_imported, f"{name} is imported with kineticstoolkit"
+
+
+def test_lazy_attributes():
+    for name in dir(ktk):
+        assert getattr(ktk, name) is not None
+    assert ktk.load is ktk.files.load
+    assert ktk.Player is ktk.player.Player
+    assert ktk.gui is not None
+    with pytest.raises(AttributeError):
+        ktk.non_existing_attribute
+
+
+def test_lazy_modules():
+    # In a new interpreter, so that no submodule is already imported
+    result = _run_in_new_interpreter(
+        "import json, types\n"
+        "import kineticstoolkit as ktk\n"
+        "print(json.dumps({\n"
+        "    name: isinstance(getattr(ktk, name), types.ModuleType)\n"
+        "    for name in ['files', 'pipeline', 'player', 'tools']\n"
+        "}))\n"
+    )
+    for name, is_module in result.items():
+        assert is_module, f"ktk.{name} is not a module"
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
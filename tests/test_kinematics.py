@@ -119,6 +119,83 @@ def test_reconstruction():
         )
 
 
+def test_relabel_markers():
+    # A cluster of four markers that moves smoothly
+    names = ["M1", "M2", "M3", "M4"]
+    cluster = {
+        "M1": np.array([[0.0, 0.0, 0.0, 1.0]]),
+        "M2": np.array([[0.1, 0.0, 0.0, 1.0]]),
+        "M3": np.array([[0.0, 0.08, 0.0, 1.0]]),
+        "M4": np.array([[0.0, 0.0, 0.12, 1.0]]),
+        "Virtual": np.array([[0.3, 0.3, 0.3, 1.0]]),
+    }
+    n_samples = 300
+    frames = ktk.geometry.create_transform_series(
+        angles=np.linspace(0, np.pi, n_samples),
+        seq="z",
+        positions=np.linspace([0.0, 0.0, 0.0], [1.0, 0.5, 0.0], n_samples),
+    )
+    truth = ktk.TimeSeries(time=np.arange(n_samples) / 100)
+    for name in names:
+        truth.data[name] = ktk.geometry.get_global_coordinates(
+            cluster[name], frames
+        )
+
+    # Occlude M1, then swap M1 and M2 after the gap
+    markers = truth.copy()
+    markers.data["M1"][50:60] = np.nan
+    markers.data["M1"][60:100] = truth.data["M2"][60:100]
+    markers.data["M2"][60:100] = truth.data["M1"][60:100]
+    # Lose the whole cluster, and M3 comes back unlabeled
+    for name in names:
+        markers.data[name][150:170] = np.nan
+    markers.data["Unlabeled"] = np.full((n_samples, 4), np.nan)
+    markers.data["Unlabeled"][170:200] = truth.data["M3"][170:200]
+    markers.data["M3"][170:200] = np.nan
+
+    relabeled = ktk.kinematics.relabel_markers(
+        markers, cluster, candidates=[*names, "Unlabeled"]
+    )
+
+    assert "Virtual" not in relabeled.data
+    assert np.array_equal(
+        relabeled.data["Unlabeled"], markers.data["Unlabeled"], equal_nan=True
+    )
+    for name in names:
+        expected = truth.data[name].copy()
+        expected[150:170] = np.nan
+        if name == "M1":
+            expected[50:60] = np.nan
+        assert np.allclose(relabeled.data[name], expected, equal_nan=True)
+
+    # By default, only the cluster markers are candidates
+    relabeled = ktk.kinematics.relabel_markers(markers, cluster)
+    assert np.all(np.isnan(relabeled.data["M3"][170:200]))
+    assert np.allclose(relabeled.data["M2"][60:100], truth.data["M2"][60:100])
+
+    # Partial occlusion: with only two visible markers, no pose can be
+    # estimated, and the correctly labelled markers must be kept.
+    markers = truth.copy()
+    markers.data["M3"][100:150] = np.nan
+    markers.data["M4"][100:150] = np.nan
+    relabeled = ktk.kinematics.relabel_markers(markers, cluster)
+    for name in names:
+        assert np.array_equal(
+            relabeled.data[name], markers.data[name], equal_nan=True
+        )
+
+    # A distant unlabeled candidate must not prevent fixing a swap
+    markers = truth.copy()
+    markers.data["M1"][60:100] = truth.data["M2"][60:100]
+    markers.data["M2"][60:100] = truth.data["M1"][60:100]
+    markers.data["Far"] = truth.data["M1"] + [0.7, 0.0, 0.0, 0.0]
+    relabeled = ktk.kinematics.relabel_markers(
+        markers, cluster, candidates=[*names, "Far"]
+    )
+    for name in names:
+        assert np.allclose(relabeled.data[name], truth.data[name])
+
+
 if __name__ == "__main__":
     import pytest
 
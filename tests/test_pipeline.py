@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020-2025 Félix Chénier
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for Kinetics Toolkit's pipeline module."""
+
+__author__ = "Félix Chénier"
+__copyright__ = "Copyright (C) 2020-2025 Félix Chénier"
+__email__ = "chenier.felix@uqam.ca"
+__license__ = "Apache 2.0"
+
+
+import warnings
+
+import numpy as np
+
+import kineticstoolkit as ktk
+
+
+def _create_test_ts():
+    """Create a noisy TimeSeries with missing samples and cycles."""
+    rng = np.random.default_rng(0)
+    ts = ktk.TimeSeries(time=np.arange(0, 10, 0.01))
+    ts.data["signal"] = np.sin(2 * np.pi * ts.time) + 0.1 * rng.random(1000)
+    ts.data["signal"][[100, 101, 500]] = np.nan
+    for time in range(10):
+        ts = ts.add_event(time, "cycle")
+    return ts
+
+
+def test_run():
+    """Test that the pipeline gives the same result as the steps."""
+    ts = _create_test_ts()
+    original = ts.copy()
+
+    pipeline = (
+        ktk.Pipeline(ts)
+        .fill(3)
+        .filter(ktk.filters.Filter("smooth", window_length=5))
+        .resample(50.0)
+        .normalize("cycle", "cycle", n_points=50)
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = pipeline.run()
+
+        expected = ts.fill_missing_samples(3)
+        expected = ktk.filters.smooth(expected, window_length=5)
+        expected = expected.resample(50.0)
+        expected = ktk.cycles.time_normalize(
+            expected, "cycle", "cycle", n_points=50
+        )
+
+    assert result == expected
+    assert ts == original  # The input is not modified
+
+
+def test_fusion():
+    """Test that compatible steps are fused."""
+    ts = _create_test_ts()
+
+    # Identical fill steps
+    pipeline = ktk.Pipeline(ts).fill(2).fill(2)
+    assert len(pipeline._plan()) == 1
+    assert pipeline.explain() == (
+        "1. fill(max_missing_samples=2, method='linear')\n"
+        "   + fill(max_missing_samples=2, method='linear')"
+    )
+    assert pipeline.run() == ts.fill_missing_samples(2)
+
+    # Fill steps with different parameters are executed one after another
+    for pipeline, expected in [
+        (
+            ktk.Pipeline(ts).fill(1).fill(0),
+            ts.fill_missing_samples(1).fill_missing_samples(0),
+        ),
+        (
+            ktk.Pipeline(ts).fill(1, method="nearest").fill(2),
+            ts.fill_missing_samples(1, method="nearest").fill_missing_samples(
+                2
+            ),
+        ),
+    ]:
+        assert len(pipeline._plan()) == 2
+        assert "+" not in pipeline.explain()
+        assert pipeline.run() == expected
+
+    # Butterworth filters in forward mode give the same result as a cascade
+    pipeline = (
+        ktk.Pipeline(ts)
+        .fill()
+        .butter(10.0, filtfilt=False)
+        .butter(0.5, btype="highpass", filtfilt=False)
+    )
+    assert len(pipeline._plan()) == 2
+    assert "+ butter(fc=0.5" in pipeline.explain()
+    result = pipeline.run()
+    expected = ktk.filters.butter(
+        ts.fill_missing_samples(0), 10.0, filtfilt=False
+    )
+    expected = ktk.filters.butter(
+        expected, 0.5, btype="highpass", filtfilt=False
+    )
+    assert np.allclose(result.data["signal"], expected.data["signal"])
+
+    # Not fused if filtfilt differs
+    pipeline = ktk.Pipeline(ts).butter(10.0).butter(20.0, filtfilt=False)
+    assert len(pipeline._plan()) == 2
+
+    # Pipelines can branch
+    base = ktk.Pipeline(ts).fill()
+    lowpass = base.butter(10.0)
+    assert len(base._steps) == 1
+    assert len(lowpass._steps) == 2
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
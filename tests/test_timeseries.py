@@ -19,11 +19,13 @@ __copyright__ = "Copyright (C) 2020-2024 Félix Chénier"
 __email__ = "chenier.felix@uqam.ca"
 __license__ = "Apache 2.0"
 """These are the unit tests for the TimeSeries class."""
+import pickle
 import warnings
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import pytest
 
 import kineticstoolkit as ktk
 from kineticstoolkit.exceptions import (
@@ -445,6 +447,40 @@ def test_from_to_dataframe():
     assert ts.data["Data0"].shape == (0,)
     assert ts.data["Data1"].shape == (0, 2, 2)
 
+    # to_dataframe with mixed dtypes, with and without copies
+    ts = ktk.TimeSeries(time=np.arange(3) / 10)
+    ts = ts.add_data("Float", np.arange(12.0).reshape(3, 2, 2))
+    ts = ts.add_data("Int", np.arange(3))
+    ts = ts.add_info("Float", "Unit", "m")
+    for copy in [True, False]:
+        df, info = ts._to_dataframe_and_info(copy)
+        assert list(df.columns) == [
+            "Float[:,0,0]",
+            "Float[:,0,1]",
+            "Float[:,1,0]",
+            "Float[:,1,1]",
+            "Int",
+        ]
+        assert np.array_equal(df.index, ts.time)
+        assert np.array_equal(df.iloc[:, 0:4], ts.data["Float"].reshape(3, 4))
+        assert df["Int"].dtype == int
+        assert info == [{"Unit": "m"}] * 4 + [{}]
+
+    # Columns that are not in C order, with spaces
+    df = pd.DataFrame(
+        [[3, 1, 2, 0]], columns=["a[1, 1]", "a[0,1]", "a[ 1,0]", "a[0,0]"]
+    )
+    ts = ktk.TimeSeries.from_dataframe(df)
+    assert np.array_equal(ts.data["a"], [[[0, 1], [2, 3]]])
+
+    # Incomplete multidimensional data
+    df = pd.DataFrame([[0, 1, 2]], columns=["a[0,0]", "a[0,1]", "a[1,0]"])
+    try:
+        ktk.TimeSeries.from_dataframe(df)
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
     # # This test should pass after solving issue #59
     # df2 = ts.to_dataframe()
     # assert np.all(df == df2)
@@ -481,6 +517,75 @@ def test_from_to_dataframe():
 #     assert np.all(df == df2)
 
 
+def test_from_dataframe_many_columns():
+    """Round-trip a wide DataFrame, as exported by lab systems."""
+    rng = np.random.default_rng(0)
+    ts = ktk.TimeSeries(time=np.arange(200) / 100)
+    for i_key in range(625):
+        ts.add_data(f"Frame{i_key}", rng.random((200, 4, 4)), in_place=True)
+    ts.add_data("Forces", rng.random((200, 3)), in_place=True)
+    ts.add_data("Count", np.arange(200), in_place=True)
+
+    df = ts.to_dataframe()
+    assert df.shape == (200, 10004)
+
+    ts2 = ktk.TimeSeries.from_dataframe(df)
+    assert ts2 == ts
+    assert list(ts2.data) == list(ts.data)
+    assert ts2.data["Count"].dtype == ts.data["Count"].dtype
+
+    # Shuffled columns
+    ts2 = ktk.TimeSeries.from_dataframe(df[rng.permutation(df.columns)])
+    assert ts2 == ts
+
+    # Duplicated or missing indexes
+    for columns in [
+        ["Force[0]", "Force[0]", "Force[2]"],
+        ["Force[:,0]", "Force[0]", "Force[2]"],
+        ["Force[0]", "Force[2]"],
+    ]:
+        df = pd.DataFrame(np.zeros((2, len(columns))), columns=columns)
+        with pytest.raises(ValueError):
+            ktk.TimeSeries.from_dataframe(df)
+
+
+def test_to_from_arrow():
+    pa = pytest.importorskip("pyarrow")
+    ts = ktk.TimeSeries(time=np.arange(10) / 10)
+    ts = ts.add_data("Frames", np.random.rand(10, 4, 4))
+    ts = ts.add_data("Signal", np.random.rand(10))
+    ts = ts.add_data("Labels", np.array(["a", "b"] * 5))
+    ts = ts.add_info("Frames", "Unit", "m")
+    ts = ts.add_info("Other", "Value", 2)
+    ts = ts.add_events([0.5, 0.1], ["event1", "event2"])
+
+    table = ts.to_arrow()
+    assert table.column_names == ["time", "Frames", "Signal", "Labels"]
+    assert table.schema.field("Frames").type == pa.list_(
+        pa.list_(pa.float64(), 4), 4
+    )
+    # No copy for numeric data
+    values = table.column("Frames").chunk(0).flatten().flatten()
+    assert np.shares_memory(values.to_numpy(), ts.data["Frames"])
+
+    ts2 = ktk.TimeSeries.from_arrow(table)
+    assert np.array_equal(ts2.data["Labels"], ts.data["Labels"])
+    assert ts2.remove_data("Labels") == ts.remove_data("Labels")
+
+    # Column selection
+    ts2 = ktk.TimeSeries.from_arrow(table.select(["time", "Signal"]))
+    assert list(ts2.data) == ["Signal"]
+    assert "Frames" not in ts2.info
+    assert ts2.info["Other"] == {"Value": 2}
+
+    # Reserved key
+    try:
+        ts.add_data("time", ts.time).to_arrow()
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+
 def test_from_array():
     # From array
     ts = ktk.TimeSeries.from_array(
@@ -943,6 +1048,163 @@ def test_get_event_indexes_count_index_time():
         pass
 
 
+def test_event_index():
+    """Test that event queries follow any modification of the events."""
+    ts = ktk.TimeSeries(time=np.arange(100) / 10)
+    for i in range(10):
+        ts = ts.add_event(i, "even" if i % 2 == 0 else "odd", in_place=True)
+    assert ts._get_event_indexes("even") == [0, 2, 4, 6, 8]
+
+    # Modify an event directly
+    ts.events[0].time = 9.5
+    assert ts._get_event_indexes("even") == [1, 3, 5, 7, 9]
+    assert ts.events[-1].time == 9.5
+    ts.events[0].name = "even"
+    assert ts.count_events("even") == 6
+    assert ts.count_events("odd") == 4
+
+    # Use the list methods
+    ts.events.pop(0)
+    assert ts.count_events("even") == 5
+    ts.events += [ktk.TimeSeriesEvent(0.5, "odd")]
+    assert ts._get_event_indexes("odd") == [0, 2, 4, 6, 8]
+    del ts.events[0]
+    assert ts._get_event_indexes("odd") == [1, 3, 5, 7]
+
+    # Copies keep the same events
+    ts2 = ts.copy()
+    assert ts2._get_event_indexes("odd") == [1, 3, 5, 7]
+    ts2.events[1].name = "other"
+    assert ts._get_event_indexes("odd") == [1, 3, 5, 7]
+    assert ts2._get_event_indexes("odd") == [3, 5, 7]
+
+    # Successions of close events: only the events close to the first event
+    # of the succession are duplicates.
+    ts = ktk.TimeSeries()
+    ts = ts.add_event(0.0, "event")
+    ts = ts.add_event(6e-9, "event")
+    ts = ts.add_event(1.2e-8, "event")
+    ts = ts.add_event(1.8e-8, "event")
+    assert ts._get_duplicate_event_indexes() == [1, 3]
+
+
+def test_find_duplicates():
+    from kineticstoolkit.timeseries.classes import _find_duplicates
+
+    # Groups of name codes, each sorted by time
+    times = np.array([0.0, 0.0, 1.0, 1.0, 6e-9, 1.2e-8, 1.8e-8, 2.0])
+    codes = np.array([0, 0, 0, 1, 2, 2, 2, 2])
+    assert _find_duplicates(times, codes).tolist() == [
+        False,
+        True,  # Same time and name as the first event
+        False,
+        False,  # Same time as the previous event, but another name
+        False,
+        True,  # Close to 6e-9
+        False,  # Close to 1.2e-8, which is a duplicate, but not to 6e-9
+        False,
+    ]
+    assert _find_duplicates(np.array([]), np.array([], dtype=int)).shape == (
+        0,
+    )
+
+
+def test_event_index_class():
+    from kineticstoolkit.timeseries.classes import _EventIndex
+
+    events = [
+        ktk.TimeSeriesEvent(0.0, "a"),
+        ktk.TimeSeriesEvent(1.0, "b"),
+        ktk.TimeSeriesEvent(2.0, "a"),
+    ]
+    index = _EventIndex.build(events)
+    assert index.times.tolist() == [0.0, 1.0, 2.0]
+    assert index.codes.tolist() == [0, 1, 0]
+    assert index.name_codes == {"a": 0, "b": 1}
+
+    # Inserting a new name does not modify the original index
+    inserted = index.inserted(1, 0.5, "c")
+    assert inserted.times.tolist() == [0.0, 0.5, 1.0, 2.0]
+    assert inserted.codes.tolist() == [0, 2, 1, 0]
+    assert inserted.name_codes == {"a": 0, "b": 1, "c": 2}
+    assert index.name_codes == {"a": 0, "b": 1}
+    assert inserted.modifications == index.modifications
+
+    masked = inserted.masked(np.array([True, False, False, True]))
+    assert masked.times.tolist() == [0.0, 2.0]
+    assert masked.codes.tolist() == [0, 0]
+    assert masked.name_codes == inserted.name_codes
+
+    # The index of an event list follows the list
+    ts = ktk.TimeSeries().add_events([2.0, 0.0, 1.0], ["a", "a", "b"])
+    index = ts.events._get_index()
+    assert index.times.tolist() == [0.0, 1.0, 2.0]
+    assert [index.name_codes[event.name] for event in ts.events] == (
+        index.codes.tolist()
+    )
+
+
+def test_event_slots():
+    event = ktk.TimeSeriesEvent(1.5, "".join(["eve", "nt"]))
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.other = 1
+    assert event.name is ktk.TimeSeriesEvent().name  # Interned name
+    assert event == ktk.TimeSeriesEvent(time=1.5, name="event")
+    assert pickle.loads(pickle.dumps(event)) == event
+
+    ts = ktk.TimeSeries().add_events([1.0, 2.0], "event")
+    ts2 = pickle.loads(pickle.dumps(ts))
+    assert ts2.events == ts.events
+    ts2.events[0].time = 3.0
+    assert ts2._get_event_indexes("event") == [0, 1]
+    assert ts2.events[1].time == 3.0
+
+
+def test_add_events():
+    ts = ktk.TimeSeries(time=np.arange(100) / 10)
+    ts = ts.add_event(2.0, "a")
+
+    # Single name for every event
+    ts2 = ts.add_events(np.array([3.0, 1.0]), "b")
+    assert [(e.time, e.name) for e in ts2.events] == [
+        (1.0, "b"),
+        (2.0, "a"),
+        (3.0, "b"),
+    ]
+    assert len(ts.events) == 1  # Not in place
+
+    # One name per event, in place
+    ts2 = ts.copy()
+    ts2.add_events([5.0, 0.5], ["c", "a"], in_place=True)
+    assert ts2._get_event_indexes("a") == [0, 1]
+    assert ts2.events[2].name == "c"
+
+    # Should be identical to adding the events one by one
+    times = np.random.default_rng(0).integers(0, 10, 50) / 2
+    names = ["a" if time % 2 == 0 else "b" for time in times]
+    ts_batch = ts.add_events(times, names)
+    ts_loop = ts.copy()
+    for time, name in zip(times, names, strict=True):
+        ts_loop.add_event(time, name, in_place=True)
+    assert ts_batch.events == ts_loop.events
+
+    # Unique, within the batch and against the existing events
+    ts_batch = ts.add_events(times, names, unique=True)
+    ts_loop = ts.copy()
+    for time, name in zip(times, names, strict=True):
+        ts_loop.add_event(time, name, in_place=True, unique=True)
+    assert ts_batch.events == ts_loop.events
+    assert ts_batch.count_events("a") == 3  # 0.0, 2.0, 4.0
+
+    # Mismatched names
+    try:
+        ts.add_events([1.0, 2.0], ["a"])
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+
 # %% Sample rate, merge, resample
 
 
@@ -1144,6 +1406,121 @@ def test_merge_and_resample():
     assert ts1.info["signal6"]["Unit"] == ts2.info["signal6"]["Unit"]
 
 
+def test_merge_many():
+    ts1 = ktk.TimeSeries(time=np.arange(0.0, 10.0, 0.1))
+    ts1 = ts1.add_data("Markers", np.random.rand(100, 4))
+    ts1 = ts1.add_events([1.0, 2.0], ["a", "b"])
+    ts2 = ktk.TimeSeries(time=np.arange(0.0, 10.0, 0.01))
+    ts2 = ts2.add_data("Forces", np.random.rand(1000, 4))
+    ts2 = ts2.add_info("Forces", "Unit", "N")
+    ts2 = ts2.add_events([1.0, 3.0], ["a", "c"])
+    ts3 = ktk.TimeSeries(time=np.arange(0.0, 10.0, 0.001))
+    ts3 = ts3.add_data("EMG", np.random.rand(10000))
+    ts3 = ts3.add_data("Markers", np.random.rand(10000, 4))
+    ts3 = ts3.add_events([3.0, 4.0], ["c", "d"])
+
+    # Same result as chained merges, with the same conflict resolution
+    expected = ts1.merge(ts2, resample=True).merge(
+        ts3, resample=True, on_conflict="mute"
+    )
+    ts = ktk.TimeSeries.merge_many(
+        [ts1, ts2, ts3], resample=True, on_conflict="mute"
+    )
+    assert ts._is_equivalent(expected)
+    assert len(ts.events) == 4
+    assert np.all(ts.data["Markers"] == ts1.data["Markers"])
+
+    with pytest.warns(UserWarning):
+        ktk.TimeSeries.merge_many([ts1, ts2, ts3], resample=True)
+    with pytest.raises(ktk.exceptions.TimeSeriesMergeConflictError):
+        ktk.TimeSeries.merge_many(
+            [ts1, ts2, ts3], resample=True, on_conflict="error"
+        )
+    with pytest.raises(ValueError):
+        ktk.TimeSeries.merge_many([ts1, ts2])
+
+    # The inputs are not modified
+    ts.data["Markers"][:] = 0
+    assert not np.all(ts1.data["Markers"] == 0)
+    assert ktk.TimeSeries.merge_many([])._is_equivalent(ktk.TimeSeries())
+
+
+def test_concatenate():
+    ts1 = ktk.TimeSeries(time=np.arange(0.0, 1.0, 0.1))
+    ts1 = ts1.add_data("Points", np.random.rand(10, 4))
+    ts1 = ts1.add_data("Labels", np.arange(10))
+    ts1 = ts1.add_events([0.2, 0.5], ["a", "b"])
+    ts2 = ktk.TimeSeries(time=np.arange(0.0, 0.5, 0.1))
+    ts2 = ts2.add_data("Points", np.random.rand(5, 4))
+    ts2 = ts2.add_data("Labels", np.arange(5))
+    ts2 = ts2.add_events([0.0, 0.2], ["a", "c"])
+
+    # Same as stacking the arrays, with shifted time and events
+    ts = ktk.TimeSeries.concatenate([ts1, ts2], shift=True)
+    assert np.allclose(ts.time, np.arange(0.0, 1.5, 0.1))
+    assert np.all(
+        ts.data["Points"]
+        == np.concatenate([ts1.data["Points"], ts2.data["Points"]])
+    )
+    assert ts.data["Labels"].dtype == ts1.data["Labels"].dtype
+    assert np.allclose(
+        [event.time for event in ts.events], [0.2, 0.5, 1.0, 1.2]
+    )
+    assert [event.name for event in ts.events] == ["a", "b", "a", "c"]
+
+    # Non-contiguous blocks, with and without gap filling
+    ts3 = ts2.shift(2.0)
+    ts = ktk.TimeSeries.concatenate([ts1, ts3])
+    assert np.allclose(ts.time, np.concatenate([ts1.time, ts3.time]))
+    ts = ktk.TimeSeries.concatenate([ts1, ts3], fill_gaps=True)
+    assert np.allclose(ts.time, np.arange(0.0, 2.5, 0.1))
+    assert np.all(ts.isnan("Points")[10:20])
+    assert not np.any(ts.isnan("Points")[0:10])
+    assert not np.any(ts.isnan("Points")[20:])
+
+    # Errors
+    with pytest.raises(ValueError):
+        ktk.TimeSeries.concatenate([ts1, ts2])  # Overlapping times
+    with pytest.raises(ValueError):
+        ktk.TimeSeries.concatenate([ts1, ts2.remove_data("Labels")])
+    with pytest.raises(ValueError):
+        ktk.TimeSeries.concatenate([ts1, ts2.resample(20.0)], shift=True)
+    with pytest.raises(ValueError):
+        ktk.TimeSeries.concatenate([])
+
+
+def test_merge_does_not_modify_source():
+    ts1 = ktk.TimeSeries(time=np.arange(0.0, 10.0, 0.1))
+    ts2 = ktk.TimeSeries(time=np.arange(-1.0, 12.0, 0.13))
+    ts2 = ts2.add_data("Points", np.random.rand(ts2.time.shape[0], 4))
+    ts2 = ts2.add_data("Frames", np.random.rand(ts2.time.shape[0], 4, 4))
+    ts2 = ts2.add_data("Missing", np.random.rand(ts2.time.shape[0]))
+    ts2.data["Missing"][10:20] = np.nan
+    ts2 = ts2.add_info("Points", "Unit", "m")
+    ts2 = ts2.add_events([1.0, 2.0, 2.0], ["a", "b", "b"])
+    ts1 = ts1.add_events([1.0], ["a"])
+    ts2_copy = ts2.copy()
+
+    # The data are resampled by batch, with the same result as resample
+    ts3 = ts1.merge(ts2, resample=True)
+    expected = ts2.resample(ts1.time)
+    for key in ts2.data:
+        assert ts3.data[key].shape == expected.data[key].shape
+        assert np.allclose(ts3.data[key], expected.data[key], equal_nan=True)
+    assert ts3.events == [
+        ktk.TimeSeriesEvent(1.0, "a"),
+        ktk.TimeSeriesEvent(2.0, "b"),
+    ]
+
+    # The source TimeSeries is not modified nor shared
+    assert ts2._is_equivalent(ts2_copy, equal=False)
+    ts3 = ts1.merge(ts2.resample(ts1.time))
+    ts3.data["Points"][:] = 0
+    ts3.info["Points"]["Unit"] = "mm"
+    assert ts2.info["Points"]["Unit"] == "m"
+    assert not np.any(ts2.data["Points"] == 0)
+
+
 def test_resample_using_frequency():
     """Test resample using a frequency instead of a new time."""
     ts1 = ktk.TimeSeries()
@@ -1209,6 +1586,33 @@ def test_resample_no_extrapolation():
     assert np.allclose(ts1.data["data"][2:12], (np.arange(2, 12) / 5) ** 2)
 
 
+def test_isnan_and_nan_mask():
+    ts = ktk.TimeSeries(time=np.arange(5))
+    ts = ts.add_data("Frames", np.zeros((5, 4, 4)))
+    ts = ts.add_data("Points", np.zeros((5, 4)))
+    ts = ts.add_data("Labels", np.arange(5))
+    ts.data["Frames"][1, 2, 3] = np.nan
+    ts.data["Points"][2] = [np.inf, -np.inf, 0.0, 1.0]  # Not missing
+    ts.data["Points"][3, 0] = np.nan
+
+    assert np.all(ts.isnan("Frames") == [False, True, False, False, False])
+    assert np.all(ts.isnan("Points") == [False, False, False, True, False])
+    assert not np.any(ts.isnan("Labels"))
+
+    mask = ts.nan_mask()
+    assert mask.shape == (5, 3)
+    for i_key, key in enumerate(ts.data):
+        assert np.all(mask[:, i_key] == ts.isnan(key))
+    assert np.all(ts.nan_mask(["Points"])[:, 0] == ts.isnan("Points"))
+    assert np.all(ts.nan_mask("Points")[:, 0] == ts.isnan("Points"))
+
+    # The masks are recomputed after data modification
+    ts.data["Points"][4, 1] = np.nan
+    assert ts.isnan("Points")[4]
+    assert ts.nan_mask()[4, 1]
+    assert np.all(ktk.geometry.isnan(ts.data["Frames"]) == ts.isnan("Frames"))
+
+
 def test_fill_missing_samples():
     ts = ktk.TimeSeries(np.arange(10))
 
@@ -1504,6 +1908,53 @@ def test_get_ts_between_indexes():
         pass
 
 
+def test_get_ts_copy():
+    ts = ktk.TimeSeries(time=np.arange(10) / 10)
+    ts = ts.add_data("Data", np.arange(20).reshape(10, 2))
+    ts = ts.add_event(0.5, "event")
+    ts = ts.add_event(0.8, "other")
+    ts = ts.add_info("Data", "Unit", "m")
+
+    # Copy (default)
+    subts = ts.get_ts_between_indexes(2, 5)
+    assert not np.shares_memory(subts.time, ts.time)
+    assert not np.shares_memory(subts.data["Data"], ts.data["Data"])
+    subts.data["Data"][0, 0] = -1
+    assert ts.data["Data"][3, 0] == 6
+
+    # Views
+    subts = ts.get_ts_between_indexes(2, 5, copy=False)
+    assert np.array_equal(subts.time, [0.3, 0.4])
+    assert np.array_equal(subts.data["Data"], [[6, 7], [8, 9]])
+    assert np.shares_memory(subts.time, ts.time)
+    assert np.shares_memory(subts.data["Data"], ts.data["Data"])
+    assert subts.events == ts.events
+    assert subts.info == ts.info
+    subts.data["Data"][0, 0] = -1
+    assert ts.data["Data"][3, 0] == -1
+
+    # The containers are not shared
+    subts = subts.add_data("Other", np.zeros(2), in_place=True)
+    subts = subts.add_event(0.2, "new", in_place=True)
+    subts = subts.add_info("Data", "Unit", "mm", overwrite=True, in_place=True)
+    assert "Other" not in ts.data
+    assert ts.count_events("new") == 0
+    assert ts.info["Data"]["Unit"] == "m"
+
+    # Every get_ts method supports views
+    for subts in [
+        ts.get_ts_before_index(5, copy=False),
+        ts.get_ts_after_index(5, copy=False),
+        ts.get_ts_before_time(0.5, copy=False),
+        ts.get_ts_after_time(0.5, copy=False),
+        ts.get_ts_between_times(0.2, 0.5, copy=False),
+        ts.get_ts_before_event("event", copy=False),
+        ts.get_ts_after_event("event", copy=False),
+        ts.get_ts_between_events("event", "other", copy=False),
+    ]:
+        assert np.shares_memory(subts.data["Data"], ts.data["Data"])
+
+
 # %% get_ts using time(s)
 
 
@@ -1733,6 +2184,76 @@ def test_get_ts_between_events():
         pass
 
 
+# %% Windows
+
+
+def test_iter_windows():
+    ts = ktk.TimeSeries(time=np.arange(100) / 10)
+    ts = ts.add_data("Data", np.arange(200).reshape(100, 2))
+    ts = ts.add_events([1.05, 2.0, 4.55, 9.5], "cycle")
+
+    # By time, compared to get_ts_between_times
+    windows = list(ts.iter_windows(2.5, 1.0))
+    assert len(windows) == 8  # Last window begins at 7.0
+    for i_window, window in enumerate(windows):
+        expected = ts.get_ts_between_times(
+            float(i_window), i_window + 2.5, inclusive=(True, False)
+        )
+        assert window == expected
+        assert np.shares_memory(window.data["Data"], ts.data["Data"])
+
+    # By index, with copies
+    windows = list(ts.iter_windows(30, by="index", copy=True))
+    assert len(windows) == 3
+    assert np.array_equal(windows[2].data["Data"], ts.data["Data"][60:90])
+    assert not np.shares_memory(windows[2].data["Data"], ts.data["Data"])
+
+    # By event
+    windows = list(ts.iter_windows(by="event", event_name="cycle"))
+    assert len(windows) == 3
+    assert np.allclose(windows[0].time, np.arange(11, 20) / 10)
+    assert windows[2] == ts.get_ts_between_times(
+        4.55, 9.5, inclusive=(True, False)
+    )
+
+    # Errors are raised on the call, not on the iteration
+    try:
+        ts.iter_windows(by="event")
+        raise AssertionError("This should fail.")
+    except TypeError:
+        pass
+    try:
+        ts.iter_windows(1.0, by="event", event_name="cycle")
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+    try:
+        ts.iter_windows(1.0, by="index")
+        raise AssertionError("This should fail.")
+    except TypeError:
+        pass
+
+
+def test_get_sliding_windows():
+    ts = ktk.TimeSeries(time=np.arange(10))
+    ts = ts.add_data("Data", np.arange(40).reshape(10, 2, 2))
+    windows = ts.get_sliding_windows("Data", 4, step=3)
+    assert windows.shape == (3, 4, 2, 2)
+    for i_window in range(3):
+        assert np.array_equal(
+            windows[i_window],
+            ts.data["Data"][3 * i_window : 3 * i_window + 4],
+        )
+    assert np.shares_memory(windows, ts.data["Data"])
+    assert not windows.flags.writeable
+
+    try:
+        ts.get_sliding_windows("Data", 11)
+        raise AssertionError("This should fail.")
+    except ValueError:
+        pass
+
+
 # %% plot
 
 
@@ -20,9 +20,13 @@ __copyright__ = "Copyright (C) 2020-2024 Félix Chénier"
 __email__ = "chenier.felix@uqam.ca"
 __license__ = "Apache 2.0"
 
+import time
+
 import numpy as np
 import pandas as pd
+import pytest
 
+import kineticstoolkit as ktk
 from kineticstoolkit import TimeSeries, TimeSeriesEvent
 from kineticstoolkit.typing_ import check_param
 
@@ -132,6 +136,61 @@ def test_check_param():
     except TypeError:
         pass
 
+    # Numpy scalars and tuples containing mapped types
+    check_param("test", np.float64(1.0), float)
+    check_param("test", np.int32(1), (float, None))
+    check_param("test", None, (float, None))
+    try:
+        check_param("test", "a", (float, None))
+        raise Exception("This should fail.")
+    except TypeError:
+        pass
+
+
+def test_check_param_validation_levels():
+    ktk.config.validation = "fast"
+    try:
+        # Only the type is checked
+        check_param("test", [1, 2, "a"], list, length=2, contents_type=int)
+        try:
+            check_param("test", "a", int)
+            raise Exception("This should fail.")
+        except TypeError:
+            pass
+
+        ktk.config.validation = "off"
+        check_param("test", "a", int)
+        check_param("test", [1, 2, 3], list, length=2)
+    finally:
+        ktk.config.validation = "full"
+
+    # Full validation rejects the values accepted above
+    with pytest.raises(TypeError):
+        check_param("test", "a", int)
+    with pytest.raises(ValueError):
+        check_param("test", [1, 2, 3], list, length=2)
+
+
+@pytest.mark.benchmark
+def test_check_param_overhead():
+    # Micro-benchmark of the overhead of check_param per call, for each
+    # validation level. Excluded from the default run since it depends on
+    # the load of the machine; run it with pytest -m benchmark.
+    n_calls = 100_000
+    durations = {}
+    for validation in ["full", "fast", "off"]:
+        ktk.config.validation = validation
+        try:
+            tic = time.perf_counter()
+            for _ in range(n_calls):
+                check_param("test", 1.0, float)
+                check_param("test", "a", str, expected_values=["a", "b"])
+            durations[validation] = (time.perf_counter() - tic) / n_calls / 2
+        finally:
+            ktk.config.validation = "full"
+
+    assert durations["off"] < durations["full"]
+
 
 if __name__ == "__main__":
     import pytest